@@ -1,4 +1,6 @@
 from logging.config import fileConfig
+from pathlib import Path
+import sys
 
 from sqlalchemy import engine_from_config, pool
 
@@ -17,15 +19,21 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
-from backend.core_service.app.models.models import (
-    Accounts,
-    Events,
-    Tickets,
-    TicketTypes,
-)
-from backend.core_service.app.models.session import BaseModel
+# модели импортируются так же, как в приложении (см. main.py)
+sys.path.append(str(Path(__file__).parent.parent / "backend" / "core_service" / "app"))
+
+from models.models import Accounts, Events, Tickets, TicketTypes
+from models.session import DATABASE_URL, DBBaseModel
 
-target_metadata = BaseModel.metadata
+target_metadata = DBBaseModel.metadata
+
+# миграции идут синхронно: тот же URL, что у приложения, но с sync драйвером
+config.set_main_option(
+    "sqlalchemy.url",
+    DATABASE_URL.set(drivername=DATABASE_URL.get_backend_name())
+    .render_as_string(hide_password=False)
+    .replace("%", "%%"),
+)
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
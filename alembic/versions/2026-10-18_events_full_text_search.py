@@ -0,0 +1,96 @@
+"""events_full_text_search
+
+Revision ID: e7f15a2c9d40
+Revises: c4a09f3e7b12
+Create Date: 2026-10-18 20:26:13.117342
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7f15a2c9d40"
+down_revision: Union[str, None] = "c4a09f3e7b12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# копия models/search.py на момент миграции
+SQLITE_UPGRADE: list[str] = [
+    """
+    CREATE VIRTUAL TABLE events_fts USING fts5(
+        title, description, address,
+        content='events', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER events_fts_ai AFTER INSERT ON events BEGIN
+        INSERT INTO events_fts(rowid, title, description, address)
+        VALUES (new.id, new.title, new.description, new.address);
+    END
+    """,
+    """
+    CREATE TRIGGER events_fts_ad AFTER DELETE ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, title, description, address)
+        VALUES ('delete', old.id, old.title, old.description, old.address);
+    END
+    """,
+    """
+    CREATE TRIGGER events_fts_au
+    AFTER UPDATE OF title, description, address ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, title, description, address)
+        VALUES ('delete', old.id, old.title, old.description, old.address);
+        INSERT INTO events_fts(rowid, title, description, address)
+        VALUES (new.id, new.title, new.description, new.address);
+    END
+    """,
+    # индекс для уже существующих мероприятий
+    "INSERT INTO events_fts(events_fts) VALUES ('rebuild')",
+]
+SQLITE_DOWNGRADE: list[str] = [
+    "DROP TRIGGER events_fts_au",
+    "DROP TRIGGER events_fts_ad",
+    "DROP TRIGGER events_fts_ai",
+    "DROP TABLE events_fts",
+]
+
+POSTGRES_UPGRADE: list[str] = [
+    # генерируемая колонка заполняется и для существующих строк
+    """
+    ALTER TABLE events ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('russian', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('russian', coalesce(description, '')), 'B')
+        || setweight(to_tsvector('russian', coalesce(address, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX ix_events_search_vector ON events USING GIN (search_vector)",
+]
+POSTGRES_DOWNGRADE: list[str] = [
+    "DROP INDEX ix_events_search_vector",
+    "ALTER TABLE events DROP COLUMN search_vector",
+]
+
+
+UPGRADE: dict[str, list[str]] = {
+    "sqlite": SQLITE_UPGRADE,
+    "postgresql": POSTGRES_UPGRADE,
+}
+DOWNGRADE: dict[str, list[str]] = {
+    "sqlite": SQLITE_DOWNGRADE,
+    "postgresql": POSTGRES_DOWNGRADE,
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for statement in UPGRADE.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in DOWNGRADE.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
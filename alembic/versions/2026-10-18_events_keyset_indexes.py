@@ -0,0 +1,37 @@
+"""events_keyset_indexes
+
+Revision ID: c4a09f3e7b12
+Revises: 5b71e0c9a3d8
+Create Date: 2026-10-18 19:12:55.804613
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a09f3e7b12"
+down_revision: Union[str, None] = "5b71e0c9a3d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (имя, колонки) индексов списка мероприятий
+INDEXES: list[tuple[str, list[str]]] = [
+    ("ix_events_datetime_id", ["datetime", "id"]),
+    ("ix_events_status_datetime_id", ["status", "datetime", "id"]),
+    ("ix_events_category_datetime_id", ["category", "datetime", "id"]),
+    ("ix_events_creator_datetime_id", ["creator_id", "datetime", "id"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, columns in INDEXES:
+        op.create_index(name, "events", columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name="events")
@@ -0,0 +1,39 @@
+"""ticket_types_sold_count
+
+Revision ID: 3f9c1a7d52e4
+Revises: bc72b805fff7
+Create Date: 2026-10-18 12:04:51.318207
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c1a7d52e4"
+down_revision: Union[str, None] = "bc72b805fff7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "ticket_types",
+        sa.Column("sold_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    # счетчик для уже проданных билетов
+    op.execute(
+        "UPDATE ticket_types SET sold_count = ("
+        "SELECT COUNT(*) FROM tickets WHERE tickets.ticket_type_id = ticket_types.id"
+        ")"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("ticket_types") as batch_op:
+        batch_op.drop_column("sold_count")
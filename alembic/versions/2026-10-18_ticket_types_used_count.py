@@ -0,0 +1,44 @@
+"""ticket_types_used_count
+
+Revision ID: 5b71e0c9a3d8
+Revises: 8d2e6b41c0f7
+Create Date: 2026-10-18 17:41:09.226381
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b71e0c9a3d8"
+down_revision: Union[str, None] = "8d2e6b41c0f7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "ticket_types",
+        sa.Column("used_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    # счетчик для уже активированных билетов
+    op.execute(
+        "UPDATE ticket_types SET used_count = ("
+        "SELECT COUNT(*) FROM tickets "
+        "WHERE tickets.ticket_type_id = ticket_types.id AND tickets.is_used"
+        ")"
+    )
+    op.create_index(
+        op.f("ix_ticket_types_event_id"), "ticket_types", ["event_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_ticket_types_event_id"), table_name="ticket_types")
+    with op.batch_alter_table("ticket_types") as batch_op:
+        batch_op.drop_column("used_count")
@@ -0,0 +1,35 @@
+"""tickets_stats_index
+
+Revision ID: 8d2e6b41c0f7
+Revises: 3f9c1a7d52e4
+Create Date: 2026-10-18 16:02:37.540118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2e6b41c0f7"
+down_revision: Union[str, None] = "3f9c1a7d52e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_tickets_event_used_type",
+        "tickets",
+        ["event_id", "is_used", "ticket_type_id"],
+        unique=False,
+    )
+    # event_id - префикс нового индекса
+    op.drop_index(op.f("ix_tickets_event_id"), table_name="tickets")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_tickets_event_id"), "tickets", ["event_id"], unique=False)
+    op.drop_index("ix_tickets_event_used_type", table_name="tickets")
@@ -0,0 +1,96 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Cookie, Depends, Path, status
+from fastapi_limiter.depends import RateLimiter
+
+from core.config import config
+from dependencies.injection_app import get_admission_store, get_ticket_code_filter
+from infrastructure.admission.store import AdmissionStore
+from infrastructure.prefilter.ticket_codes import BloomFilter
+from schemas import (
+    CacheStatsResponseDTO,
+    ManagementAdminProtocol,
+    QueueConfigDTO,
+    TicketCodeFilterStatsResponseDTO,
+)
+from services import get_admin_service
+
+router = APIRouter()
+
+
+@router.get(
+    "/cache",
+    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    summary="Статистика кеша",
+    description="ИНФО: Статистика ICache по unique_name (ключи, память, hit/miss). Только для администраторов.",
+    status_code=status.HTTP_200_OK,
+)
+async def cache_stats(
+    jwt_token: Annotated[
+        str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
+    ],
+    service: Annotated[ManagementAdminProtocol, Depends(get_admin_service)],
+) -> CacheStatsResponseDTO:
+    return await service.cache_stats(jwt_token)
+
+
+@router.get(
+    "/ticket-code-filter",
+    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    summary="Статистика префильтра кодов билетов",
+    description="ИНФО: Память и доля ложных срабатываний Bloom filter кодов билетов старого формата (воркер, обработавший запрос). Только для администраторов.",
+    status_code=status.HTTP_200_OK,
+)
+async def ticket_code_filter_stats(
+    jwt_token: Annotated[
+        str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
+    ],
+    code_filter: Annotated[BloomFilter, Depends(get_ticket_code_filter)],
+    service: Annotated[ManagementAdminProtocol, Depends(get_admin_service)],
+) -> TicketCodeFilterStatsResponseDTO:
+    return await service.ticket_code_filter_stats(jwt_token, code_filter)
+
+
+@router.put(
+    "/queue/{event_id}",
+    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    summary="Включение очереди на мероприятие",
+    description="ИНФО: Покупка билетов и список типов билета только по пропуску из очереди (/queue). Принимает rate (пропусков в секунду), burst. Только для администраторов.",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def configure_queue(
+    event_id: Annotated[
+        int, Path(..., description="ID мероприятия", ge=1, le=config.MAX_ID)
+    ],
+    queue_data: Annotated[
+        QueueConfigDTO, Body(..., description="Скорость и запас пропусков")
+    ],
+    jwt_token: Annotated[
+        str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
+    ],
+    store: Annotated[AdmissionStore, Depends(get_admission_store)],
+    service: Annotated[ManagementAdminProtocol, Depends(get_admin_service)],
+) -> None:
+    await service.configure_queue(event_id, queue_data, jwt_token, store)
+    return
+
+
+@router.delete(
+    "/queue/{event_id}",
+    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    summary="Выключение очереди на мероприятие",
+    description="ИНФО: Выключение очереди, ожидающие и допущенные сбрасываются. Только для администраторов.",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def disable_queue(
+    event_id: Annotated[
+        int, Path(..., description="ID мероприятия", ge=1, le=config.MAX_ID)
+    ],
+    jwt_token: Annotated[
+        str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
+    ],
+    store: Annotated[AdmissionStore, Depends(get_admission_store)],
+    service: Annotated[ManagementAdminProtocol, Depends(get_admin_service)],
+) -> None:
+    await service.disable_queue(event_id, jwt_token, store)
+    return
@@ -4,15 +4,16 @@ from fastapi import APIRouter, Body, Cookie, Depends, File, Path, UploadFile, st
 from fastapi_limiter.depends import RateLimiter
 
 from core.config import config
-from dependencies.injection_app import get_rabbit_producer
 from infrastructure.cache.cache_v2 import ICache, IClearCache, IParam
-from infrastructure.messaging.producer import RabbitProducer
 from schemas import (
-    AllElementsResponseDTO,
     CreateEventDTO,
     CreateEventResponseDTO,
     EditEventDTO,
     EditEventResponseDTO,
+    EventsFilterDTO,
+    EventsPageResponseDTO,
+    EventsSearchDTO,
+    EventsSearchResponseDTO,
     ManagementEventsProtocol,
 )
 from security.jwt import token_verification
@@ -26,22 +27,50 @@ router = APIRouter()
 @router.get(
     "",
     dependencies=[Depends(RateLimiter(times=10, seconds=60))],
-    summary="Список всех мероприятий",
-    description="ИНФО: Ручка для получения списка всех мероприятий.",
+    summary="Список мероприятий",
+    description="ИНФО: Ручка для получения страницы мероприятий (новые первыми). Фильтры: status, category, creator_id, date_from, date_to. Следующая страница - cursor=next_cursor.",
     status_code=status.HTTP_200_OK,
 )
 @ICache(
     unique_name="event-cache",
     tags=["event-cache-1"],
     functions=[IParam(token_verification, "jwt_token")],
+    data=["filters"],
+    local_ttl=60,
+    stale_ttl=30,
 )
 async def list_events(
     jwt_token: Annotated[
         str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
     ],  # TODO: сделать DI
+    filters: Annotated[EventsFilterDTO, Depends(EventsFilterDTO.validate_query)],
     service: Annotated[ManagementEventsProtocol, Depends(get_event_service)],
-) -> list[AllElementsResponseDTO]:
-    return await service.all_events(jwt_token)
+) -> EventsPageResponseDTO:
+    return await service.all_events(jwt_token, filters)
+
+
+@router.get(
+    "/search",
+    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    summary="Поиск мероприятий",
+    description="ИНФО: Полнотекстовый поиск по названию, описанию и адресу (с учетом словоформ). Лучшие совпадения первыми, страницы - page/next_page.",
+    status_code=status.HTTP_200_OK,
+)
+@ICache(
+    unique_name="event-search",
+    tags=["event-cache-1"],
+    functions=[IParam(token_verification, "jwt_token")],
+    data=["search"],
+    local_ttl=60,
+)
+async def search_events(
+    jwt_token: Annotated[
+        str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
+    ],
+    search: Annotated[EventsSearchDTO, Depends(EventsSearchDTO.validate_query)],
+    service: Annotated[ManagementEventsProtocol, Depends(get_event_service)],
+) -> EventsSearchResponseDTO:
+    return await service.search_events(jwt_token, search)
 
 
 @router.post(
@@ -64,10 +93,9 @@ async def create_event(
         str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
     ],
     event: Annotated[CreateEventDTO, Depends(CreateEventDTO.validate_form)],
-    rabbit_producer: Annotated[RabbitProducer, Depends(get_rabbit_producer)],
     service: Annotated[ManagementEventsProtocol, Depends(get_event_service)],
 ) -> CreateEventResponseDTO:
-    return await service.create_events(jwt_token, event, rabbit_producer, file)
+    return await service.create_events(jwt_token, event, file)
 
 
 @router.patch(
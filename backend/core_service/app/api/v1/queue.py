@@ -0,0 +1,63 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Cookie, Depends, Header, Path, status
+from fastapi_limiter.depends import RateLimiter
+
+from core.config import config
+from dependencies.injection_app import get_admission_store
+from infrastructure.admission.store import AdmissionStore
+from schemas import (
+    ManagementWaitingRoomProtocol,
+    QueueJoinResponseDTO,
+    QueueStatusResponseDTO,
+)
+from services import get_waiting_room_service
+
+router = APIRouter()
+
+
+@router.post(
+    "/{event_id}",
+    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    summary="Вход в очередь мероприятия",
+    description="ИНФО: Выдает пропуск очереди (заголовок X-Queue-Token для покупки билетов) и место в очереди. Повторный вход место не сбрасывает.",
+    status_code=status.HTTP_200_OK,
+)
+async def join_queue(
+    event_id: Annotated[
+        int, Path(..., description="ID мероприятия", ge=1, le=config.MAX_ID)
+    ],
+    jwt_token: Annotated[
+        str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
+    ],
+    store: Annotated[AdmissionStore, Depends(get_admission_store)],
+    service: Annotated[
+        ManagementWaitingRoomProtocol, Depends(get_waiting_room_service)
+    ],
+) -> QueueJoinResponseDTO:
+    return await service.join(event_id, jwt_token, store)
+
+
+@router.get(
+    "/{event_id}",
+    dependencies=[Depends(RateLimiter(times=60, seconds=60))],
+    summary="Место в очереди мероприятия",
+    description="ИНФО: Место в очереди и оценка ожидания. Принимает пропуск очереди (X-Queue-Token).",
+    status_code=status.HTTP_200_OK,
+)
+async def queue_status(
+    event_id: Annotated[
+        int, Path(..., description="ID мероприятия", ge=1, le=config.MAX_ID)
+    ],
+    queue_token: Annotated[
+        str,
+        Header(
+            ..., alias="X-Queue-Token", description="Пропуск очереди", max_length=1_000
+        ),
+    ],
+    store: Annotated[AdmissionStore, Depends(get_admission_store)],
+    service: Annotated[
+        ManagementWaitingRoomProtocol, Depends(get_waiting_room_service)
+    ],
+) -> QueueStatusResponseDTO:
+    return await service.status(event_id, queue_token, store)
@@ -4,9 +4,8 @@ from fastapi import APIRouter, Body, Cookie, Depends, Path, status
 from fastapi_limiter.depends import RateLimiter
 
 from core.config import config
-from dependencies.injection_app import get_rabbit_producer
+from dependencies.admission import require_admission
 from infrastructure.cache.cache_v2 import ICache, ICacheWriter, IClearCache, IParam
-from infrastructure.messaging.producer import RabbitProducer
 from schemas import (
     CreateTicketTypeDTO,
     CreateTicketTypeResponseDTO,
@@ -23,7 +22,10 @@ router = APIRouter()
 
 @router.get(
     "/{event_id}",
-    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    dependencies=[
+        Depends(RateLimiter(times=10, seconds=60)),
+        Depends(require_admission),
+    ],
     summary="Список типов билета мероприятия",
     description="ИНФО: Список типов билета мероприятия. Принимает только токен.",
     status_code=status.HTTP_200_OK,
@@ -35,6 +37,7 @@ router = APIRouter()
         IParam(token_verification, "jwt_token"),
     ],
     data=["event_id"],
+    local_ttl=60,
 )
 async def get_types_ticket_event(
     event_id: Annotated[
@@ -66,12 +69,9 @@ async def create_types_ticket(
     jwt_token: Annotated[
         str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
     ],
-    rabbit_producer: Annotated[RabbitProducer, Depends(get_rabbit_producer)],
     service: Annotated[ManagementTicketTypeProtocol, Depends(get_ticket_types_service)],
 ) -> CreateTicketTypeResponseDTO:
-    return await service.create_types_ticket_event(
-        jwt_token, ticket_type_data, rabbit_producer
-    )
+    return await service.create_types_ticket_event(jwt_token, ticket_type_data)
 
 
 @router.patch(
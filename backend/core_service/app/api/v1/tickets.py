@@ -1,18 +1,27 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Body, Cookie, Depends, Path, status
+from fastapi.responses import StreamingResponse
 from fastapi_limiter.depends import RateLimiter
 
 from core.config import config
-from dependencies.injection_app import get_rabbit_producer
-from infrastructure.messaging.producer import RabbitProducer
+from dependencies.admission import require_admission
+from dependencies.injection_app import get_ticket_code_filter, get_ticket_holds
+from infrastructure.prefilter.ticket_codes import BloomFilter
+from infrastructure.reservations.holds import TicketHolds
 from schemas import (
     ActivateQrCodeResponseDTO,
     AllActiveTicketsEventResponseDTO,
     AllTicketsEventResponseDTO,
     ManagementTicketsProtocol,
+    ScanBatchDTO,
+    ScanBatchResponseDTO,
     TicketCreateDTO,
     TicketCreateResponseDTO,
+    TicketHoldDTO,
+    TicketHoldResponseDTO,
+    TicketsCreateDTO,
+    TicketsCreateResponseDTO,
 )
 from services import get_tickets_service
 
@@ -57,9 +66,35 @@ async def get_ticket_active(
     return await service.all_active_tickets_event(jwt_token, event_id)
 
 
+@router.get(
+    "/{event_id}/manifest",
+    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    summary="Манифест билетов мероприятия для сканеров",
+    description="ИНФО: Ручка для выгрузки билетов мероприятия на сканеры (NDJSON). Только для создателя мероприятия.",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_event_manifest(
+    event_id: Annotated[
+        int, Path(..., description="ID мероприятия", ge=1, le=config.MAX_ID)
+    ],
+    jwt_token: Annotated[
+        str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
+    ],
+    service: Annotated[ManagementTicketsProtocol, Depends(get_tickets_service)],
+) -> StreamingResponse:
+    return StreamingResponse(
+        await service.event_manifest(jwt_token, event_id),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.post(
     "",
-    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    dependencies=[
+        Depends(RateLimiter(times=10, seconds=60)),
+        Depends(require_admission),
+    ],
     summary="Создание билета на мероприятие",
     description="ИНФО: Ручка для создания билета на мероприятие. Принимает в себя event_id, ticket_type_id",
     status_code=status.HTTP_201_CREATED,
@@ -71,10 +106,113 @@ async def create_ticket(
     jwt_token: Annotated[
         str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
     ],
-    rabbit_producer: Annotated[RabbitProducer, Depends(get_rabbit_producer)],
+    ticket_holds: Annotated[TicketHolds, Depends(get_ticket_holds)],
     service: Annotated[ManagementTicketsProtocol, Depends(get_tickets_service)],
 ) -> TicketCreateResponseDTO:
-    return await service.create_ticket(ticket_data, jwt_token, rabbit_producer)
+    return await service.create_ticket(ticket_data, jwt_token, ticket_holds)
+
+
+@router.post(
+    "/bulk",
+    dependencies=[
+        Depends(RateLimiter(times=10, seconds=60)),
+        Depends(require_admission),
+    ],
+    summary="Покупка нескольких билетов на мероприятие",
+    description="ИНФО: Ручка для покупки нескольких билетов одной транзакцией. Принимает в себя event_id и список ticket_type_id, count",
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_tickets(
+    tickets_data: Annotated[
+        TicketsCreateDTO, Body(..., description="Данные для покупки билетов")
+    ],
+    jwt_token: Annotated[
+        str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
+    ],
+    ticket_holds: Annotated[TicketHolds, Depends(get_ticket_holds)],
+    service: Annotated[ManagementTicketsProtocol, Depends(get_tickets_service)],
+) -> TicketsCreateResponseDTO:
+    return await service.create_tickets(tickets_data, jwt_token, ticket_holds)
+
+
+@router.post(
+    "/hold",
+    dependencies=[
+        Depends(RateLimiter(times=10, seconds=60)),
+        Depends(require_admission),
+    ],
+    summary="Бронь мест на мероприятие",
+    description="ИНФО: Ручка для брони мест до подтверждения покупки. Принимает в себя event_id, ticket_type_id, count",
+    status_code=status.HTTP_201_CREATED,
+)
+async def hold_tickets(
+    hold_data: Annotated[TicketHoldDTO, Body(..., description="Данные для брони")],
+    jwt_token: Annotated[
+        str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
+    ],
+    ticket_holds: Annotated[TicketHolds, Depends(get_ticket_holds)],
+    service: Annotated[ManagementTicketsProtocol, Depends(get_tickets_service)],
+) -> TicketHoldResponseDTO:
+    return await service.hold_tickets(hold_data, jwt_token, ticket_holds)
+
+
+@router.post(
+    "/hold/{hold_id}/confirm",
+    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    summary="Подтверждение брони",
+    description="ИНФО: Ручка для покупки забронированных мест. Принимает ID брони.",
+    status_code=status.HTTP_201_CREATED,
+)
+async def confirm_hold(
+    hold_id: Annotated[
+        str, Path(..., description="ID брони", min_length=1, max_length=64)
+    ],
+    jwt_token: Annotated[
+        str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
+    ],
+    ticket_holds: Annotated[TicketHolds, Depends(get_ticket_holds)],
+    service: Annotated[ManagementTicketsProtocol, Depends(get_tickets_service)],
+) -> TicketsCreateResponseDTO:
+    return await service.confirm_hold(hold_id, jwt_token, ticket_holds)
+
+
+@router.delete(
+    "/hold/{hold_id}",
+    dependencies=[Depends(RateLimiter(times=10, seconds=60))],
+    summary="Отмена брони",
+    description="ИНФО: Ручка для отмены брони. Места возвращаются в продажу.",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def release_hold(
+    hold_id: Annotated[
+        str, Path(..., description="ID брони", min_length=1, max_length=64)
+    ],
+    jwt_token: Annotated[
+        str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
+    ],
+    ticket_holds: Annotated[TicketHolds, Depends(get_ticket_holds)],
+    service: Annotated[ManagementTicketsProtocol, Depends(get_tickets_service)],
+) -> None:
+    await service.release_hold(hold_id, jwt_token, ticket_holds)
+    return
+
+
+@router.post(
+    "/scan/batch",
+    dependencies=[Depends(RateLimiter(times=60, seconds=60))],
+    summary="Активация пачки отсканированных билетов",
+    description="ИНФО: Ручка для выгрузки сканов со сканера одной транзакцией. Принимает в себя event_id и список кодов.",
+    status_code=status.HTTP_200_OK,
+)
+async def scan_tickets(
+    scan_data: Annotated[ScanBatchDTO, Body(..., description="Пачка сканов")],
+    jwt_token: Annotated[
+        str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
+    ],
+    code_filter: Annotated[BloomFilter, Depends(get_ticket_code_filter)],
+    service: Annotated[ManagementTicketsProtocol, Depends(get_tickets_service)],
+) -> ScanBatchResponseDTO:
+    return await service.scan_batch(jwt_token, scan_data, code_filter)
 
 
 @router.post(
@@ -92,10 +230,10 @@ async def scan_ticket(
     jwt_token: Annotated[
         str, Cookie(..., description="JWT токен пользователя", max_length=1_000)
     ],
-    rabbit_producer: Annotated[RabbitProducer, Depends(get_rabbit_producer)],
+    code_filter: Annotated[BloomFilter, Depends(get_ticket_code_filter)],
     service: Annotated[ManagementTicketsProtocol, Depends(get_tickets_service)],
 ) -> ActivateQrCodeResponseDTO:
-    return await service.activate_qr_code(jwt_token, code, rabbit_producer)
+    return await service.activate_qr_code(jwt_token, code, code_filter)
 
 
 @router.delete(
@@ -3,8 +3,6 @@ from typing import Annotated
 from fastapi import APIRouter, Body, Cookie, Depends, Response, status
 from fastapi_limiter.depends import RateLimiter
 
-from dependencies.injection_app import get_rabbit_producer
-from infrastructure.messaging.producer import RabbitProducer
 from schemas import (
     CreateUserDTO,
     CreateUserResponseDTO,
@@ -47,9 +45,8 @@ async def create_user(
         CreateUserDTO, Body(..., description="Данные пользователя для регистрации")
     ],
     service: Annotated[ManagementUsersProtocol, Depends(get_user_service)],
-    rabbit_producer: Annotated[RabbitProducer, Depends(get_rabbit_producer)],
 ) -> CreateUserResponseDTO:
-    return await service.create_user(response, user, rabbit_producer)
+    return await service.create_user(response, user)
 
 
 @router.post(
@@ -16,6 +16,9 @@ class Settings:
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(
         os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 10080)
     )
+    # кеш проверенных токенов (на воркер)
+    JWT_CACHE_SIZE: int = int(os.getenv("JWT_CACHE_SIZE", 10_000))
+    JWT_CACHE_TTL: int = int(os.getenv("JWT_CACHE_TTL", 300))  # сек
 
     # FIXME: в event есть копия с использованием enum. потом сделаю масштабируемое + crud.py
     STATUS_EVENTS: frozenset[str] = frozenset({"опубликовано", "завершено", "черновик"})
@@ -34,6 +37,30 @@ class Settings:
         "Tickets": Tickets,
     }
 
+    # максимум билетов в одной покупке (POST /ticket/bulk)
+    BULK_TICKETS_LIMIT: int = int(os.getenv("BULK_TICKETS_LIMIT", 50))
+    # брони билетов (POST /ticket/hold)
+    HOLD_TTL_SECONDS: int = int(os.getenv("HOLD_TTL_SECONDS", 600))
+    HOLD_REAP_INTERVAL: int = int(os.getenv("HOLD_REAP_INTERVAL", 5))  # сек
+    # виртуальная очередь на продажу (/queue)
+    QUEUE_TOKEN_TTL: int = int(os.getenv("QUEUE_TOKEN_TTL", 3600))  # сек
+    QUEUE_ADMISSION_TTL: int = int(os.getenv("QUEUE_ADMISSION_TTL", 900))  # сек
+    # синхронизация сканеров на входе (/ticket/{event_id}/manifest, /ticket/scan/batch)
+    SCAN_BATCH_LIMIT: int = int(os.getenv("SCAN_BATCH_LIMIT", 5000))
+    MANIFEST_CHUNK: int = int(os.getenv("MANIFEST_CHUNK", 1000))  # строк за раз
+    # префильтр кодов билетов старого формата (Bloom filter в памяти воркера)
+    TICKET_CODE_FILTER_FP_RATE: float = float(
+        os.getenv("TICKET_CODE_FILTER_FP_RATE", 0.001)
+    )
+    # релей outbox в RabbitMQ
+    OUTBOX_RELAY_INTERVAL: float = float(os.getenv("OUTBOX_RELAY_INTERVAL", 1))  # сек
+    OUTBOX_BATCH: int = int(os.getenv("OUTBOX_BATCH", 500))
+    OUTBOX_LEASE_SECONDS: float = float(os.getenv("OUTBOX_LEASE_SECONDS", 30))
+    # сверка счетчиков ticket_types с таблицей tickets
+    TICKET_STATS_RECONCILE_INTERVAL: int = int(
+        os.getenv("TICKET_STATS_RECONCILE_INTERVAL", 3600)
+    )  # сек
+
     # Лимит айди для БД
     MAX_ID: Final[int] = 9_223_372_036_854_775_807
 
@@ -47,5 +74,15 @@ class Settings:
     RABBIT_PASSWORD: str = os.getenv("RABBIT_PASSWORD", "eventpass12345")
     QUEUE_NAME: str = os.getenv("QUEUE_NAME", "notifications")
 
+    # Redis лимитера, броней и очереди (те же переменные, что у кеша в cache_v2.py)
+    REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
+    REDIS_PORT: int = int(os.getenv("REDIS_PORT", 6379))
+    REDIS_DB: int = int(os.getenv("REDIS_DB", 0))
+
+    # ID пользователей с доступом к админ ручкам (через запятую)
+    ADMIN_IDS: frozenset[int] = frozenset(
+        int(elem) for elem in os.getenv("ADMIN_IDS", "").split(",") if elem.strip()
+    )
+
 
 config = Settings()
@@ -109,6 +109,20 @@ class TicketTypeError(ValidationError):
         )
 
 
+class HoldError(ValidationError):
+    """[ValidationError] Бронь не найдена или истекла"""
+
+    def __init__(self) -> None:
+        super().__init__(detail="Бронь не найдена или истекла")
+
+
+class QueueTokenError(ValidationError):
+    """[ValidationError] Неверный пропуск очереди"""
+
+    def __init__(self) -> None:
+        super().__init__(detail="Неверный или просроченный пропуск очереди")
+
+
 # HTTP_403_FORBIDDEN
 
 
@@ -133,3 +147,10 @@ class TicketLimitError(ForbiddenError):
 
     def __init__(self) -> None:
         super().__init__(detail="Достигнут лимит билетов")
+
+
+class QueueError(ForbiddenError):
+    """[ForbiddenError] Очередь на мероприятие еще не пройдена"""
+
+    def __init__(self) -> None:
+        super().__init__(detail="Дождитесь своей очереди на мероприятие")
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 
@@ -8,22 +9,77 @@ import redis.asyncio as redis
 from backend.core_service.app.core.config import config
 from backend.core_service.app.core.logger import logger_api
 from backend.core_service.app.infrastructure.messaging.producer import RabbitProducer
+from infrastructure.admission.store import RedisAdmissionStore
+from infrastructure.cache.cache_v2 import close_cache_connections, run_tag_gc
+from infrastructure.messaging.outbox import run_outbox_relay
+from infrastructure.prefilter.ticket_codes import build_legacy_code_filter
+from infrastructure.reconciliation.ticket_stats import run_ticket_stats_reconciler
+from infrastructure.reservations.holds import TicketHolds, run_hold_reaper
+from models.session import SessionLocal, create_tables, engine
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    await create_tables()
+
+    app.state.ticket_code_filter = await build_legacy_code_filter(
+        SessionLocal, config.TICKET_CODE_FILTER_FP_RATE, config.MANIFEST_CHUNK
+    )
+
     producer = RabbitProducer(login=config.RABBIT_USER, password=config.RABBIT_PASSWORD)
     app.state.rabbit_producer = producer
     await producer.connect()
     logger_api.info("Продюсер Rabbit запущен")
 
-    redis_client = redis.from_url(
-        "redis://localhost:6379", encoding="utf-8", decode_responses=True
+    redis_client = redis.Redis(
+        host=config.REDIS_HOST,
+        port=config.REDIS_PORT,
+        db=config.REDIS_DB,
+        encoding="utf-8",
+        decode_responses=True,
     )
     await FastAPILimiter.init(redis_client)
     logger_api.info("Redis для FastAPILimiter подключен")
 
+    ticket_holds = TicketHolds(redis_client, config.HOLD_TTL_SECONDS)
+    app.state.ticket_holds = ticket_holds
+    app.state.admission_store = RedisAdmissionStore(
+        redis_client, config.QUEUE_ADMISSION_TTL
+    )
+
+    tag_gc = asyncio.create_task(run_tag_gc())
+    hold_reaper = asyncio.create_task(
+        run_hold_reaper(ticket_holds, config.HOLD_REAP_INTERVAL)
+    )
+    outbox_relay = asyncio.create_task(
+        run_outbox_relay(
+            SessionLocal,
+            producer,
+            config.OUTBOX_RELAY_INTERVAL,
+            config.OUTBOX_BATCH,
+            config.OUTBOX_LEASE_SECONDS,
+        )
+    )
+    stats_reconciler = asyncio.create_task(
+        run_ticket_stats_reconciler(
+            SessionLocal, config.TICKET_STATS_RECONCILE_INTERVAL
+        )
+    )
+
     yield
 
+    tasks = (tag_gc, hold_reaper, stats_reconciler, outbox_relay)
+    for task in tasks:
+        task.cancel()
+    # фоновые задачи пользуются продюсером и БД: дожидаемся их до закрытия
+    await asyncio.gather(*tasks, return_exceptions=True)
+    logger_api.info("Фоновые задачи остановлены")
+
     await producer.close()
     logger_api.info("Продюсер Rabbit завершил свою работу")
+
+    await close_cache_connections()
+    logger_api.info("Пул Redis для ICache закрыт")
+
+    await engine.dispose()
+    logger_api.info("Пул соединений БД закрыт")
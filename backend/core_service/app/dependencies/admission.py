@@ -0,0 +1,62 @@
+from typing import Annotated, Optional
+
+from fastapi import Cookie, Depends, Header, Request
+
+from core.exceptions import QueueError
+from dependencies.injection_app import get_admission_store
+from infrastructure.admission.store import AdmissionStore
+from security.jwt import token_verification
+from security.queue_token import read_queue_token
+
+
+async def _event_id(request: Request) -> Optional[int]:
+    """ID мероприятия из пути или JSON тела (тело Starlette кеширует)"""
+    event_id = request.path_params.get("event_id")
+    if event_id is None:
+        try:
+            body = await request.json()
+        except ValueError:
+            return None
+        event_id = body.get("event_id") if isinstance(body, dict) else None
+
+    try:
+        return int(event_id) if event_id is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+async def require_admission(
+    request: Request,
+    store: Annotated[AdmissionStore, Depends(get_admission_store)],
+    queue_token: Annotated[
+        Optional[str],
+        Header(alias="X-Queue-Token", description="Пропуск очереди", max_length=1_000),
+    ] = None,
+    jwt_token: Annotated[Optional[str], Cookie(max_length=1_000)] = None,
+) -> None:
+    """
+    Допуск к ручке через очередь мероприятия (только если очередь включена).
+
+    Пропуск должен быть выдан этому пользователю на это мероприятие, а его
+    место - уже пройти очередь. Неверные данные пропускаются дальше: их
+    отклонит валидация самой ручки.
+
+    Raises:
+        QueueError: Очередь включена, а допуска нет.
+    """
+    if (event_id := await _event_id(request)) is None:
+        return
+
+    ticket = read_queue_token(queue_token)
+    if (
+        ticket is not None
+        and ticket.event_id == event_id
+        and ticket.user_id == await token_verification(jwt_token or "")
+    ):
+        queue_id = ticket.queue_id
+    else:
+        queue_id = ""  # такого места нет: пройдет только выключенная очередь
+
+    state = await store.advance(event_id, queue_id, join=False)
+    if state is not None and not state.admitted:
+        raise QueueError()
@@ -1,7 +1,22 @@
 from fastapi import Request
 
+from infrastructure.admission.store import AdmissionStore
 from infrastructure.messaging.producer import RabbitProducer
+from infrastructure.prefilter.ticket_codes import BloomFilter
+from infrastructure.reservations.holds import TicketHolds
 
 
 def get_rabbit_producer(request: Request) -> RabbitProducer:
     return request.app.state.rabbit_producer
+
+
+def get_ticket_holds(request: Request) -> TicketHolds:
+    return request.app.state.ticket_holds
+
+
+def get_admission_store(request: Request) -> AdmissionStore:
+    return request.app.state.admission_store
+
+
+def get_ticket_code_filter(request: Request) -> BloomFilter:
+    return request.app.state.ticket_code_filter
@@ -0,0 +1,213 @@
+"""
+Хранилище виртуальной очереди (waiting room) на мероприятие.
+
+Очередь включается на мероприятие со скоростью `rate` (пропусков в секунду)
+и запасом `burst`. Пропуски копятся как в token bucket (не больше `burst`),
+каждое обращение к очереди продвигает ее: первые в очереди переходят в
+допущенные на `window` секунд. Отдельной фоновой задачи нет - очередь
+двигают сами опросы статуса.
+
+Redis:
+    waitroom:{event_id}           HASH  rate, burst, allowance, updated, seq
+    waitroom:{event_id}:queue     ZSET  queue_id -> порядковый номер
+    waitroom:{event_id}:admitted  ZSET  queue_id -> конец окна допуска (мс)
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import math
+import time
+from typing import Final, Optional, Protocol, final
+
+import redis.asyncio as redis
+
+# ARGV: queue_id, join (1/0), окно допуска (мс)
+# Вернет nil (очередь выключена) или {admitted, position, allowance, rate}.
+_LUA_ADVANCE: Final[str] = """
+    local t = redis.call('TIME')
+    local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+    local cfg = redis.call('HMGET', KEYS[1], 'rate', 'burst', 'allowance', 'updated')
+    if not cfg[1] then
+        return nil
+    end
+    local rate = tonumber(cfg[1])
+    local burst = tonumber(cfg[2])
+    local allowance = tonumber(cfg[3] or cfg[2])
+    local updated = tonumber(cfg[4] or now)
+    allowance = math.min(allowance + (now - updated) / 1000 * rate, burst)
+
+    if ARGV[2] == '1'
+        and not redis.call('ZSCORE', KEYS[3], ARGV[1])
+        and not redis.call('ZSCORE', KEYS[2], ARGV[1]) then
+        redis.call('ZADD', KEYS[2], redis.call('HINCRBY', KEYS[1], 'seq', 1), ARGV[1])
+    end
+
+    redis.call('ZREMRANGEBYSCORE', KEYS[3], '-inf', now)
+    local admit = math.floor(allowance)
+    if admit > 0 then
+        local popped = redis.call('ZPOPMIN', KEYS[2], admit)
+        for i = 1, #popped, 2 do
+            redis.call('ZADD', KEYS[3], now + tonumber(ARGV[3]), popped[i])
+        end
+        allowance = allowance - #popped / 2
+    end
+    redis.call('HSET', KEYS[1], 'allowance', tostring(allowance), 'updated', now)
+
+    if redis.call('ZSCORE', KEYS[3], ARGV[1]) then
+        return {1, 0, tostring(allowance), cfg[1]}
+    end
+    local rank = redis.call('ZRANK', KEYS[2], ARGV[1])
+    if not rank then
+        return {0, -1, tostring(allowance), cfg[1]}
+    end
+    return {0, rank + 1, tostring(allowance), cfg[1]}
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class AdmissionState:
+    """Состояние места в очереди"""
+
+    admitted: bool
+    position: int  # 0 - допущен, -1 - нет в очереди (окно допуска истекло)
+    eta_seconds: float
+
+    @classmethod
+    def build(
+        cls, admitted: bool, position: int, allowance: float, rate: float
+    ) -> "AdmissionState":
+        """Состояние с оценкой ожидания (накопленные пропуски уйдут первым)"""
+        eta = max(position - allowance, 0) / rate if position > 0 else 0.0
+        return cls(admitted, position, eta)
+
+
+class AdmissionStore(Protocol):
+    """Хранилище очереди (Redis в приложении, память в тестах)"""
+
+    async def configure(self, event_id: int, rate: float, burst: int) -> None:
+        """Включение/изменение очереди мероприятия"""
+        ...
+
+    async def disable(self, event_id: int) -> None:
+        """Выключение очереди (все ожидающие и допущенные удаляются)"""
+        ...
+
+    async def advance(
+        self, event_id: int, queue_id: str, join: bool
+    ) -> Optional[AdmissionState]:
+        """
+        Продвижение очереди и состояние места `queue_id`.
+
+        Args:
+            event_id (int): ID мероприятия.
+            queue_id (str): ID места в очереди.
+            join (bool): Встать в очередь, если места еще нет.
+
+        Returns:
+            Optional[AdmissionState]: Состояние или None, если очередь выключена.
+        """
+        ...
+
+
+@final
+class RedisAdmissionStore:
+    """Очередь в Redis: продвижение и состояние одним Lua скриптом"""
+
+    def __init__(self, client: redis.Redis, window: float) -> None:
+        """
+        Args:
+            client (redis.Redis): Клиент Redis.
+            window (float): Окно допуска (сек): столько живет допуск из очереди.
+        """
+        self.__client = client
+        self.__window_ms = int(window * 1000)
+        self.__advance = client.register_script(_LUA_ADVANCE)
+
+    @staticmethod
+    def __keys(event_id: int) -> list[str]:
+        return [
+            f"waitroom:{event_id}",
+            f"waitroom:{event_id}:queue",
+            f"waitroom:{event_id}:admitted",
+        ]
+
+    async def configure(self, event_id: int, rate: float, burst: int) -> None:
+        await self.__client.hset(
+            f"waitroom:{event_id}", mapping={"rate": rate, "burst": burst}
+        )
+
+    async def disable(self, event_id: int) -> None:
+        await self.__client.delete(*self.__keys(event_id))
+
+    async def advance(
+        self, event_id: int, queue_id: str, join: bool
+    ) -> Optional[AdmissionState]:
+        result = await self.__advance(
+            keys=self.__keys(event_id), args=[queue_id, int(join), self.__window_ms]
+        )
+        if result is None:
+            return None
+
+        admitted, position, allowance, rate = result
+        return AdmissionState.build(
+            bool(admitted), int(position), float(allowance), float(rate)
+        )
+
+
+@dataclass(slots=True)
+class _MemoryRoom:
+    rate: float
+    burst: int
+    allowance: float
+    updated: float
+    queue: OrderedDict[str, None] = field(default_factory=OrderedDict)
+    admitted: dict[str, float] = field(default_factory=dict)
+
+
+@final
+class MemoryAdmissionStore:
+    """Очередь в памяти процесса (для тестов), логика как у Redis скрипта"""
+
+    def __init__(self, window: float) -> None:
+        self.__window = window
+        self.__rooms: dict[int, _MemoryRoom] = {}
+
+    async def configure(self, event_id: int, rate: float, burst: int) -> None:
+        if (room := self.__rooms.get(event_id)) is None:
+            self.__rooms[event_id] = _MemoryRoom(rate, burst, burst, time.monotonic())
+        else:
+            room.rate, room.burst = rate, burst
+
+    async def disable(self, event_id: int) -> None:
+        self.__rooms.pop(event_id, None)
+
+    async def advance(
+        self, event_id: int, queue_id: str, join: bool
+    ) -> Optional[AdmissionState]:
+        if (room := self.__rooms.get(event_id)) is None:
+            return None
+
+        now = time.monotonic()
+        room.allowance = min(
+            room.allowance + (now - room.updated) * room.rate, room.burst
+        )
+        room.updated = now
+
+        if join and queue_id not in room.admitted and queue_id not in room.queue:
+            room.queue[queue_id] = None
+
+        room.admitted = {
+            elem: until for elem, until in room.admitted.items() if until > now
+        }
+        for _ in range(min(math.floor(room.allowance), len(room.queue))):
+            room.admitted[room.queue.popitem(last=False)[0]] = now + self.__window
+            room.allowance -= 1
+
+        if queue_id in room.admitted:
+            return AdmissionState.build(True, 0, room.allowance, room.rate)
+        if queue_id not in room.queue:
+            return AdmissionState.build(False, -1, room.allowance, room.rate)
+
+        position = list(room.queue).index(queue_id) + 1
+        return AdmissionState.build(False, position, room.allowance, room.rate)
@@ -8,21 +8,25 @@ v: v2.0
 import asyncio
 from copy import deepcopy
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache, wraps
 import hashlib
-from inspect import getmembers, iscoroutinefunction, isfunction, signature
-import json
+from inspect import Parameter, getmembers, iscoroutinefunction, isfunction, signature
 import logging
+import os
+import secrets
 import threading
+import time
 from typing import (
     Any,
     Awaitable,
     Callable,
     ClassVar,
+    Collection,
     Dict,
     Final,
+    Iterator,
     List,
-    Literal,
     Optional,
     ParamSpec,
     Protocol,
@@ -35,12 +39,19 @@ from typing import (
     runtime_checkable,
 )
 import warnings
+from weakref import WeakKeyDictionary
 
-import anyio
 from fastapi.encoders import jsonable_encoder
+import orjson
 from pydantic import BaseModel
 import redis
 from redis import Redis
+from redis.asyncio import BlockingConnectionPool, Redis as AsyncRedis
+from redis.exceptions import MaxConnectionsError
+from redis.commands.core import AsyncScript
+
+from .codecs import CacheDecodeError, CacheSerializer, default_serializer
+from .local import LocalCache
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -54,6 +65,7 @@ ElementDTO: TypeAlias = Union[BaseModel, dict[str, Any], list[Any], Any]
 ElementReplaceDTO: TypeAlias = Union[dict[str, Any], list[Any], Any]
 
 IPREFIX: Final[str] = "[ICache]"
+_PRIMITIVES: Final[frozenset[type]] = frozenset({str, int, float, bool, type(None)})
 LIMIT_TIME_REDIS: Final[int] = 2_147_483_647
 logging_level: Final[int] = logging.INFO
 
@@ -132,23 +144,32 @@ class _LogInfo:
         return "".join(parts)
 
     def info(self, text: str, session_name: bool = True, prefix: bool = True) -> None:
-        self.logger.info(self._build_output("INFO", text, session_name, prefix))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(self._build_output("INFO", text, session_name, prefix))
 
     def debug(self, text: str, session_name: bool = True, prefix: bool = True) -> None:
-        self.logger.debug(self._build_output("DEBUG", text, session_name, prefix))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._build_output("DEBUG", text, session_name, prefix))
 
     def warning(
         self, text: str, session_name: bool = True, prefix: bool = True
     ) -> None:
-        self.logger.warning(self._build_output("WARNING", text, session_name, prefix))
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(
+                self._build_output("WARNING", text, session_name, prefix)
+            )
 
     def error(self, text: str, session_name: bool = True, prefix: bool = True) -> None:
-        self.logger.error(self._build_output("ERROR", text, session_name, prefix))
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(self._build_output("ERROR", text, session_name, prefix))
 
     def critical(
         self, text: str, session_name: bool = True, prefix: bool = True
     ) -> None:
-        self.logger.critical(self._build_output("CRITICAL", text, session_name, prefix))
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger.critical(
+                self._build_output("CRITICAL", text, session_name, prefix)
+            )
 
 
 def add_class_marker(**attrs) -> Any:
@@ -164,6 +185,8 @@ def add_class_marker(**attrs) -> Any:
 
 def _pydantic_transformations(element: ElementDTO) -> ElementReplaceDTO:
     """Пайдемик в json"""
+    if type(element) in _PRIMITIVES:
+        return element  # jsonable_encoder вернет их как есть
     try:
         return jsonable_encoder(element)
     except Exception:
@@ -210,65 +233,64 @@ def _substitution_data(logger: LoggerProtocol, param, replacement):  # TODO: с
     return param
 
 
-async def _launch_operation(
-    logger: LoggerProtocol,
-    functions: list[Callable[..., Any]],
-    injections: Dict[Any, Any],
-) -> list[Any]:
-    """
-    Запускает список операций с автоматическим определением их типа.
-
-    Args:
-        functions: Список операций (функции, корутины или маркированные объекты).
-        injections: Аргументы для дальнейшей обработки менеджерами.
-
-    Returns:
-        Список результатов выполнения операций.
-
-    Raises:
-        TypeError: Если передан невызываемый объект.
-    """
-    if not isinstance(logger, LoggerProtocol):
-        raise TypeError(
-            f"Класс должен иметь методы: {[name for name, _ in getmembers(LoggerProtocol, isfunction) if name != '__subclasshook__']}"
-        )
-    logger.debug("Активация обработчика и запуск менеджеров..")
-
-    # WORK:
-    # _launch_operation (обработчик и активатор)
-    #   -> ICacheWriter (менеджер добавления в кеш данных)
-    #   -> IParam (менеджер запуска объекта с входными данными)
-    result: List[Any] = []
-
-    for operation in functions:
-        if not callable(operation):
-            raise TypeError(f"объект '{operation!r}' не является вызываемым")
-
-        class_marker = getattr(operation, "_class_marker", None)
-
-        if class_marker == "__icachewriter__":
-            result.append(await operation(injections))
-        elif class_marker == "__iparam__":
-            await operation(logger, injections)
-        elif iscoroutinefunction(operation):
-            await operation()
-        else:
-            operation()
-
-    return result
-
-
 @dataclass(frozen=True)
 class _SettingsRedis:
     """Настройки Redis"""
 
-    HOST: Final[str] = "localhost"
-    PORT: Final[int] = 6379
-    DB: Final[int] = 0
-    DECODE_RESPONSES: Final[bool] = True
-    TIME_SAVE_NO_CONNECTING: Final[int] = (
-        10  # TODO: сделать умный обход подключеня к редис если он упал
-    )
+    HOST: Final[str] = os.getenv("REDIS_HOST", "localhost")
+    PORT: Final[int] = int(os.getenv("REDIS_PORT", 6379))
+    DB: Final[int] = int(os.getenv("REDIS_DB", 0))
+    DECODE_RESPONSES: Final[bool] = False  # значения бинарные (см. codecs.py)
+    MAX_CONNECTIONS: Final[int] = int(
+        os.getenv("REDIS_MAX_CONNECTIONS", 50)
+    )  # размер пула соединений asyncio клиента (на один event loop)
+    POOL_TIMEOUT: Final[float] = float(
+        os.getenv("REDIS_POOL_TIMEOUT", 1.0)
+    )  # сколько ждать свободное соединение пула до обхода кеша
+    SOCKET_TIMEOUT: Final[float] = float(os.getenv("REDIS_SOCKET_TIMEOUT", 2.0))
+    CONNECT_TIMEOUT: Final[float] = float(
+        os.getenv("REDIS_CONNECT_TIMEOUT", 0.5)
+    )  # недоступный Redis не должен держать запрос дольше
+    BREAKER_FAILURES: Final[int] = int(
+        os.getenv("ICACHE_BREAKER_FAILURES", 5)
+    )  # ошибок соединения подряд до размыкания предохранителя
+    BREAKER_RESET_SECONDS: Final[float] = float(
+        os.getenv("ICACHE_BREAKER_RESET_SECONDS", 10)
+    )  # сколько кеш работает в обход Redis до пробного запроса
+    PENDING_LIMIT: Final[int] = 10_000  # отложенных инвалидаций на воркер
+    SYNC_WORKERS: Final[int] = int(
+        os.getenv("ICACHE_SYNC_WORKERS", 32)
+    )  # потоки для синхронных функций под ICache (см. _CacheWorker)
+    L1_MAX_BYTES: Final[int] = int(
+        os.getenv("ICACHE_L1_MAX_BYTES", 64 * 1024 * 1024)
+    )  # бюджет in-process кеша на воркер
+    L1_CHANNEL: Final[str] = "icache:invalidate"  # pub/sub канал инвалидаций L1
+    L1_RETRY_SECONDS: Final[float] = 1.0  # пауза перед переподпиской
+    LOCK_LEASE_MS: Final[int] = 3_000  # lease лока на пересчет значения (stampede)
+    LOCK_POLL_SECONDS: Final[float] = 0.05  # как часто ждущие проверяют значение
+    TAG_CHUNK: Final[int] = 1_000  # размер пачки ключей тега в Lua (лимит unpack)
+    TAG_GC_INTERVAL: Final[int] = int(
+        os.getenv("ICACHE_TAG_GC_INTERVAL", 600)
+    )  # как часто чистить tag-сеты от несуществующих ключей (сек)
+    STATS_SCAN_COUNT: Final[int] = 500  # пачка SCAN/пайплайна для istats
+    STATS_MEMORY_SAMPLES: Final[int] = 50  # ключей unique_name для MEMORY USAGE
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheOptions:
+    """Настройки одного декоратора ICache"""
+
+    tags: list[str]
+    time_ttl: int
+    serializer: CacheSerializer
+    local_ttl: int | None = None
+    stale_ttl: int | None = None
+
+
+def _consume_future_exception(future: "asyncio.Future[Any]") -> None:
+    """Помечает исключение future как полученное (иначе asyncio пишет warning)"""
+    if not future.cancelled():
+        future.exception()
 
 
 @final
@@ -373,6 +395,48 @@ class IParam:
             return await self.__func(*self.__args, **self.__kwargs)
         return self.__func(*self.__args, **self.__kwargs)
 
+    def prepare(
+        self, names: Collection[str]
+    ) -> tuple[Callable[[Dict[str, Any]], Awaitable[Any]], frozenset[str]]:
+        """
+        План вызова, собранный один раз при декорировании.
+
+        Строки из args/kwargs, совпадающие с именами параметров функции, заменяются
+        значениями аргументов на каждом вызове, остальное передается как есть.
+
+        Args:
+            names (Collection[str]): Имена параметров декорируемой функции.
+
+        Returns:
+            tuple: Вызов с аргументами функции и имена аргументов, которые ему нужны.
+        """
+        func, is_async = self.__func, iscoroutinefunction(self.__func)
+        args_plan = tuple(
+            (isinstance(elem, str) and elem in names, elem) for elem in self.__args
+        )
+        kwargs_plan = tuple(
+            (key, isinstance(value, str) and value in names, value)
+            for key, value in self.__kwargs.items()
+        )
+
+        async def call(arguments: Dict[str, Any]) -> Any:
+            args = [
+                _pydantic_transformations(arguments[elem]) if is_arg else elem
+                for is_arg, elem in args_plan
+            ]
+            kwargs = {
+                key: arguments[value] if is_arg else value
+                for key, is_arg, value in kwargs_plan
+            }
+            if is_async:
+                return await func(*args, **kwargs)
+            return func(*args, **kwargs)
+
+        used = frozenset(elem for is_arg, elem in args_plan if is_arg) | frozenset(
+            value for _, is_arg, value in kwargs_plan if is_arg
+        )
+        return call, used
+
     @staticmethod
     def __process_args(
         logger: LoggerProtocol, param: list[Any], replacement: Dict[Any, Any]
@@ -443,12 +507,77 @@ class ICacheWriter:
             return await self.__func()
         return self.__func()
 
+    def prepare(
+        self, names: Collection[str]
+    ) -> tuple[Callable[[Dict[str, Any]], Awaitable[Any]], frozenset[str]]:
+        """
+        План вызова, собранный один раз при декорировании (см. `IParam.prepare`).
+
+        Args:
+            names (Collection[str]): Имена параметров декорируемой функции.
+
+        Returns:
+            tuple: Вызов с аргументами функции и имена аргументов, которые ему нужны.
+        """
+        if isinstance(self.__func, self.__param):
+            return self.__func.prepare(names)
+        return _prepare_plain(self.__func), frozenset()
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(func={self.__func})"
 
 
-class _RedisService:
-    """Управление редисом"""
+def _prepare_plain(
+    func: Callable[[], Any],
+) -> Callable[[Dict[str, Any]], Awaitable[Any]]:
+    """Вызов функции без аргументов в виде плана (см. `IParam.prepare`)"""
+    is_async = iscoroutinefunction(func)
+
+    async def call(arguments: Dict[str, Any]) -> Any:
+        if is_async:
+            return await func()
+        return func()
+
+    return call
+
+
+class _RedisCommonMixin:
+    """Общие методы для sync/async сервисов Redis"""
+
+    @staticmethod
+    async def launch_function(
+        func: Callable[P, Any], *args: P.args, **kwargs: P.kwargs
+    ) -> Callable[P, Any]:
+        if iscoroutinefunction(func):
+            return await func(*args, **kwargs)
+        return func(*args, **kwargs)
+
+    @staticmethod
+    def create_cache_key(name: str, data: Dict[str, Any]) -> str:
+        """
+        Возвращает ключ для Redis.
+
+        Args:
+            name (str): Уникальное имя сессии.
+            data (Dict[str, Any]): json запрос пользователя.
+
+        Returns:
+            str: Готовый ключ для Redis.
+        """
+        serialized_data = orjson.dumps(
+            data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+        key_hash = hashlib.sha256(serialized_data).hexdigest()
+        return f"icache:{name}:cache:{key_hash}"
+
+
+class _RedisService(_RedisCommonMixin):
+    """
+    Управление редисом (синхронный клиент).
+
+    Используется только синхронным кодом (например `istats`). Декораторы
+    `ICache`/`IClearCache` работают через `_AsyncRedisService`.
+    """
 
     __instance: ClassVar[Self | None] = None
     redis: Redis
@@ -461,39 +590,542 @@ class _RedisService:
 
         if cls.__instance is None:
             cls.__instance = super().__new__(cls)
-            logger.info("Подключение к Redis...", False)
-            cls.__connect_redis()
-            logger.info("Подключено", False)
-            return cls.__instance
+            cls.__create_client()
         return cls.__instance
 
     @classmethod
-    def __connect_redis(cls) -> Literal[True]:
+    def __create_client(cls) -> None:
+        """
+        Создание клиента. Подключение ленивое: соединение открывается при первой
+        команде, поэтому импорт модуля не зависит от доступности Redis.
+
+        Без socket_timeout: pub/sub слушатель L1 блокируется на чтении.
+        """
+        if cls.__instance is None:
+            raise RuntimeError("Экземпляр RedisService не был создан") from None
+
+        cls.__instance.redis = Redis(
+            host=_SettingsRedis.HOST,
+            port=_SettingsRedis.PORT,
+            db=_SettingsRedis.DB,
+            decode_responses=_SettingsRedis.DECODE_RESPONSES,
+            socket_connect_timeout=_SettingsRedis.CONNECT_TIMEOUT,
+        )
+
+    @classmethod
+    def search_key(cls, key: str) -> Any:
+        """
+        Метод для поиска кеша в Redis.
+
+        Args:
+            key (str): Кеш-ключ.
+
+        Returns:
+            Any: Результат поиска.
+        """
+        return cls.__instance.redis.get(key) or None
+
+    @classmethod
+    def scan_keys(cls, match: str | None = None, count: int = 500) -> Iterator[bytes]:
         """
-        Устанавливаем соединение.
+        Потоковый обход ключей (SCAN). В отличие от KEYS не блокирует Redis.
+
+        Args:
+            match (str, optional): Шаблон ключей. Defaults to None.
+            count (int, optional): Подсказка Redis о размере пачки. Defaults to 500.
+
+        Returns:
+            Iterator[bytes]: Ключи.
+        """
+        return cls.__instance.redis.scan_iter(match=match, count=count)
+
+    @classmethod
+    def pipeline(cls) -> Any:
+        return cls.__instance.redis.pipeline(transaction=False)
+
+    @classmethod
+    def delete_key(cls, key: str) -> Any:
+        """
+        Метод для удаления кеша Redis.
+
+        Args:
+            key (str): Кеш-ключ.
+
+        Returns:
+            Any: Результат удаления.
+        """
+        return cls.__instance.redis.delete(key)
+
+    @classmethod
+    def count_tag(cls, tag: str) -> int:
+        return cls.__instance.redis.scard(tag)
+
+    @classmethod
+    def pubsub(cls) -> Any:
+        return cls.__instance.redis.pubsub(ignore_subscribe_messages=True)
+
+
+local_cache = LocalCache(_SettingsRedis.L1_MAX_BYTES)
+
+
+# Redis недоступен/не отвечает: на эти ошибки кеш обходится.
+# MaxConnectionsError (пул занят, Redis жив) - тоже подкласс ConnectionError,
+# поэтому ловится раньше и предохранитель не размыкает.
+_REDIS_DOWN: Final[tuple[type[Exception], ...]] = (
+    redis.ConnectionError,
+    redis.TimeoutError,
+)
+
+
+@final
+class _CircuitBreaker:
+    """
+    Предохранитель вокруг операций кеша с Redis.
+
+    - closed: операции идут в Redis; `failure_threshold` ошибок подряд -> open.
+    - open: Redis не трогаем `reset_timeout` сек, функция вызывается напрямую
+      (degraded mode) - без ожидания таймаутов на каждом запросе.
+    - half_open: пропускается одна пробная операция: успех -> closed, ошибка -> open.
+    """
+
+    CLOSED: Final[str] = "closed"
+    OPEN: Final[str] = "open"
+    HALF_OPEN: Final[str] = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """
+        Args:
+            failure_threshold (int): Ошибок подряд до размыкания.
+            reset_timeout (float): Сколько секунд не трогать Redis после размыкания.
 
         Raises:
-            ConnectionError: не удалось подключиться к Redis.
+            ValueError: Неверные входные данные.
+        """
+        if failure_threshold <= 0 or reset_timeout <= 0:
+            raise ValueError("failure_threshold и reset_timeout должны быть больше 0")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.trips = 0
+        self.__failures = 0
+        self.__opened_at = 0.0
+        self.__probe_at = 0.0
+        self.__lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Можно ли сейчас обращаться к Redis"""
+        if self.state == self.CLOSED:
+            return True
+
+        with self.__lock:
+            now = time.monotonic()
+            if self.state == self.OPEN:
+                if now - self.__opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+            elif now - self.__probe_at < self.reset_timeout:
+                return False  # пробная операция еще идет
+
+            self.__probe_at = now  # half_open: пропускаем одну пробу
+            return True
+
+    def success(self) -> bool:
+        """
+        Операция с Redis прошла успешно.
 
         Returns:
-            Literal[True]: Соединение установлено.
+            bool: Предохранитель только что замкнулся (Redis вернулся).
         """
-        if cls.__instance is None:
-            raise RuntimeError("Экземпляр RedisService не был создан") from None
+        if self.state == self.CLOSED and not self.__failures:
+            return False
+
+        with self.__lock:
+            recovered = self.state != self.CLOSED
+            self.state = self.CLOSED
+            self.__failures = 0
+            return recovered
+
+    def failure(self) -> None:
+        """Операция с Redis упала по соединению/таймауту"""
+        with self.__lock:
+            self.__failures += 1
+            if (
+                self.state == self.HALF_OPEN
+                or self.__failures >= self.failure_threshold
+            ):
+                if self.state != self.OPEN:
+                    self.trips += 1
+                self.state = self.OPEN
+                self.__opened_at = time.monotonic()
+
+    def stats(self) -> dict[str, Any]:
+        """Состояние для метрик"""
+        return {"state": self.state, "failures": self.__failures, "trips": self.trips}
+
+
+breaker = _CircuitBreaker(
+    _SettingsRedis.BREAKER_FAILURES, _SettingsRedis.BREAKER_RESET_SECONDS
+)
+
+
+def _parse_cache_key(key: str) -> tuple[str, str] | None:
+    """
+    Разбор ключа ICache.
+
+    Формы ключей: `icache:{name}:cache:{hash}` (значение), `...:stale` (SWR копия),
+    `...:lock` (лок пересчета). Служебные ключи (`icache:gc:lock`) - `None`.
+
+    Returns:
+        tuple[str, str] | None: (unique_name, вид: value/stale/lock).
+    """
+    parts = key.split(":")
+    if len(parts) < 4 or parts[0] != "icache" or parts[2] != "cache":
+        return None
+    if len(parts) == 4:
+        return parts[1], "value"
+    return parts[1], parts[4]
+
+
+@final
+class _CacheMetrics:
+    """
+    Счетчики ICache по `unique_name` в пределах воркера.
+
+    Пишутся на горячем пути, поэтому без локов и без запросов в Redis:
+    инкремент словаря под GIL, точность "плюс-минус гонка" для метрик допустима.
+    """
+
+    FIELDS: Final[tuple[str, ...]] = (
+        "hits",
+        "hits_l1",
+        "hits_stale",
+        "misses",
+        "bypassed",
+        "saves",
+        "invalidations",
+        "decode_errors",
+    )
+
+    def __init__(self) -> None:
+        self.__counters: dict[str, dict[str, int]] = {}
+
+    def incr(self, key_redis: str, field: str, value: int = 1) -> None:
+        """Увеличивает счетчик `field` для unique_name ключа"""
+        if (counters := self.__bucket(key_redis)) is not None:
+            counters[field] += value
+
+    def decode(self, key_redis: str, serializer: CacheSerializer, value: bytes) -> Any:
+        """Декодирование значения с замером времени"""
+        counters = self.__bucket(key_redis)
+        started = time.perf_counter_ns()
         try:
-            cls.__instance.redis = Redis(
+            return serializer.loads(value)
+        except CacheDecodeError:
+            if counters is not None:
+                counters["decode_errors"] += 1
+            raise
+        finally:
+            if counters is not None:
+                counters["decode_ns"] += time.perf_counter_ns() - started
+                counters["decode_count"] += 1
+
+    def snapshot(self) -> dict[str, dict[str, int | float]]:
+        """Копия счетчиков + среднее время декодирования (мкс)"""
+        result: dict[str, dict[str, int | float]] = {}
+        for name, counters in list(self.__counters.items()):
+            elems: dict[str, int | float] = {key: counters[key] for key in self.FIELDS}
+            decode_count = counters["decode_count"]
+            elems["mean_decode_us"] = (
+                round(counters["decode_ns"] / decode_count / 1_000, 3)
+                if decode_count
+                else 0.0
+            )
+            result[name] = elems
+        return result
+
+    def reset(self) -> None:
+        """Сброс счетчиков"""
+        self.__counters.clear()
+
+    def __bucket(self, key_redis: str) -> dict[str, int] | None:
+        """Счетчики unique_name ключа (создаются при первом обращении)"""
+        if (parsed := _parse_cache_key(key_redis)) is None:
+            return None
+        if (counters := self.__counters.get(parsed[0])) is None:
+            counters = dict.fromkeys((*self.FIELDS, "decode_count", "decode_ns"), 0)
+            counters = self.__counters.setdefault(parsed[0], counters)
+        return counters
+
+
+metrics = _CacheMetrics()
+
+# Общая часть скриптов удаления. Stale копия бессрочного ключа хранится без TTL,
+# пока жив ключ: при удалении ключа ей ставится stale_ttl его unique_name
+# (`icache:stale_ttl:{name}`, пишется в save).
+_LUA_EXPIRE_STALE: Final[str] = """
+    local function expire_stale(keys)
+        for _, key in ipairs(keys) do
+            local name = string.match(key, '^icache:(.+):cache:%x+$')
+            if name and redis.call('TTL', key .. ':stale') == -1 then
+                local stale_ttl = redis.call('GET', 'icache:stale_ttl:' .. name)
+                if stale_ttl then
+                    redis.call('EXPIRE', key .. ':stale', stale_ttl)
+                end
+            end
+        end
+    end
+"""
+
+# Lua скрипты ICache. Выполняются атомарно на стороне Redis за один запрос.
+_LUA_SCRIPTS: Final[dict[str, str]] = {
+    # KEYS[1] - лок, ARGV[1] - токен владельца
+    "release_lock": """
+        if redis.call('GET', KEYS[1]) == ARGV[1] then
+            return redis.call('DEL', KEYS[1])
+        end
+        return 0
+    """,
+    # KEYS[1] - ключ, KEYS[2] - stale копия, KEYS[3] - stale_ttl unique_name,
+    # KEYS[4..] - сеты тегов
+    # ARGV[1] - значение, ARGV[2] - TTL ключа (-1 бесконечно), ARGV[3] - stale_ttl (0 нет)
+    # Stale копия живет на stale_ttl дольше ключа, у бессрочного ключа - до его
+    # удаления плюс stale_ttl (см. `_LUA_EXPIRE_STALE`).
+    # Сет тега живет не меньше своих ключей: у бессрочного ключа сет бессрочный.
+    "save": """
+        local ttl = tonumber(ARGV[2])
+        local stale_ttl = tonumber(ARGV[3])
+
+        if ttl > 0 then
+            redis.call('SET', KEYS[1], ARGV[1], 'EX', ttl)
+        else
+            redis.call('SET', KEYS[1], ARGV[1])
+        end
+        if stale_ttl > 0 and ttl > 0 then
+            redis.call('SET', KEYS[2], ARGV[1], 'EX', ttl + stale_ttl)
+        elseif stale_ttl > 0 then
+            redis.call('SET', KEYS[2], ARGV[1])
+            redis.call('SET', KEYS[3], stale_ttl)
+        end
+
+        for i = 4, #KEYS do
+            local existed = redis.call('EXISTS', KEYS[i])
+            redis.call('SADD', KEYS[i], KEYS[1])
+            if ttl <= 0 then
+                redis.call('PERSIST', KEYS[i])
+            elseif existed == 0 then
+                redis.call('EXPIRE', KEYS[i], ttl)
+            else
+                local current = redis.call('TTL', KEYS[i])
+                if current ~= -1 and current < ttl then
+                    redis.call('EXPIRE', KEYS[i], ttl)
+                end
+            end
+        end
+        return 1
+    """,
+    # KEYS - сеты тегов, ARGV[1] - размер пачки для unpack
+    # Ключи и сам сет удаляются атомарно: параллельный save либо попадет
+    # в удаляемый сет до скрипта, либо создаст новый сет после.
+    "purge_tags": _LUA_EXPIRE_STALE
+    + """
+        local deleted = 0
+        for i = 1, #KEYS do
+            local cursor = '0'
+            repeat
+                local result = redis.call('SSCAN', KEYS[i], cursor, 'COUNT', ARGV[1])
+                cursor = result[1]
+                local members = result[2]
+                if #members > 0 then
+                    expire_stale(members)
+                    deleted = deleted + redis.call('UNLINK', unpack(members))
+                end
+            until cursor == '0'
+            redis.call('UNLINK', KEYS[i])
+        end
+        return deleted
+    """,
+    # KEYS - удаляемые ключи
+    "purge_keys": _LUA_EXPIRE_STALE
+    + """
+        expire_stale(KEYS)
+        return redis.call('UNLINK', unpack(KEYS))
+    """,
+    # KEYS[1] - сет тега, ARGV - проверяемые ключи
+    "collect_tag": """
+        local removed = 0
+        for i = 1, #ARGV do
+            if redis.call('EXISTS', ARGV[i]) == 0 then
+                removed = removed + redis.call('SREM', KEYS[1], ARGV[i])
+            end
+        end
+        return removed
+    """,
+}
+
+
+@final
+class _LocalInvalidation:
+    """
+    Рассылка инвалидаций L1 между воркерами/нодами через Redis pub/sub.
+
+    Слушатель живет в отдельном daemon-потоке на синхронном клиенте, поэтому
+    не зависит от event loop. Пока подписки нет, L1 выключен (`active=False`),
+    а после (пере)подписки очищается: сообщения за время разрыва потеряны.
+    """
+
+    __thread: ClassVar[threading.Thread | None] = None
+    __lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def ensure_listener(cls, logger: LoggerProtocol) -> None:
+        """Запуск слушателя (один на процесс)"""
+        if cls.__thread is not None:
+            return
+
+        with cls.__lock:
+            if cls.__thread is None:
+                cls.__thread = threading.Thread(
+                    target=cls.__listen,
+                    args=(logger,),
+                    name="icache-l1-invalidation",
+                    daemon=True,
+                )
+                cls.__thread.start()
+
+    @classmethod
+    def __listen(cls, logger: LoggerProtocol) -> None:
+        while True:
+            try:
+                pubsub = _RedisService(logger).pubsub()
+                pubsub.subscribe(_SettingsRedis.L1_CHANNEL)
+
+                local_cache.clear()
+                local_cache.active = True
+                logger.info("L1 подписан на инвалидации", False)
+
+                for message in pubsub.listen():
+                    cls.apply(message["data"])
+
+            except Exception as e:
+                local_cache.active = False
+                local_cache.clear()
+                logger.warning(f"L1 выключен, нет подписки на инвалидации: {e!r}")
+                time.sleep(_SettingsRedis.L1_RETRY_SECONDS)
+
+    @staticmethod
+    def message(tags: list[str] | None, keys: list[str]) -> bytes:
+        """Тело сообщения об инвалидации"""
+        return orjson.dumps({"tags": tags or [], "keys": keys})
+
+    @staticmethod
+    def apply(data: bytes) -> None:
+        """Применение сообщения об инвалидации к L1"""
+        body = orjson.loads(data)
+        local_cache.invalidate_tags(body.get("tags", ()))
+        local_cache.invalidate_keys(body.get("keys", ()))
+
+
+class _BlockingPool(BlockingConnectionPool):
+    """
+    Пул, в котором запрос ждет свободное соединение (`POOL_TIMEOUT`), а не
+    падает сразу. Не дождался - MaxConnectionsError: пул исчерпан, а не Redis
+    недоступен (redis-py отдает тут обычный ConnectionError).
+    """
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await super().get_connection(*args, **kwargs)
+        except redis.ConnectionError as e:
+            if isinstance(e.__cause__, asyncio.TimeoutError):
+                raise MaxConnectionsError("Пул соединений Redis исчерпан") from e
+            raise
+
+
+class _AsyncRedisService(_RedisCommonMixin):
+    """
+    Управление редисом (asyncio клиент).
+
+    Соединения `redis.asyncio` привязаны к event loop, в котором были созданы,
+    поэтому на каждый loop заводится свой пул размером `_SettingsRedis.MAX_CONNECTIONS`.
+    Когда пул занят, команды ждут соединение (`_BlockingPool`).
+    Подключение ленивое: пул создается при первом обращении из loop.
+    """
+
+    __instance: ClassVar[Self | None] = None
+    __clients: ClassVar[WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncRedis]] = (
+        WeakKeyDictionary()
+    )
+    __scripts: ClassVar[
+        WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, AsyncScript]]
+    ] = WeakKeyDictionary()
+    __inflight: ClassVar[
+        WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Future[Any]]]
+    ] = WeakKeyDictionary()
+    # инвалидации, не дошедшие до Redis (предохранитель открыт) - повторяются,
+    # когда Redis вернется, иначе после сбоя остались бы устаревшие значения
+    __pending_tags: ClassVar[set[str]] = set()
+    __pending_keys: ClassVar[set[str]] = set()
+
+    def __new__(cls, logger: LoggerProtocol, *args: object, **kwargs: object) -> Self:
+        if not isinstance(logger, LoggerProtocol):
+            raise TypeError(
+                f"Класс должен иметь методы: {[name for name, _ in getmembers(LoggerProtocol, isfunction) if name != '__subclasshook__']}"
+            )
+
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def client(cls) -> AsyncRedis:
+        """
+        Возвращает клиент Redis для текущего event loop.
+
+        Raises:
+            RuntimeError: Вызов вне event loop.
+
+        Returns:
+            AsyncRedis: Клиент с пулом соединений.
+        """
+        loop = asyncio.get_running_loop()
+
+        if (client := cls.__clients.get(loop)) is None:
+            pool = _BlockingPool(
                 host=_SettingsRedis.HOST,
                 port=_SettingsRedis.PORT,
                 db=_SettingsRedis.DB,
                 decode_responses=_SettingsRedis.DECODE_RESPONSES,
+                max_connections=_SettingsRedis.MAX_CONNECTIONS,
+                timeout=_SettingsRedis.POOL_TIMEOUT,
+                socket_timeout=_SettingsRedis.SOCKET_TIMEOUT,
+                socket_connect_timeout=_SettingsRedis.CONNECT_TIMEOUT,
             )
-            cls.__instance.redis.ping()
-            return True
-        except Exception as e:
-            raise ConnectionError("Ошибка подключения к Redis") from None
+            client = AsyncRedis(connection_pool=pool)
+            cls.__clients[loop] = client
+            cls.__scripts[loop] = {
+                name: client.register_script(script)
+                for name, script in _LUA_SCRIPTS.items()
+            }
+        return client
 
     @classmethod
-    def search_key(cls, key: str) -> Any:
+    def script(cls, name: str) -> AsyncScript:
+        """Lua скрипт (EVALSHA с автозагрузкой) для текущего event loop"""
+        cls.client()
+        return cls.__scripts[asyncio.get_running_loop()][name]
+
+    @classmethod
+    async def close(cls) -> None:
+        """Закрывает пул соединений текущего event loop"""
+        loop = asyncio.get_running_loop()
+
+        cls.__scripts.pop(loop, None)
+        if (client := cls.__clients.pop(loop, None)) is not None:
+            await client.aclose()
+
+    @classmethod
+    async def search_key(cls, key: str) -> Any:
         """
         Метод для поиска кеша в Redis.
 
@@ -503,40 +1135,43 @@ class _RedisService:
         Returns:
             Any: Результат поиска.
         """
-        return cls.__instance.redis.get(key) or None
+        return await cls.client().get(key) or None
 
     @classmethod
-    def all_keys(cls) -> list[Any, Any]:
-        return cls.__instance.redis.keys()
-
-    @classmethod
-    def save_key(
-        cls, key: str, value: Dict[str, Any], tags: list[str], time: int
+    async def save_key(
+        cls,
+        key: str,
+        value: bytes,
+        tags: list[str],
+        time: int,
+        stale_ttl: int | None = None,
     ) -> Any:
         """
-        Метод для сохранения кеша в Redis.
+        Метод для сохранения кеша в Redis (ключ, stale копия и теги - атомарно).
 
         Args:
             key (str): Кеш-ключ.
-            value (Dict[str, Any]): Данные-значение.
+            value (bytes): Закодированные данные (`CacheSerializer.dumps`).
             tags (list[str]): Теги ключа.
             time (int): Время жизни кеша. `time=-1` - бесконечно.
+            stale_ttl (int | None): На сколько stale копия (SWR) переживает ключ. `None` - без копии.
 
         Returns:
             Any: Результат сохранения.
         """
-        if time != -1:
-            result_create = cls.__instance.redis.setex(key, time, str(value))
-        else:
-            result_create = cls.__instance.redis.set(key, str(value))
-
-        for tag in tags:
-            cls.__instance.redis.sadd(f"tag:{tag}", key)
-
-        return result_create
+        name = key.removeprefix("icache:").rsplit(":cache:", 1)[0]
+        return await cls.script("save")(
+            keys=[
+                key,
+                f"{key}:stale",
+                f"icache:stale_ttl:{name}",
+                *(f"tag:{tag}" for tag in tags),
+            ],
+            args=[value, time, stale_ttl or 0],
+        )
 
     @classmethod
-    def delete_key(cls, key: str) -> Any:
+    async def delete_key(cls, key: str) -> Any:
         """
         Метод для удаления кеша Redis.
 
@@ -546,30 +1181,56 @@ class _RedisService:
         Returns:
             Any: Результат удаления.
         """
-        return cls.__instance.redis.delete(key)
+        return await cls.client().delete(key)
 
     @classmethod
-    def delete_tags(cls, tags: list[str]) -> Literal[True]:
+    async def delete_tags(cls, tags: list[str]) -> int:
         """
-        Удаление элементов тегов.
+        Удаление элементов тегов (атомарно, Lua).
 
         Args:
             tags (list[str]): Теги.
 
         Returns:
-            Literal[True]: Результат удаления.
+            int: Количество удаленных ключей.
         """
-        for tag in tags:
-            tag_name = f"tag:{tag}"
-            keys = cls.__instance.redis.smembers(tag_name)
-            if keys:
-                cls.__instance.redis.delete(*keys)
-            cls.__instance.redis.delete(tag_name)
-        return True
+        return await cls.script("purge_tags")(
+            keys=[f"tag:{tag}" for tag in tags], args=[_SettingsRedis.TAG_CHUNK]
+        )
 
     @classmethod
-    def count_tag(cls, tag: str) -> int:
-        return cls.__instance.redis.scard(tag)
+    async def collect_tags(cls) -> int:
+        """
+        Сборка мусора в сетах тегов: удаляет ссылки на ключи, которых уже нет
+        (вытеснены Redis/удалены по одному). Проверка и удаление атомарны на пачку.
+
+        Returns:
+            int: Количество удаленных ссылок.
+        """
+        client = cls.client()
+        collect = cls.script("collect_tag")
+        removed = 0
+
+        async for tag_key in client.scan_iter(
+            match="tag:*", count=_SettingsRedis.TAG_CHUNK
+        ):
+            members: list[bytes] = []
+
+            async for member in client.sscan_iter(
+                tag_key, count=_SettingsRedis.TAG_CHUNK
+            ):
+                members.append(member)
+                if len(members) >= _SettingsRedis.TAG_CHUNK:
+                    removed += await collect(keys=[tag_key], args=members)
+                    members = []
+
+            if members:
+                removed += await collect(keys=[tag_key], args=members)
+        return removed
+
+    @classmethod
+    async def count_tag(cls, tag: str) -> int:
+        return await cls.client().scard(tag)
 
     @classmethod
     async def clear_cache(
@@ -593,27 +1254,106 @@ class _RedisService:
         Returns:
             Callable[P, R]: Результат функции.
         """
+        # свой L1 чистим сразу, остальные воркеры - через pub/sub
+        local_cache.invalidate_tags(tags_delete or ())
+        local_cache.invalidate_keys((key_redis,))
+
+        if not breaker.allow():
+            cls.__defer(logger, tags_delete, key_redis)
+            logger.warning("Redis недоступен: удаление кеша отложено до восстановления")
+            return await cls.launch_function(func, *args, **kwargs)
+
         try:
-            if tags_delete:
-                cls.delete_tags(tags_delete)
-                logger.info("Кеш удален [tags]")
+            deleted_tags, deleted_key = await cls.__invalidate(
+                tags_delete or [], [key_redis]
+            )
+            if breaker.success():
+                await cls.flush_pending(logger)
 
-            if cls.search_key(key_redis) is not None:
-                cls.delete_key(key_redis)
+            if tags_delete:
+                metrics.incr(key_redis, "invalidations", deleted_tags)
+                logger.info(f"Кеш удален [tags]: {deleted_tags} ключей")
+            if deleted_key:
+                metrics.incr(key_redis, "invalidations", deleted_key)
                 logger.info("Кеш удален [key]")
-        except redis.ConnectionError as e:
-            logger.error(f"Не удалось удалить кеш/тег. Отсутствует подключение к Redis")
+        except MaxConnectionsError:
+            cls.__defer(logger, tags_delete, key_redis)
+            logger.warning("Пул Redis занят: удаление кеша отложено")
+        except _REDIS_DOWN:
+            breaker.failure()
+            cls.__defer(logger, tags_delete, key_redis)
+            logger.error("Не удалось удалить кеш/тег. Отсутствует подключение к Redis")
 
         return await cls.launch_function(func, *args, **kwargs)
 
+    @classmethod
+    async def flush_pending(cls, logger: LoggerProtocol) -> None:
+        """Повтор инвалидаций, отложенных на время недоступности Redis"""
+        if not cls.__pending_tags and not cls.__pending_keys:
+            return
+
+        tags, keys = list(cls.__pending_tags), list(cls.__pending_keys)
+        cls.__pending_tags.clear()
+        cls.__pending_keys.clear()
+
+        try:
+            deleted_tags, deleted_keys = await cls.__invalidate(tags, keys)
+            logger.info(
+                f"Отложенные инвалидации применены: {deleted_tags + deleted_keys} ключей"
+            )
+        except MaxConnectionsError:
+            cls.__pending_tags.update(tags)
+            cls.__pending_keys.update(keys)
+        except _REDIS_DOWN:
+            breaker.failure()
+            cls.__pending_tags.update(tags)
+            cls.__pending_keys.update(keys)
+
+    @classmethod
+    async def __invalidate(cls, tags: list[str], keys: list[str]) -> tuple[int, int]:
+        """
+        Удаление тегов/ключей и рассылка L1 - одним запросом.
+
+        Returns:
+            tuple[int, int]: Удалено ключей по тегам и по списку ключей.
+        """
+        async with cls.client().pipeline(transaction=False) as pipe:
+            if tags:
+                await cls.script("purge_tags")(
+                    keys=[f"tag:{tag}" for tag in tags],
+                    args=[_SettingsRedis.TAG_CHUNK],
+                    client=pipe,
+                )
+            if keys:
+                await cls.script("purge_keys")(keys=keys, client=pipe)
+            pipe.publish(
+                _SettingsRedis.L1_CHANNEL, _LocalInvalidation.message(tags, keys)
+            )
+            result = await pipe.execute()
+
+        return (result[0] if tags else 0), (result[-2] if keys else 0)
+
+    @classmethod
+    def __defer(
+        cls, logger: LoggerProtocol, tags: list[str] | None, key_redis: str
+    ) -> None:
+        """Запоминает инвалидацию до восстановления Redis"""
+        pending = len(cls.__pending_tags) + len(cls.__pending_keys)
+        if pending >= _SettingsRedis.PENDING_LIMIT:
+            logger.critical(
+                "Очередь отложенных инвалидаций переполнена, удаление потеряно"
+            )
+            return
+        cls.__pending_tags.update(tags or ())
+        cls.__pending_keys.add(key_redis)
+
     @classmethod
     async def using_cache(
         cls,
         logger: LoggerProtocol,
         key_redis: str,
         func: Callable[P, R],
-        tags: list[str],
-        time_ttl: int,
+        options: _CacheOptions,
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Callable[P, R]:
@@ -624,68 +1364,235 @@ class _RedisService:
             logger (LoggerProtocol): Класс для работы с логгером.
             key_redis (str): Ключ для поиска в Redis.
             func (Callable[..., Any]): Оригинальная функция для запуска.
-            tags (list[str]): Теги, для удаления всех элементов с этими тегами.
-            time_ttl (int): Время жизни кеша. `-1` - бесконечно
+            options (_CacheOptions): Теги, TTL, кодек, L1 и SWR декоратора.
 
         Returns:
             Callable[..., Any]: Кеш/результат функции.
         """
-        try:
-            if (value_redis := cls.search_key(key_redis)) is None:
-                result = await cls.launch_function(func, *args, **kwargs)
-                json_value = jsonable_encoder(result)
+        if options.local_ttl is not None:
+            _LocalInvalidation.ensure_listener(logger)
+
+            if (value_local := local_cache.get(key_redis)) is not None:
+                try:
+                    local_result: R = metrics.decode(
+                        key_redis, options.serializer, value_local
+                    )
+                    metrics.incr(key_redis, "hits_l1")
+                    logger.info("Кеш использован [L1]")
+                    return local_result
+                except CacheDecodeError:
+                    local_cache.invalidate_keys((key_redis,))
+
+        if not breaker.allow():
+            metrics.incr(key_redis, "bypassed")
+            return await cls.launch_function(func, *args, **kwargs)
 
-                cls.save_key(key_redis, json_value, tags, time_ttl)
+        try:
+            value_redis, value_stale = await cls.__search_with_stale(key_redis, options)
+            if breaker.success():
+                await cls.flush_pending(logger)
 
-                logger.info("Кеш сохранен")
-                return result
-            else:
-                fixed_json = value_redis.replace("'", '"')
-                json_result: R = json.loads(fixed_json)
+            if value_redis is not None:
+                cache_result: R = metrics.decode(
+                    key_redis, options.serializer, value_redis
+                )
+                cls.__fill_local(key_redis, value_redis, options)
 
+                metrics.incr(key_redis, "hits")
                 logger.info("Кеш использован")
-                return json_result
+                return cache_result
 
-        except redis.ConnectionError as e:
-            logger.error(f"Не удалось удалить кеш/тег. Отсутствует подключение к Redis")
+            metrics.incr(key_redis, "misses")
+            return await cls.__single_flight(
+                logger, key_redis, value_stale, func, options, *args, **kwargs
+            )
+
+        except MaxConnectionsError:
+            metrics.incr(key_redis, "bypassed")
+            logger.warning("Пул Redis занят: кеш обойден")
+
+        except _REDIS_DOWN:
+            breaker.failure()
+            logger.error(
+                f"Не удалось использовать кеш. Отсутствует подключение к Redis"
+            )
 
-        except json.decoder.JSONDecodeError:
+        except CacheDecodeError as e:
             try:
-                cls.delete_key(key_redis)
+                await cls.delete_key(key_redis)
                 logger.error(
-                    f"[Json error] Не удалось использовать кеш. Произошло аварийное удаление ключа."
+                    f"[Decode error] Не удалось использовать кеш ({e}). Произошло аварийное удаление ключа."
                 )
 
-            except json.decoder.JSONDecodeError:
+            except MaxConnectionsError:
+                logger.warning("Пул Redis занят: битый ключ не удален")
+
+            except _REDIS_DOWN:
+                breaker.failure()
                 logger.error(
                     f"Не удалось удалить кеш/тег. Отсутствует подключение к Redis"
                 )
 
         return await cls.launch_function(func, *args, **kwargs)
 
-    @staticmethod
-    async def launch_function(
-        func: Callable[P, Any], *args: P.args, **kwargs: P.kwargs
-    ) -> Callable[P, Any]:
-        if iscoroutinefunction(func):
-            return await func(*args, **kwargs)
-        return func(*args, **kwargs)
-
     @classmethod
-    def create_cache_key(cls, name: str, data: Dict[str, Any]) -> str:
+    async def __single_flight(
+        cls,
+        logger: LoggerProtocol,
+        key_redis: str,
+        value_stale: bytes | None,
+        func: Callable[P, R],
+        options: _CacheOptions,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
         """
-        Возвращает ключ для Redis.
+        Заполнение кеша при промахе с защитой от stampede.
+
+        - В процессе: один future на ключ, остальные корутины ждут его результат.
+        - Между воркерами: лок в Redis с коротким lease, остальные ждут значение.
+        - SWR (`stale_ttl`): пока значение пересчитывается, отдается прошлое.
 
         Args:
-            name (str): Уникальное имя сессии.
-            data (Dict[str, Any]): json запрос пользователя.
+            logger (LoggerProtocol): Класс для работы с логгером.
+            key_redis (str): Ключ для поиска в Redis.
+            value_stale (bytes | None): Прошлое значение (только при SWR).
+            func (Callable[..., Any]): Оригинальная функция для запуска.
+            options (_CacheOptions): Настройки декоратора.
 
         Returns:
-            str: Готовый ключ для Redis.
+            R: Результат функции/кеш.
         """
-        serialized_data = json.dumps(data, sort_keys=True).encode("utf-8")
-        key_hash = hashlib.sha256(serialized_data).hexdigest()
-        return f"icache:{name}:cache:{key_hash}"
+        inflight = cls.__inflight_for_loop()
+
+        if (future := inflight.get(key_redis)) is not None:
+            if value_stale is not None:
+                metrics.incr(key_redis, "hits_stale")
+                logger.info("Кеш использован [stale]")
+                return metrics.decode(key_redis, options.serializer, value_stale)
+
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            except Exception:
+                pass  # ошибка лидера (например, чужой токен) - считаем сами
+            return await cls.launch_function(func, *args, **kwargs)
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_consume_future_exception)
+        inflight[key_redis] = future
+
+        lock_key, lock_token = f"{key_redis}:lock", secrets.token_hex(8)
+        is_locked = False
+        try:
+            is_locked = bool(
+                await cls.client().set(
+                    lock_key, lock_token, nx=True, px=_SettingsRedis.LOCK_LEASE_MS
+                )
+            )
+
+            if not is_locked:
+                if value_stale is not None:
+                    result = metrics.decode(key_redis, options.serializer, value_stale)
+                    metrics.incr(key_redis, "hits_stale")
+                    logger.info("Кеш использован [stale]")
+                    future.set_result(result)
+                    return result
+
+                if (value_redis := await cls.__wait_value(key_redis)) is not None:
+                    result = metrics.decode(key_redis, options.serializer, value_redis)
+                    cls.__fill_local(key_redis, value_redis, options)
+                    metrics.incr(key_redis, "hits")
+                    logger.info("Кеш использован [после ожидания лока]")
+                    future.set_result(result)
+                    return result
+
+            result = await cls.launch_function(func, *args, **kwargs)
+            value = options.serializer.dumps(jsonable_encoder(result))
+
+            try:
+                await cls.save_key(
+                    key_redis, value, options.tags, options.time_ttl, options.stale_ttl
+                )
+                metrics.incr(key_redis, "saves")
+                logger.info("Кеш сохранен")
+            except MaxConnectionsError:
+                logger.warning("Пул Redis занят: кеш не сохранен")
+            except _REDIS_DOWN:
+                breaker.failure()
+                logger.error(
+                    "Не удалось сохранить кеш. Отсутствует подключение к Redis"
+                )
+            cls.__fill_local(key_redis, value, options)
+
+            future.set_result(result)
+            return result
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            raise
+
+        finally:
+            inflight.pop(key_redis, None)
+            if is_locked:
+                await cls.__release_lock(lock_key, lock_token)
+
+    @classmethod
+    async def __search_with_stale(
+        cls, key_redis: str, options: _CacheOptions
+    ) -> tuple[bytes | None, bytes | None]:
+        """Значение и (при SWR) прошлое значение за один запрос"""
+        if options.stale_ttl is None:
+            return await cls.search_key(key_redis), None
+
+        value, value_stale = await cls.client().mget(key_redis, f"{key_redis}:stale")
+        return value or None, value_stale or None
+
+    @classmethod
+    async def __wait_value(cls, key_redis: str) -> bytes | None:
+        """Ожидание значения, которое пересчитывает другой воркер (не дольше lease)"""
+        deadline = time.monotonic() + _SettingsRedis.LOCK_LEASE_MS / 1_000
+
+        while time.monotonic() < deadline:
+            await asyncio.sleep(_SettingsRedis.LOCK_POLL_SECONDS)
+            if (value := await cls.search_key(key_redis)) is not None:
+                return value
+        return None
+
+    @classmethod
+    async def __release_lock(cls, lock_key: str, lock_token: str) -> None:
+        """Снимает лок, только если он все еще наш (lease мог истечь)"""
+        try:
+            await cls.script("release_lock")(keys=[lock_key], args=[lock_token])
+        except _REDIS_DOWN:
+            pass  # лок сам истечет через lease
+
+    @classmethod
+    def __inflight_for_loop(cls) -> "dict[str, asyncio.Future[Any]]":
+        """Текущие пересчеты (single-flight) в event loop"""
+        loop = asyncio.get_running_loop()
+
+        if (inflight := cls.__inflight.get(loop)) is None:
+            inflight = cls.__inflight[loop] = {}
+        return inflight
+
+    @staticmethod
+    def __fill_local(key_redis: str, value: bytes, options: _CacheOptions) -> None:
+        """Сохранение значения в L1 (если он включен для декоратора)"""
+        if options.local_ttl is None:
+            return
+
+        local_ttl = options.local_ttl
+        if options.time_ttl != -1:
+            local_ttl = min(local_ttl, options.time_ttl)
+        local_cache.set(key_redis, value, options.tags, local_ttl)
 
 
 @final
@@ -700,19 +1607,31 @@ class _IStatsCache(_RedisService):
     def __new__(cls, *args, **kwargs):
         return object.__new__(cls)
 
-    def all_cache(self, *, is_print=False):
-        all_keys = self.__redis.all_keys()
+    def iter_cache(
+        self, *, batch: int = _SettingsRedis.STATS_SCAN_COUNT
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Потоковый обход ключей Redis: SCAN + чтение значений пачками через пайплайн.
 
-        result: Dict[str, str] = {}
+        Args:
+            batch (int, optional): Размер пачки. Defaults to 500.
 
-        for index, key in enumerate(all_keys, start=1):
-            if key.startswith("icache"):
-                result[index] = {"key": key, "value": self.__redis.search_key(key)}
-            elif key.startswith("tag:"):
-                count = self.__redis.count_tag(key)
-                result[index] = {"tag": key, "count": count}
-            else:
-                warnings.warn(f"Ключ {key} не был распознан")
+        Returns:
+            Iterator[dict[str, Any]]: `{"key", "value"}` для ключей ICache, `{"tag", "count"}` для тегов.
+        """
+        keys: list[str] = []
+
+        for key in self.__redis.scan_keys(count=batch):
+            keys.append(key.decode() if isinstance(key, bytes) else key)
+            if len(keys) >= batch:
+                yield from self.__read_batch(keys)
+                keys = []
+
+        if keys:
+            yield from self.__read_batch(keys)
+
+    def all_cache(self, *, is_print=False):
+        result: Dict[int, dict[str, Any]] = dict(enumerate(self.iter_cache(), start=1))
 
         if is_print:
             text_print: list[str] = ["Ключи Redis: "]
@@ -725,93 +1644,459 @@ class _IStatsCache(_RedisService):
             self.__log.info("\n".join(text_print))
         return result
 
+    async def summary(
+        self, *, samples: int = _SettingsRedis.STATS_MEMORY_SAMPLES
+    ) -> dict[str, Any]:
+        """
+        Сводка по кешу для метрик (без KEYS и без чтения значений).
+
+        По каждому unique_name: число ключей/stale копий/локов, оценка занятой
+        памяти (MEMORY USAGE по выборке из `samples` ключей, умноженная на число
+        ключей) и счетчики воркера (hit/miss/save/invalidate, время декодирования).
+        Redis опрашивается через предохранитель: если он недоступен, отдаются
+        только счетчики воркера, L1 и предохранитель с `degraded=True`.
+
+        Args:
+            samples (int, optional): Размер выборки MEMORY USAGE на unique_name. Defaults to 50.
+
+        Returns:
+            dict[str, Any]: `{"names", "tags", "l1", "breaker", "scanned_keys", "degraded"}`.
+        """
+        names: dict[str, dict[str, Any]] = {}
+        tags: dict[str, int] = {}
+        scanned = 0
+        degraded = True
+
+        if breaker.allow():
+            try:
+                names, tags, scanned = await self.__scan_summary(samples)
+                degraded = False
+                if breaker.success():
+                    await _AsyncRedisService.flush_pending(self.__log)
+            except MaxConnectionsError:
+                self.__log.warning("Пул Redis занят: статистика Redis не собрана")
+            except _REDIS_DOWN:
+                breaker.failure()
+                self.__log.error(
+                    "Статистика Redis недоступна. Отсутствует подключение к Redis"
+                )
+
+        for name, counters in metrics.snapshot().items():
+            names.setdefault(
+                name, {"keys": 0, "stale_keys": 0, "locks": 0, "bytes": 0}
+            ).update(counters)
+
+        return {
+            "names": names,
+            "tags": tags,
+            "l1": local_cache.stats(),
+            "breaker": breaker.stats(),
+            "scanned_keys": scanned,
+            "degraded": degraded,
+        }
+
+    async def __scan_summary(
+        self, samples: int
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, int], int]:
+        """Ключи, теги и память по unique_name (SCAN, см. `summary`)"""
+        client = _AsyncRedisService.client()
+        names: dict[str, dict[str, Any]] = {}
+        sampled: dict[str, list[int]] = {}
+        queued: dict[str, int] = {}
+        scanned = 0
+
+        async def measure(keys: list[tuple[str, bytes]]) -> None:
+            async with client.pipeline(transaction=False) as pipe:
+                for _, key in keys:
+                    pipe.memory_usage(key, samples=0)
+                for (name, _), size in zip(keys, await pipe.execute()):
+                    sampled.setdefault(name, []).append(size or 0)
+
+        pending: list[tuple[str, bytes]] = []
+        async for key in client.scan_iter(
+            match="icache:*", count=_SettingsRedis.STATS_SCAN_COUNT
+        ):
+            scanned += 1
+            if (parsed := _parse_cache_key(key.decode())) is None:
+                continue  # служебные ключи (icache:gc:lock)
+
+            name, kind = parsed
+            elems = names.setdefault(name, {"keys": 0, "stale_keys": 0, "locks": 0})
+            if kind == "lock":
+                elems["locks"] += 1
+                continue
+
+            elems["keys" if kind == "value" else "stale_keys"] += 1
+            if queued.get(name, 0) < samples:
+                queued[name] = queued.get(name, 0) + 1
+                pending.append((name, key))
+            if len(pending) >= _SettingsRedis.STATS_SCAN_COUNT:
+                await measure(pending)
+                pending = []
+
+        if pending:
+            await measure(pending)
+
+        tags: dict[str, int] = {}
+        tag_keys: list[bytes] = []
+
+        async def count(keys: list[bytes]) -> None:
+            async with client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.scard(key)
+                for key, size in zip(keys, await pipe.execute()):
+                    tags[key.decode().removeprefix("tag:")] = size
+
+        async for key in client.scan_iter(
+            match="tag:*", count=_SettingsRedis.STATS_SCAN_COUNT
+        ):
+            scanned += 1
+            tag_keys.append(key)
+            if len(tag_keys) >= _SettingsRedis.STATS_SCAN_COUNT:
+                await count(tag_keys)
+                tag_keys = []
+
+        if tag_keys:
+            await count(tag_keys)
+
+        for name, elems in names.items():
+            sizes = sampled.get(name) or [0]
+            elems["bytes"] = round(
+                sum(sizes) / len(sizes) * (elems["keys"] + elems["stale_keys"])
+            )
+
+        return names, tags, scanned
+
+    def __read_batch(self, keys: list[str]) -> Iterator[dict[str, Any]]:
+        """Значения/размеры тегов пачки ключей одним пайплайном"""
+        pipe = self.__redis.pipeline()
+        for key in keys:
+            if key.startswith("tag:"):
+                pipe.scard(key)
+            else:
+                pipe.get(key)
+
+        for key, value in zip(keys, pipe.execute()):
+            if key.startswith("tag:"):
+                yield {"tag": key, "count": value}
+            elif value is None:
+                continue  # ключ истек между SCAN и GET
+            elif (parsed := _parse_cache_key(key)) is not None and parsed[1] != "lock":
+                try:
+                    value = default_serializer.loads(value)
+                except CacheDecodeError as e:
+                    value = f"ERROR: {e}"
+                yield {"key": key, "value": value}
+            elif key.startswith("icache:"):
+                yield {"key": key, "value": value.decode(errors="replace")}
+            else:
+                warnings.warn(f"Ключ {key} не был распознан")
+
 
 istats = _IStatsCache("STATS")
 
 
+@final
+class _CacheWorker:
+    """
+    Фоновый поток с постоянным event loop для синхронных функций под ICache/IClearCache.
+
+    Клиент redis.asyncio привязан к loop, поэтому синхронные вызовы отправляют
+    корутины кеша в этот loop (один пул соединений на процесс), а не создают
+    поток и loop на каждый вызов. Сама синхронная функция выполняется в пуле
+    потоков loop (`threaded`), чтобы медленная функция не блокировала кеш.
+    """
+
+    __loop: ClassVar[asyncio.AbstractEventLoop | None] = None
+    __thread: ClassVar[threading.Thread | None] = None
+    __lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def run(cls, coro_func: Callable[[], Awaitable[R]]) -> R:
+        """
+        Выполняет корутину в loop воркера и ждет результат.
+
+        Args:
+            coro_func (Callable[[], Awaitable[R]]): Фабрика корутины.
+
+        Returns:
+            R: Результат корутины (исключения пробрасываются).
+        """
+        loop = cls.__ensure_loop()
+
+        if threading.current_thread() is cls.__thread:
+            # синхронная функция под ICache вызвана из самого loop (например из
+            # IParam): ждать себя нельзя, поэтому разовый loop в отдельном потоке
+            async def once() -> R:
+                try:
+                    return await coro_func()
+                finally:
+                    await _AsyncRedisService.close()  # пул разового loop
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(asyncio.run, once()).result()
+
+        return asyncio.run_coroutine_threadsafe(coro_func(), loop).result()
+
+    @staticmethod
+    def threaded(func: Callable[P, R]) -> Callable[P, Awaitable[R]]:
+        """Синхронная функция как корутина, выполняемая в пуле потоков loop"""
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+        return wrapper
+
+    @classmethod
+    def stop(cls) -> None:
+        """Закрывает пул Redis воркера и останавливает loop (для lifespan)"""
+        with cls.__lock:
+            loop, thread = cls.__loop, cls.__thread
+            cls.__loop = cls.__thread = None
+
+        if loop is None or thread is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(_AsyncRedisService.close(), loop).result()
+        asyncio.run_coroutine_threadsafe(
+            loop.shutdown_default_executor(), loop
+        ).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    @classmethod
+    def __ensure_loop(cls) -> asyncio.AbstractEventLoop:
+        """Запуск потока с loop (один на процесс, при первом вызове)"""
+        if (loop := cls.__loop) is not None:
+            return loop
+
+        with cls.__lock:
+            if cls.__loop is None:
+                loop = asyncio.new_event_loop()
+                loop.set_default_executor(
+                    ThreadPoolExecutor(
+                        max_workers=_SettingsRedis.SYNC_WORKERS,
+                        thread_name_prefix="icache-sync",
+                    )
+                )
+                cls.__thread = threading.Thread(
+                    target=loop.run_forever, name="icache-worker", daemon=True
+                )
+                cls.__thread.start()
+                cls.__loop = loop
+            return cls.__loop
+
+
+async def close_cache_connections() -> None:
+    """Закрывает пулы соединений ICache: текущего event loop и воркера sync функций (для lifespan)"""
+    await _AsyncRedisService.close()
+    await asyncio.to_thread(_CacheWorker.stop)
+
+
+async def run_tag_gc(interval: int = _SettingsRedis.TAG_GC_INTERVAL) -> None:
+    """
+    Периодическая сборка мусора в сетах тегов (для lifespan).
+
+    Запускается в каждом воркере, но за интервал работает только один:
+    остальные не получают лок `icache:gc:lock`.
+    """
+    log = _LogInfo("TAG-GC")
+
+    while True:
+        await asyncio.sleep(interval)
+        if not breaker.allow():
+            continue
+
+        try:
+            client = _AsyncRedisService.client()
+            if await client.set("icache:gc:lock", 1, nx=True, ex=interval):
+                removed = await _AsyncRedisService.collect_tags()
+                log.info(f"Удалено ссылок на несуществующие ключи: {removed}")
+            if breaker.success():
+                await _AsyncRedisService.flush_pending(log)
+        except MaxConnectionsError as e:
+            log.warning(f"Сборка мусора тегов отложена: {e!r}")
+        except _REDIS_DOWN as e:
+            breaker.failure()
+            log.warning(f"Сборка мусора тегов не удалась: {e!r}")
+        except redis.RedisError as e:
+            log.warning(f"Сборка мусора тегов не удалась: {e!r}")
+
+
 @runtime_checkable
 class RedisProtocol(Protocol):
     def create_cache_key(): ...
 
 
-class _CacheCommonMixin:
-    @staticmethod
-    def creating_dict_arguments(
-        logger: LoggerProtocol,
-        func: Callable[..., Any],
-        *args: object,
-        **kwargs: object,
-    ) -> Dict[str, Any]:
-        """Метод для парсинга аргументов функции"""
-        if not isinstance(func, Callable):
-            raise TypeError(f"Передаваемый объект {func} должен быть вызываемый")
-
-        if not isinstance(logger, LoggerProtocol):
-            raise TypeError(
-                f"Класс должен иметь методы: {[name for name, _ in getmembers(LoggerProtocol, isfunction) if name != '__subclasshook__']}"
-            )
+@final
+class _KeyPlan:
+    """
+    План генерации ключа кеша для одной функции.
 
-        logger.debug("Парсинг аргументов функции..")
+    Собирается один раз при декорировании: сигнатура, позиции нужных аргументов,
+    подстановки IParam/ICacheWriter и проверки протоколов. На каждый вызов
+    остаются только выборка аргументов, вызовы `functions` и хеш.
+    """
 
-        sig = signature(func)
-        bound = sig.bind(*args, **kwargs)
-        bound.apply_defaults()
-        return dict(bound.arguments)
+    __POSITIONAL: Final[frozenset[Any]] = frozenset(
+        {Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD}
+    )
 
-    @staticmethod
-    async def generate_cache_key(
+    def __init__(
+        self,
         logger: LoggerProtocol,
         unique_name: str,
-        arguments: Dict[str, Any],
+        func: Callable[..., Any],
         functions: Optional[list[Callable[..., Any]]],
         data: Optional[list[Any]],
         redis: RedisProtocol,
-    ) -> str:
+    ) -> None:
         """
-        Генерация ключа для кеша.
-
         Args:
+            logger (LoggerProtocol): Класс для работы с логгером.
             unique_name (str): Уникальное имя сессии.
-            arguments (dict[str, Any]): Все переменные оригинальной функции.
+            func (Callable[..., Any]): Декорируемая функция.
             functions (Optional[list[Callable[..., Any]]]): Все функции переданные в декоратор.
-            data (Optional[list[Any]]): Все данные переданные в функцию для кеша.
+            data (Optional[list[Any]]): Все данные переданные в декоратор для кеша.
             redis (RedisProtocol): Класс для работы с редис.
 
-
         Raises:
-            TypeError: Неверный класс для работы с редис.
-
-        Returns:
-            str: Готовый кеш.
+            TypeError: Невызываемый объект или неверный класс логгера/редис.
         """
+        if not callable(func):
+            raise TypeError(f"Передаваемый объект {func} должен быть вызываемый")
+        if not isinstance(logger, LoggerProtocol):
+            raise TypeError(
+                f"Класс должен иметь методы: {[name for name, _ in getmembers(LoggerProtocol, isfunction) if name != '__subclasshook__']}"
+            )
         if not isinstance(redis, RedisProtocol):
             raise TypeError(
                 f"Класс должен иметь методы: {[name for name, _ in getmembers(RedisProtocol, isfunction) if name != '__subclasshook__']}"
             )
-        if not isinstance(logger, LoggerProtocol):
-            raise TypeError(
-                f"Класс должен иметь методы: {[name for name, _ in getmembers(LoggerProtocol, isfunction) if name != '__subclasshook__']}"
+
+        logger.debug("Сборка плана генерации ключа..")
+
+        self.__unique_name = unique_name
+        self.__redis = redis
+        self.__signature = signature(func)
+
+        parameters = self.__signature.parameters
+        self.__names = frozenset(parameters)
+        used: set[str] = set()
+
+        # WORK:
+        #   -> ICacheWriter (результат попадает в ключ)
+        #   -> IParam / функция (только вызов)
+        self.__operations: list[
+            tuple[bool, Callable[[Dict[str, Any]], Awaitable[Any]]]
+        ] = []
+        for operation in functions or ():
+            if not callable(operation):
+                raise TypeError(f"объект '{operation!r}' не является вызываемым")
+
+            class_marker = getattr(operation, "_class_marker", None)
+            if class_marker in ("__icachewriter__", "__iparam__"):
+                call, names = operation.prepare(self.__names)
+                used |= names
+            else:
+                call = _prepare_plain(operation)
+            self.__operations.append((class_marker == "__icachewriter__", call))
+
+        self.__data = tuple(
+            (isinstance(elem, str) and elem in self.__names, elem)
+            for elem in data or ()
+        )
+        used.update(elem for is_arg, elem in self.__data if is_arg)
+
+        # (имя, позиция, дефолт) только для аргументов, которые участвуют в ключе;
+        # для *args/**kwargs - полный bind на каждый вызов
+        self.__lookups: tuple[tuple[str, int, Any], ...] | None = None
+        self.__max_positional = sum(
+            elem.kind in self.__POSITIONAL for elem in parameters.values()
+        )
+        if all(
+            elem.kind in self.__POSITIONAL or elem.kind == Parameter.KEYWORD_ONLY
+            for elem in parameters.values()
+        ):
+            self.__lookups = tuple(
+                (name, index, elem.default)
+                for index, (name, elem) in enumerate(parameters.items())
+                if name in used
             )
 
-        logger.debug("Генерация ключа..")
+    async def __call__(self, args: tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+        """
+        Ключ для Redis по аргументам вызова.
 
+        Args:
+            args (tuple[Any, ...]): Позиционные аргументы функции.
+            kwargs (Dict[str, Any]): Именованные аргументы функции.
+
+        Raises:
+            TypeError: Аргументы не подходят под сигнатуру функции.
+
+        Returns:
+            str: Готовый ключ.
+        """
+        arguments = self.__arguments(args, kwargs)
         parameters: Dict[str, Any] = {}
 
-        if functions:
-            functions = deepcopy(functions)
+        if self.__operations:
+            func_result: List[Any] = []
+            for is_writer, call in self.__operations:
+                value = await call(arguments)
+                if is_writer:
+                    func_result.append(value)
 
-            if func_result := await _launch_operation(logger, functions, arguments):
+            if func_result:
                 parameters["__ifunc__"] = func_result
 
-        if data:
-            data = deepcopy(data)
+        if self.__data:
+            parameters["__idata__"] = [
+                _pydantic_transformations(arguments[elem]) if is_arg else elem
+                for is_arg, elem in self.__data
+            ]
+
+        return self.__redis.create_cache_key(self.__unique_name, parameters)
+
+    def __arguments(
+        self, args: tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Значения нужных аргументов (с учетом дефолтов)"""
+        if (
+            self.__lookups is None
+            or len(args) > self.__max_positional
+            or not self.__names.issuperset(kwargs)
+        ):
+            return self.__bind(args, kwargs)
+
+        arguments: Dict[str, Any] = {}
+        for name, position, default in self.__lookups:
+            if position < len(args):
+                arguments[name] = args[position]
+            elif name in kwargs:
+                arguments[name] = kwargs[name]
+            elif default is not Parameter.empty:
+                arguments[name] = default
+            else:
+                return self.__bind(args, kwargs)  # нет обязательного аргумента
+        return arguments
+
+    def __bind(self, args: tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Полный разбор аргументов через сигнатуру (TypeError при ошибке)"""
+        bound = self.__signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return dict(bound.arguments)
 
-            if data_result := _substitution_data(logger, data, arguments):
-                parameters["__idata__"] = data_result
 
-        key_redis: str = redis.create_cache_key(unique_name, parameters)
-        # print(f"{parameters} | {key_redis}")
-        return key_redis
+class _CacheCommonMixin:
+    def build_key_plan(self, func: Callable[..., Any]) -> _KeyPlan:
+        """План генерации ключа для декорируемой функции"""
+        return _KeyPlan(
+            self.log, self.unique_name, func, self.functions, self.data, self.redis
+        )
 
 
 @final
@@ -819,7 +2104,7 @@ class IClearCache(_CacheCommonMixin):
     """Декоратор для чистки кеша"""
 
     __loger_name = _LogInfo
-    __redis_name = _RedisService
+    __redis_name = _AsyncRedisService
 
     def __init__(
         self,
@@ -856,49 +2141,22 @@ class IClearCache(_CacheCommonMixin):
 
     def __call__(self, func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
         """Вызов функции"""
+        key_plan = self.build_key_plan(func)
+        # синхронная функция не должна блокировать loop воркера
+        target = func if iscoroutinefunction(func) else _CacheWorker.threaded(func)
 
         @wraps(func)
         async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             self.log.debug("Вызван декоратор чистки кеша..")
-
-            all_arguments: Dict[str, Any] = self.creating_dict_arguments(
-                self.log, func, *args, **kwargs
-            )
-
-            key_redis = await self.generate_cache_key(
-                self.log,
-                self.unique_name,
-                all_arguments,
-                self.functions,
-                self.data,
-                self.redis,
-            )
+            key_redis = await key_plan(args, kwargs)
 
             return await self.redis.clear_cache(
-                self.log, key_redis, self.tags_delete, func, *args, **kwargs
+                self.log, key_redis, self.tags_delete, target, *args, **kwargs
             )
 
         @wraps(func)
         def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            async def async_part():
-                return await async_wrapper(*args, **kwargs)
-
-            try:
-                loop = asyncio.get_running_loop()
-                if loop.is_running():
-                    result = []
-
-                    def thread_target():
-                        result.append(anyio.run(async_part))
-
-                    thread = threading.Thread(target=thread_target)
-                    thread.start()
-                    thread.join()
-                    return result[0]
-                else:
-                    return anyio.run(async_part)
-            except RuntimeError:
-                return anyio.run(async_part)
+            return _CacheWorker.run(lambda: async_wrapper(*args, **kwargs))
 
         return async_wrapper if iscoroutinefunction(func) else sync_wrapper
 
@@ -908,7 +2166,7 @@ class ICache(_CacheCommonMixin):
     """Декоратор для использования кеша"""
 
     __loger_name = _LogInfo
-    __redis_name = _RedisService
+    __redis_name = _AsyncRedisService
 
     def __init__(
         self,
@@ -918,6 +2176,9 @@ class ICache(_CacheCommonMixin):
         functions: Optional[list[Callable[..., Any]]] = None,
         data: Optional[list[Any]] = None,
         time_ttl: int = -1,
+        serializer: CacheSerializer = default_serializer,
+        local_ttl: int | None = None,
+        stale_ttl: int | None = None,
     ) -> None:
         """
         Декоратор для использования кеша. Полностью сохраняет результат и переиспользует.
@@ -928,6 +2189,9 @@ class ICache(_CacheCommonMixin):
             functions (Optional[list[Callable[..., Any]]], optional): Функции для запуска. Defaults to None.
             data (Optional[list[Any]], optional): Данные, которые влияют на итоговый сгенерированный кеш. Defaults to None.
             key_ttl (int, optional): Время жизни кеша. По умолчанию бесконечное. Defaults to -1.
+            serializer (CacheSerializer, optional): Кодек значений кеша. Defaults to orjson без компрессии.
+            local_ttl (int | None, optional): Включает in-process L1 перед Redis с этим TTL (сек). Defaults to None.
+            stale_ttl (int | None, optional): Включает stale-while-revalidate: после удаления/истечения ключа прошлое значение отдается еще столько секунд, пока один воркер пересчитывает. Defaults to None.
 
         Raises:
             ValueError: Неверные входные данные.
@@ -948,55 +2212,52 @@ class ICache(_CacheCommonMixin):
                 f"Время должно быть в пределах {LIMIT_TIME_REDIS!r} > key_ttl > -1"
             )
 
+        if not isinstance(serializer, CacheSerializer):
+            raise TypeError(
+                f"serializer должен быть CacheSerializer, а не {serializer!r}"
+            )
+        self.serializer = serializer
+
+        if local_ttl is not None and local_ttl <= 0:
+            raise ValueError("local_ttl должен быть больше 0")
+        self.local_ttl = local_ttl
+
+        if stale_ttl is not None and not LIMIT_TIME_REDIS > stale_ttl > 0:
+            raise ValueError(
+                f"stale_ttl должен быть в пределах {LIMIT_TIME_REDIS!r} > stale_ttl > 0"
+            )
+        self.stale_ttl = stale_ttl
+
+        self.options = _CacheOptions(
+            tags=self.tags,
+            time_ttl=self.key_ttl,
+            serializer=self.serializer,
+            local_ttl=self.local_ttl,
+            stale_ttl=self.stale_ttl,
+        )
+
         # устанавливаем сессию логера и редис
         self.log = self.__loger_name(unique_name)
         self.redis = self.__redis_name(self.log)
 
     def __call__(self, func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
         """Вызов функции"""
+        key_plan = self.build_key_plan(func)
+        # синхронная функция не должна блокировать loop воркера
+        target = func if iscoroutinefunction(func) else _CacheWorker.threaded(func)
 
         @wraps(func)
         async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             """Декоратор для синхронных и асинхронных функций"""
             self.log.debug("Вызван декоратор создания/использования кеша..")
-
-            all_arguments: Dict[str, Any] = self.creating_dict_arguments(
-                self.log, func, *args, **kwargs
-            )
-
-            key_redis = await self.generate_cache_key(
-                self.log,
-                self.unique_name,
-                all_arguments,
-                self.functions,
-                self.data,
-                self.redis,
-            )
+            key_redis = await key_plan(args, kwargs)
 
             return await self.redis.using_cache(
-                self.log, key_redis, func, self.tags, self.key_ttl, *args, **kwargs
+                self.log, key_redis, target, self.options, *args, **kwargs
             )
 
         @wraps(func)
         def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            async def async_part():
-                return await async_wrapper(*args, **kwargs)
-
-            try:
-                loop = asyncio.get_running_loop()
-                if loop.is_running():
-                    result = []
-
-                    def thread_target():
-                        result.append(anyio.run(async_part))
-
-                    thread = threading.Thread(target=thread_target)
-                    thread.start()
-                    thread.join()
-                    return result[0]
-                else:
-                    return anyio.run(async_part)
-            except RuntimeError:
-                return anyio.run(async_part)
+            return _CacheWorker.run(lambda: async_wrapper(*args, **kwargs))
 
         return async_wrapper if iscoroutinefunction(func) else sync_wrapper
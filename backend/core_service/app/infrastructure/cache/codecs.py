@@ -0,0 +1,285 @@
+"""
+name: ICache codecs
+v: v1.0
+
+Бинарные кодеки значений кеша. Формат значения в Redis:
+
+    [1 байт заголовка][payload]
+
+Заголовок: старший бит - маркер формата v1, биты 4-6 - id кодека (1..7),
+младшие 4 бита - id компрессии. Старые значения (`str(dict)`) начинаются с
+печатного ASCII и маркера не имеют, поэтому считаются промахом.
+Декодирование идет по заголовку, поэтому смена кодека/компрессии не требует
+чистки Redis: старые значения читаются своим кодеком, пока он зарегистрирован.
+"""
+
+import json
+from typing import Any, Final, Literal, Protocol, TypeAlias, final, runtime_checkable
+
+import orjson
+
+try:  # опциональные зависимости
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+CompressionName: TypeAlias = Literal["zstd", "lz4"]
+
+FORMAT_V1: Final[int] = 0x80
+NO_COMPRESSION: Final[int] = 0
+DEFAULT_COMPRESS_THRESHOLD: Final[int] = 1_024  # байт
+
+
+class CacheDecodeError(ValueError):
+    """Значение кеша не удалось раскодировать (битое/неизвестный формат)"""
+
+
+@runtime_checkable
+class CodecProtocol(Protocol):
+    codec_id: int
+
+    def encode(self, value: Any) -> bytes: ...
+    def decode(self, data: bytes) -> Any: ...
+
+
+@runtime_checkable
+class CompressorProtocol(Protocol):
+    compression_id: int
+
+    def compress(self, data: bytes) -> bytes: ...
+    def decompress(self, data: bytes) -> bytes: ...
+
+
+@final
+class JsonCodec:
+    """Кодек на стандартном json (медленный, без зависимостей)"""
+
+    codec_id: Final[int] = 1
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+@final
+class OrjsonCodec:
+    """Кодек на orjson (по умолчанию)"""
+
+    codec_id: Final[int] = 2
+
+    def encode(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def decode(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+@final
+class MsgpackCodec:
+    """Кодек на msgpack (нужен пакет `msgpack`)"""
+
+    codec_id: Final[int] = 3
+
+    def __init__(self) -> None:
+        if msgpack is None:
+            raise ImportError("Для MsgpackCodec установите пакет 'msgpack'")
+
+    def encode(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+
+@final
+class ZstdCompressor:
+    """Компрессия zstd (нужен пакет `zstandard`)"""
+
+    compression_id: Final[int] = 1
+
+    def __init__(self, level: int = 3) -> None:
+        if zstandard is None:
+            raise ImportError("Для компрессии zstd установите пакет 'zstandard'")
+        self.__compressor = zstandard.ZstdCompressor(level=level)
+        self.__decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self.__compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self.__decompressor.decompress(data)
+
+
+@final
+class Lz4Compressor:
+    """Компрессия lz4 (нужен пакет `lz4`)"""
+
+    compression_id: Final[int] = 2
+
+    def __init__(self, level: int = 0) -> None:
+        if lz4_frame is None:
+            raise ImportError("Для компрессии lz4 установите пакет 'lz4'")
+        self.__level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return lz4_frame.compress(data, compression_level=self.__level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return lz4_frame.decompress(data)
+
+
+def _available_codecs() -> dict[int, CodecProtocol]:
+    """Все кодеки, которые можно создать в текущем окружении"""
+    codecs: list[CodecProtocol] = [JsonCodec(), OrjsonCodec()]
+    if msgpack is not None:
+        codecs.append(MsgpackCodec())
+    return {codec.codec_id: codec for codec in codecs}
+
+
+def _available_compressors() -> dict[int, CompressorProtocol]:
+    """Все компрессоры, которые можно создать в текущем окружении"""
+    compressors: list[CompressorProtocol] = []
+    if zstandard is not None:
+        compressors.append(ZstdCompressor())
+    if lz4_frame is not None:
+        compressors.append(Lz4Compressor())
+    return {elem.compression_id: elem for elem in compressors}
+
+
+_COMPRESSORS_BY_NAME: Final[dict[str, type[CompressorProtocol]]] = {
+    "zstd": ZstdCompressor,
+    "lz4": Lz4Compressor,
+}
+
+
+@final
+class CacheSerializer:
+    """
+    Сериализатор значений кеша: кодек + опциональная компрессия + заголовок.
+
+    Пример:
+    ```python
+    @ICache(
+        unique_name="event-cache",
+        serializer=CacheSerializer(MsgpackCodec(), compression="zstd"),
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        codec: CodecProtocol | None = None,
+        *,
+        compression: CompressionName | None = None,
+        compress_threshold: int = DEFAULT_COMPRESS_THRESHOLD,
+    ) -> None:
+        """
+        Args:
+            codec (CodecProtocol, optional): Кодек значения. Defaults to OrjsonCodec().
+            compression (Literal["zstd", "lz4"], optional): Компрессия. Defaults to None.
+            compress_threshold (int, optional): Сжимать только payload больше этого размера (байт). Defaults to 1024.
+
+        Raises:
+            TypeError: Кодек не соответствует протоколу.
+            ValueError: Неверные входные данные.
+            ImportError: Не установлен пакет для кодека/компрессии.
+        """
+        self.codec = codec if codec is not None else OrjsonCodec()
+        if not isinstance(self.codec, CodecProtocol):
+            raise TypeError(f"Кодек {self.codec!r} должен иметь encode/decode")
+        if not 0 < self.codec.codec_id < 8:
+            raise ValueError("codec_id должен быть в пределах 1..7")
+
+        if compression is not None and compression not in _COMPRESSORS_BY_NAME:
+            raise ValueError(f"Неизвестная компрессия {compression!r}")
+        self.compressor = (
+            _COMPRESSORS_BY_NAME[compression]() if compression is not None else None
+        )
+
+        if compress_threshold < 0:
+            raise ValueError("compress_threshold не может быть отрицательным")
+        self.compress_threshold = compress_threshold
+
+        # для чтения значений, записанных другими кодеками/компрессией
+        self.__codecs = _available_codecs() | {self.codec.codec_id: self.codec}
+        self.__compressors = _available_compressors()
+        if self.compressor is not None:
+            self.__compressors[self.compressor.compression_id] = self.compressor
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Кодирует значение для записи в Redis.
+
+        Args:
+            value (Any): json-совместимые данные.
+
+        Returns:
+            bytes: Заголовок + payload.
+        """
+        payload = self.codec.encode(value)
+        compression_id = NO_COMPRESSION
+
+        if self.compressor is not None and len(payload) > self.compress_threshold:
+            payload = self.compressor.compress(payload)
+            compression_id = self.compressor.compression_id
+
+        header = FORMAT_V1 | (self.codec.codec_id << 4) | compression_id
+        return bytes((header,)) + payload
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Декодирует значение из Redis.
+
+        Args:
+            data (bytes): Заголовок + payload.
+
+        Raises:
+            CacheDecodeError: Неизвестный формат или битые данные.
+
+        Returns:
+            Any: Исходные данные.
+        """
+        if not data:
+            raise CacheDecodeError("Пустое значение кеша")
+
+        header = data[0]
+        if not header & FORMAT_V1:
+            raise CacheDecodeError("Значение кеша в устаревшем формате")
+
+        codec = self.__codecs.get((header >> 4) & 0x07)
+        compression_id = header & 0x0F
+
+        if codec is None:
+            raise CacheDecodeError(f"Неизвестный кодек в заголовке {header:#04x}")
+
+        payload = data[1:]
+        try:
+            if compression_id != NO_COMPRESSION:
+                if (compressor := self.__compressors.get(compression_id)) is None:
+                    raise CacheDecodeError(
+                        f"Неизвестная компрессия в заголовке {header:#04x}"
+                    )
+                payload = compressor.decompress(payload)
+            return codec.decode(payload)
+        except CacheDecodeError:
+            raise
+        except Exception as e:
+            raise CacheDecodeError(f"Битое значение кеша: {e}") from None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(codec={self.codec.__class__.__name__}, compressor={self.compressor.__class__.__name__ if self.compressor else None})"
+
+
+default_serializer = CacheSerializer()
@@ -0,0 +1,137 @@
+"""
+name: ICache L1
+v: v1.0
+
+In-process кеш (L1) перед Redis. Хранит закодированные значения (bytes),
+поэтому каждый хит получает свою копию данных, а бюджет считается точно.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+import time
+from typing import Final, Iterable, final
+
+DEFAULT_MAX_BYTES: Final[int] = 64 * 1024 * 1024
+
+
+@dataclass(slots=True)
+class _LocalEntry:
+    value: bytes
+    expires_at: float
+    tags: tuple[str, ...]
+
+
+@final
+class LocalCache:
+    """
+    LRU кеш с бюджетом по байтам и TTL на каждую запись.
+
+    Кеш отдает значения только когда `active=True`: флаг выставляет слушатель
+    инвалидаций (pub/sub). Пока слушатель не подписан, сообщения об удалении
+    могут теряться, поэтому L1 выключен и пуст.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes должен быть больше 0")
+
+        self.max_bytes = max_bytes
+        self.active = False
+        self.__entries: OrderedDict[str, _LocalEntry] = OrderedDict()
+        self.__tags: dict[str, set[str]] = {}
+        self.__size = 0
+        self.__lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Значение по ключу (или `None`, если его нет/истек TTL).
+
+        Args:
+            key (str): Кеш-ключ.
+
+        Returns:
+            bytes | None: Закодированное значение.
+        """
+        if not self.active:
+            return None
+
+        with self.__lock:
+            if (entry := self.__entries.get(key)) is None:
+                return None
+
+            if entry.expires_at <= time.monotonic():
+                self.__remove(key)
+                return None
+
+            self.__entries.move_to_end(key)
+            return entry.value
+
+    def set(self, key: str, value: bytes, tags: Iterable[str], ttl: float) -> None:
+        """
+        Сохранение значения.
+
+        Args:
+            key (str): Кеш-ключ.
+            value (bytes): Закодированное значение.
+            tags (Iterable[str]): Теги ключа (для инвалидации).
+            ttl (float): Время жизни записи в секундах.
+        """
+        if not self.active or ttl <= 0 or len(value) > self.max_bytes:
+            return
+
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key)
+
+            entry = _LocalEntry(value, time.monotonic() + ttl, tuple(tags))
+            self.__entries[key] = entry
+            self.__size += len(value)
+            for tag in entry.tags:
+                self.__tags.setdefault(tag, set()).add(key)
+
+            while self.__size > self.max_bytes:
+                self.__remove(next(iter(self.__entries)))
+
+    def invalidate_keys(self, keys: Iterable[str]) -> None:
+        """Удаление записей по ключам"""
+        with self.__lock:
+            for key in keys:
+                if key in self.__entries:
+                    self.__remove(key)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Удаление всех записей с указанными тегами"""
+        with self.__lock:
+            for tag in tags:
+                for key in self.__tags.pop(tag, ()):
+                    if key in self.__entries:
+                        self.__remove(key)
+
+    def clear(self) -> None:
+        """Полная очистка"""
+        with self.__lock:
+            self.__entries.clear()
+            self.__tags.clear()
+            self.__size = 0
+
+    def stats(self) -> dict[str, int]:
+        """Количество записей и занятые байты"""
+        return {
+            "entries": len(self.__entries),
+            "bytes": self.__size,
+            "max_bytes": self.max_bytes,
+        }
+
+    def __remove(self, key: str) -> None:
+        """Удаление записи (вызывать под локом)"""
+        entry = self.__entries.pop(key)
+        self.__size -= len(entry.value)
+        for tag in entry.tags:
+            if (keys := self.__tags.get(tag)) is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.__tags[tag]
+
+    def __len__(self) -> int:
+        return len(self.__entries)
@@ -0,0 +1,88 @@
+"""
+Релей transactional outbox в RabbitMQ.
+
+Сервисы не публикуют в RabbitMQ из запроса: сообщение пишется в таблицу
+outbox в одной транзакции с изменением (crud, параметр `notify`), поэтому
+без коммита нет письма, а после коммита оно не теряется. Релей захватывает
+пачки в порядке записи (аренда `claimed_until`, см. `claim_outbox_batch`),
+публикует их с подтверждением брокера и удаляет подтвержденные строки.
+Неподтвержденные остаются и захватываются снова после истечения аренды.
+
+Доставка "хотя бы один раз": если релей упадет между подтверждением и
+удалением или не уложится в аренду, сообщение уйдет повторно. message_id
+в RabbitMQ - это outbox.id, по нему консьюмер отбрасывает повторы.
+"""
+
+import asyncio
+
+from aio_pika.exceptions import AMQPError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.logger import logger_api
+from infrastructure.messaging.producer import RabbitProducer
+from models.crud import claim_outbox_batch, delete_outbox
+
+
+async def relay_outbox(
+    session_factory: async_sessionmaker[AsyncSession],
+    producer: RabbitProducer,
+    batch: int,
+    lease: float,
+) -> int:
+    """
+    Один проход релея: пачка из outbox в RabbitMQ.
+
+    Args:
+        session_factory (async_sessionmaker[AsyncSession]): Фабрика сессий.
+        producer (RabbitProducer): Продюсер RabbitMQ.
+        batch (int): Сообщений за проход.
+        lease (float): Аренда пачки (сек), больше времени публикации.
+
+    Returns:
+        int: Сколько сообщений подтверждено брокером и удалено из outbox.
+    """
+    async with session_factory() as db:
+        messages = await claim_outbox_batch(db, batch, lease)
+        if not messages:
+            return 0
+
+        confirmed = await producer.publish_confirmed(
+            [
+                (message.queue, message.body.encode(), str(message.id))
+                for message in messages
+            ]
+        )
+        await delete_outbox(db, [int(message_id) for message_id in confirmed])
+        await db.commit()
+
+    if len(confirmed) < len(messages):
+        logger_api.warning(
+            f"Брокер не подтвердил {len(messages) - len(confirmed)} сообщений outbox"
+        )
+    return len(confirmed)
+
+
+async def run_outbox_relay(
+    session_factory: async_sessionmaker[AsyncSession],
+    producer: RabbitProducer,
+    interval: float,
+    batch: int,
+    lease: float,
+) -> None:
+    """
+    Отправка outbox в RabbitMQ (для lifespan).
+
+    Запускается в каждом воркере: пачка захватывается арендой, поэтому релеи
+    не отправляют одно сообщение одновременно (и на SQLite, и на Postgres).
+    Пока outbox отдает полные пачки, релей не спит.
+    """
+    while True:
+        try:
+            sent = await relay_outbox(session_factory, producer, batch, lease)
+        except (SQLAlchemyError, AMQPError, ConnectionError) as e:
+            logger_api.warning(f"Отправка outbox не удалась: {e!r}")
+            sent = 0
+
+        if sent < batch:
+            await asyncio.sleep(interval)
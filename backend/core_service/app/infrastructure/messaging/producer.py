@@ -1,4 +1,4 @@
-from asyncio import Lock
+from asyncio import Lock, gather
 import json
 
 from aio_pika import DeliveryMode, Message, connect_robust
@@ -23,7 +23,10 @@ class RabbitProducer:
                     *self.__args_to_connect,
                     **self.__kwargs_to_connect,
                 )
-                self.__channel_rabbit = await self.__connect_rabbit.channel()
+                # publish ждет подтверждения брокера (publisher confirms)
+                self.__channel_rabbit = await self.__connect_rabbit.channel(
+                    publisher_confirms=True
+                )
             except AMQPConnectionError:
                 raise ConnectionError(
                     "Произошла ошибка соединения с RabbitMQ. Наверное, сервер не включен."
@@ -33,6 +36,53 @@ class RabbitProducer:
         """Закрыть соединение с Rabbit"""
         await self.__connect_rabbit.close()
 
+    async def publish_confirmed(
+        self, messages: list[tuple[str, bytes, str]]
+    ) -> list[str]:
+        """
+        Отправка пачки сообщений с подтверждением брокера (для релея outbox).
+
+        Сообщения публикуются разом, подтверждения ждутся параллельно.
+
+        Args:
+            messages (list[tuple[str, bytes, str]]): `(очередь, тело, message_id)`.
+
+        Returns:
+            list[str]: message_id сообщений, которые брокер подтвердил.
+        """
+        if self.__connect_rabbit is None or self.__channel_rabbit is None:
+            raise ConnectionError(
+                "Ошибка. Подключитесь к RabbitMQ через метод connect()"
+            ) from None
+
+        if self.__connect_rabbit.is_closed or self.__channel_rabbit.is_closed:
+            await self.connect()
+
+        for queue_name in {queue_name for queue_name, _, _ in messages}:
+            await self.__channel_rabbit.declare_queue(queue_name, durable=True)
+
+        exchange = self.__channel_rabbit.default_exchange
+        confirmed = await gather(
+            *(
+                exchange.publish(
+                    Message(
+                        body,
+                        delivery_mode=DeliveryMode.PERSISTENT,
+                        message_id=message_id,
+                        content_type="application/json",
+                    ),
+                    routing_key=queue_name,
+                )
+                for queue_name, body, message_id in messages
+            ),
+            return_exceptions=True,
+        )
+        return [
+            message_id
+            for (_, _, message_id), result in zip(messages, confirmed)
+            if not isinstance(result, BaseException)
+        ]
+
     async def add_to_queue(
         self,
         queue_name: str,
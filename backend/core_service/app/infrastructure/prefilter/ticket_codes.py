@@ -0,0 +1,115 @@
+"""
+Префильтр кодов билетов старого формата (Bloom filter) в памяти воркера.
+
+Новые коды подписаны (security/hmac.py) и поддельные отсекаются без БД. Коды
+старого формата `TKT.<payload>.<signature>` подписи не несут, поэтому любой
+код такого вида уходил в БД. Фильтр строится при старте из таблицы tickets:
+"точно нет" отвечает без БД, "возможно есть" проверяет БД.
+
+Старые коды больше не выпускаются, поэтому фильтр не нужно пополнять (и
+синхронизировать между воркерами). Удаленные билеты остаются в фильтре: Bloom
+не удаляет, это только ложные срабатывания, отказ все равно даст БД.
+"""
+
+import hashlib
+import math
+from typing import Final, Iterator, final
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.logger import logger_api
+from models.crud import count_legacy_ticket_codes, stream_legacy_ticket_codes
+
+_LN2: Final[float] = math.log(2)
+
+
+@final
+class BloomFilter:
+    """
+    Bloom filter строк: без ложных отказов, с долей ложных срабатываний ~`fp_rate`.
+
+    Позиции - двойное хеширование одного blake2b (128 бит): `h1 + i * h2`.
+    """
+
+    def __init__(self, capacity: int, fp_rate: float) -> None:
+        if not 0 < fp_rate < 1:
+            raise ValueError("fp_rate должен быть в (0, 1)")
+
+        capacity = max(capacity, 1)
+        self.size = max(8, math.ceil(-capacity * math.log(fp_rate) / _LN2**2))
+        self.hashes = max(1, round(self.size / capacity * _LN2))
+        self.__bits = bytearray((self.size + 7) // 8)
+
+        self.items = 0
+        self.checks = 0
+        self.rejected = 0  # ответов "точно нет" (БД не трогали)
+        self.false_positives = 0  # "возможно есть", но в БД нет
+
+    def __positions(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str) -> None:
+        for position in self.__positions(key):
+            self.__bits[position >> 3] |= 1 << (position & 7)
+        self.items += 1
+
+    def might_contain(self, key: str) -> bool:
+        """False - ключа точно нет, True - возможно есть"""
+        self.checks += 1
+        if all(
+            self.__bits[position >> 3] & (1 << (position & 7))
+            for position in self.__positions(key)
+        ):
+            return True
+        self.rejected += 1
+        return False
+
+    def false_positive(self) -> None:
+        """Отметка ложного срабатывания (ключ прошел фильтр, но его нет)"""
+        self.false_positives += 1
+
+    def stats(self) -> dict[str, float]:
+        """Память, ожидаемая и наблюдаемая доля ложных срабатываний"""
+        passed = self.checks - self.rejected
+        return {
+            "items": self.items,
+            "bits": self.size,
+            "hashes": self.hashes,
+            "bytes": len(self.__bits),
+            "expected_fp_rate": (1 - math.exp(-self.hashes * self.items / self.size))
+            ** self.hashes,
+            "checks": self.checks,
+            "rejected": self.rejected,
+            "false_positives": self.false_positives,
+            "observed_fp_rate": self.false_positives / passed if passed else 0.0,
+        }
+
+
+async def build_legacy_code_filter(
+    session_factory: async_sessionmaker[AsyncSession], fp_rate: float, chunk: int
+) -> BloomFilter:
+    """
+    Фильтр кодов билетов старого формата из БД (для lifespan).
+
+    Args:
+        session_factory (async_sessionmaker[AsyncSession]): Фабрика сессий.
+        fp_rate (float): Целевая доля ложных срабатываний.
+        chunk (int): Кодов за одно чтение.
+
+    Returns:
+        BloomFilter: Заполненный фильтр.
+    """
+    async with session_factory() as db:
+        capacity = await count_legacy_ticket_codes(db)
+
+    code_filter = BloomFilter(capacity, fp_rate)
+    async for codes in stream_legacy_ticket_codes(session_factory, chunk):
+        for code in codes:
+            code_filter.add(code)
+
+    logger_api.info(f"Префильтр кодов билетов построен: {code_filter.stats()}")
+    return code_filter
@@ -0,0 +1,37 @@
+"""
+Периодическая сверка счетчиков ticket_types (sold_count/used_count).
+
+Счетчики меняются в одной транзакции с покупкой, активацией и удалением
+билета, поэтому расхождение - это баг или ручная правка БД. Сверка его
+исправляет и пишет в лог, чтобы причину можно было найти.
+"""
+
+import asyncio
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.logger import logger_api
+from models.crud import reconcile_ticket_stats
+
+
+async def run_ticket_stats_reconciler(
+    session_factory: async_sessionmaker[AsyncSession], interval: float
+) -> None:
+    """
+    Периодическая сверка счетчиков с таблицей tickets (для lifespan).
+
+    Запускается в каждом воркере: тип пересчитывается под блокировкой строки,
+    поэтому параллельные проходы результат не портят.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with session_factory() as db:
+                fixed = await reconcile_ticket_stats(db)
+        except SQLAlchemyError as e:
+            logger_api.warning(f"Сверка счетчиков билетов не удалась: {e!r}")
+            continue
+
+        for mismatch in fixed:
+            logger_api.error(f"Счетчики типа билета исправлены: {mismatch}")
@@ -0,0 +1,332 @@
+"""
+Временные брони билетов (hold) в Redis.
+
+Бронь держит места типа билета `HOLD_TTL_SECONDS`; подтверждение превращает
+бронь в билеты (в БД попадают только подтвержденные покупки), истекшие брони
+возвращает reaper. Все данные в Redis, поэтому брони переживают рестарт воркеров.
+
+Брони - best-effort, а не гарантия места. Скрипт `hold` сверяется с остатком
+из БД, прочитанным до него, а прямая покупка вычитает `held()`, прочитанный до
+своего UPDATE; эти шаги не атомарны друг с другом. Бронь, созданная между
+ними, может оказаться сверх остатка, и ее подтверждение упадет с
+TicketLimitError (бронь при этом остается до истечения или отмены).
+Перепродажи нет в любом случае: остаток проверяет UPDATE в БД.
+
+Структура:
+    hold:expiry          ZSET  hold_id -> время истечения (мс, часы Redis)
+    hold:{hold_id}       HASH  user_id, event_id, ticket_type_id, count
+    hold:held:{type_id}  INT   сколько мест типа сейчас в бронях
+"""
+
+import asyncio
+from dataclasses import dataclass
+import secrets
+from typing import Final, Iterable, Literal, final
+
+import redis.asyncio as redis
+
+from core.logger import logger_api
+
+REAP_BATCH: Final[int] = 500  # истекших броней за один проход скрипта
+
+# общая часть скриптов: время Redis и возврат истекших броней
+_LUA_REAP: Final[str] = """
+    local function now_ms()
+        local t = redis.call('TIME')
+        return tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+    end
+
+    local function reap(limit)
+        local expired = redis.call(
+            'ZRANGEBYSCORE', 'hold:expiry', '-inf', now_ms(), 'LIMIT', 0, limit
+        )
+        for _, id in ipairs(expired) do
+            local hold = redis.call('HMGET', 'hold:' .. id, 'ticket_type_id', 'count')
+            if hold[1] then
+                redis.call('DECRBY', 'hold:held:' .. hold[1], hold[2])
+            end
+            redis.call('DEL', 'hold:' .. id)
+            redis.call('ZREM', 'hold:expiry', id)
+        end
+        return #expired
+    end
+"""
+
+_LUA_SCRIPTS: Final[dict[str, str]] = {
+    # ARGV[1] - размер пачки
+    "reap": _LUA_REAP + "return reap(ARGV[1])",
+    # ARGV: hold_id, user_id, event_id, ticket_type_id, count, остаток в БД,
+    # TTL (мс), размер пачки reap. Вернет время истечения (мс) или 0 (мест нет).
+    "hold": _LUA_REAP
+    + """
+        reap(ARGV[8])
+        local held_key = 'hold:held:' .. ARGV[4]
+        local held = tonumber(redis.call('GET', held_key) or '0')
+        if held + tonumber(ARGV[5]) > tonumber(ARGV[6]) then
+            return 0
+        end
+
+        local expires_at = now_ms() + tonumber(ARGV[7])
+        redis.call('INCRBY', held_key, ARGV[5])
+        redis.call(
+            'HSET', 'hold:' .. ARGV[1], 'user_id', ARGV[2], 'event_id', ARGV[3],
+            'ticket_type_id', ARGV[4], 'count', ARGV[5]
+        )
+        redis.call('ZADD', 'hold:expiry', expires_at, ARGV[1])
+        return expires_at
+    """,
+    # ARGV: hold_id, user_id. Помечает живую бронь владельца как подтверждаемую
+    # (места остаются в брони до покупки) и возвращает
+    # {event_id, ticket_type_id, count, expires_at}; 0 - нет/истекла/уже
+    # подтверждается, -1 - чужая.
+    "begin_confirm": _LUA_REAP
+    + """
+        local score = redis.call('ZSCORE', 'hold:expiry', ARGV[1])
+        if not score or tonumber(score) <= now_ms() then
+            return 0
+        end
+
+        local hold = redis.call(
+            'HMGET', 'hold:' .. ARGV[1],
+            'user_id', 'event_id', 'ticket_type_id', 'count'
+        )
+        if hold[1] ~= ARGV[2] then
+            return -1
+        end
+        if redis.call('HSETNX', 'hold:' .. ARGV[1], 'confirming', 1) == 0 then
+            return 0
+        end
+        return {hold[2], hold[3], hold[4], score}
+    """,
+    # ARGV: hold_id, user_id. Снимает живую бронь владельца и возвращает
+    # {event_id, ticket_type_id, count, expires_at}; 0 - нет/истекла, -1 - чужая.
+    "claim": _LUA_REAP
+    + """
+        local score = redis.call('ZSCORE', 'hold:expiry', ARGV[1])
+        if not score or tonumber(score) <= now_ms() then
+            return 0
+        end
+
+        local hold = redis.call(
+            'HMGET', 'hold:' .. ARGV[1],
+            'user_id', 'event_id', 'ticket_type_id', 'count'
+        )
+        if hold[1] ~= ARGV[2] then
+            return -1
+        end
+
+        redis.call('DECRBY', 'hold:held:' .. hold[3], hold[4])
+        redis.call('DEL', 'hold:' .. ARGV[1])
+        redis.call('ZREM', 'hold:expiry', ARGV[1])
+        return {hold[2], hold[3], hold[4], score}
+    """,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Hold:
+    """Бронь мест одного типа билета"""
+
+    hold_id: str
+    user_id: int
+    event_id: int
+    ticket_type_id: int
+    count: int
+    expires_at: float  # unix time (сек)
+
+
+@final
+class TicketHolds:
+    """Брони билетов поверх asyncio клиента Redis (один на приложение)"""
+
+    def __init__(self, client: redis.Redis, ttl: float) -> None:
+        """
+        Args:
+            client (redis.Redis): Клиент Redis.
+            ttl (float): Время жизни брони (сек).
+
+        Raises:
+            ValueError: Неверные входные данные.
+        """
+        if ttl <= 0:
+            raise ValueError("ttl должен быть больше 0")
+
+        self.ttl = ttl
+        self.__client = client
+        self.__scripts = {
+            name: client.register_script(script)
+            for name, script in _LUA_SCRIPTS.items()
+        }
+
+    async def hold(
+        self,
+        user_id: int,
+        event_id: int,
+        ticket_type_id: int,
+        count: int,
+        remaining: int,
+    ) -> Hold | None:
+        """
+        Бронирование мест.
+
+        Args:
+            user_id (int): ID покупателя.
+            event_id (int): ID мероприятия.
+            ticket_type_id (int): ID типа билета.
+            count (int): Количество мест.
+            remaining (int): Непроданный остаток типа в БД (может устареть к
+                моменту скрипта, см. docstring модуля).
+
+        Returns:
+            Hold | None: Бронь или None, если свободных (не в бронях) мест не хватает.
+        """
+        hold_id = secrets.token_urlsafe(16)
+        expires_at = await self.__scripts["hold"](
+            args=[
+                hold_id,
+                user_id,
+                event_id,
+                ticket_type_id,
+                count,
+                remaining,
+                int(self.ttl * 1000),
+                REAP_BATCH,
+            ]
+        )
+        if not expires_at:
+            return None
+
+        return Hold(
+            hold_id, user_id, event_id, ticket_type_id, count, int(expires_at) / 1000
+        )
+
+    async def claim(
+        self, hold_id: str, user_id: int
+    ) -> Hold | Literal["missing", "forbidden"]:
+        """
+        Снятие брони для подтверждения/отмены.
+
+        Бронь снимается атомарно: два параллельных подтверждения не получат ее оба.
+
+        Args:
+            hold_id (str): ID брони.
+            user_id (int): ID пользователя (только владелец может снять бронь).
+
+        Returns:
+            Hold | Literal["missing", "forbidden"]: Снятая бронь, "missing" (нет/истекла) или "forbidden" (чужая).
+        """
+        result = await self.__scripts["claim"](args=[hold_id, user_id])
+        if result == 0:
+            return "missing"
+        if result == -1:
+            return "forbidden"
+
+        return self.__to_hold(hold_id, user_id, result)
+
+    async def begin_confirm(
+        self, hold_id: str, user_id: int
+    ) -> Hold | Literal["missing", "forbidden"]:
+        """
+        Начало подтверждения брони.
+
+        Бронь остается (места не видны другим покупателям), пока покупка не
+        закоммичена: затем `finish_confirm`, при ошибке покупки - `cancel_confirm`.
+        Второе параллельное подтверждение получит "missing".
+
+        Args:
+            hold_id (str): ID брони.
+            user_id (int): ID пользователя (только владелец может подтвердить бронь).
+
+        Returns:
+            Hold | Literal["missing", "forbidden"]: Бронь, "missing" (нет/истекла/уже подтверждается) или "forbidden" (чужая).
+        """
+        result = await self.__scripts["begin_confirm"](args=[hold_id, user_id])
+        if result == 0:
+            return "missing"
+        if result == -1:
+            return "forbidden"
+
+        return self.__to_hold(hold_id, user_id, result)
+
+    async def finish_confirm(self, hold: Hold) -> None:
+        """
+        Снятие брони после коммита покупки (места уже проданы в БД).
+
+        Redis недоступен - бронь вернет reaper по истечении, покупка не отменяется.
+        """
+        try:
+            await self.claim(hold.hold_id, hold.user_id)
+        except redis.RedisError as e:
+            logger_api.warning(f"Бронь {hold.hold_id} не снята после покупки: {e!r}")
+
+    async def cancel_confirm(self, hold: Hold) -> None:
+        """
+        Отмена подтверждения: покупка не удалась, бронь остается у владельца.
+
+        Redis недоступен - бронь остается подтверждаемой до истечения.
+        """
+        try:
+            await self.__client.hdel(f"hold:{hold.hold_id}", "confirming")
+        except redis.RedisError as e:
+            logger_api.warning(f"Бронь {hold.hold_id} не возвращена: {e!r}")
+
+    @staticmethod
+    def __to_hold(hold_id: str, user_id: int, result: list[str]) -> Hold:
+        """Бронь из ответа скриптов claim/begin_confirm"""
+        event_id, ticket_type_id, count, expires_at = result
+        return Hold(
+            hold_id,
+            user_id,
+            int(event_id),
+            int(ticket_type_id),
+            int(count),
+            float(expires_at) / 1000,
+        )
+
+    async def held(self, ticket_type_ids: Iterable[int]) -> dict[int, int]:
+        """
+        Сколько мест типов сейчас в бронях.
+
+        Прямая покупка вычитает их из остатка. Значение не блокируется до
+        UPDATE покупки: бронь, созданная между ними, не учтется (best-effort).
+        Redis недоступен - брони не учитываются (продажа не останавливается,
+        перепродажи в БД все равно нет).
+
+        Args:
+            ticket_type_ids (Iterable[int]): ID типов билета.
+
+        Returns:
+            dict[int, int]: `{ticket_type_id: мест в бронях}`.
+        """
+        ids = list(ticket_type_ids)
+        try:
+            values = await self.__client.mget([f"hold:held:{elem}" for elem in ids])
+        except redis.RedisError as e:
+            logger_api.warning(f"Брони не учтены, Redis недоступен: {e!r}")
+            return {}
+        return {elem: max(int(value or 0), 0) for elem, value in zip(ids, values)}
+
+    async def reap(self, limit: int = REAP_BATCH) -> int:
+        """Возврат мест истекших броней (вернет количество снятых броней)"""
+        return int(await self.__scripts["reap"](args=[limit]))
+
+
+async def run_hold_reaper(holds: TicketHolds, interval: float) -> None:
+    """
+    Периодический возврат мест истекших броней (для lifespan).
+
+    Запускается в каждом воркере: скрипт атомарный, поэтому параллельные
+    проходы не вернут одну бронь дважды.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            reaped = 0
+            while (batch := await holds.reap()) > 0:
+                reaped += batch
+                if batch < REAP_BATCH:
+                    break
+            if reaped:
+                logger_api.info(f"Возвращены места истекших броней: {reaped}")
+        except redis.RedisError as e:
+            logger_api.warning(f"Возврат броней не удался: {e!r}")
@@ -7,7 +7,14 @@ from fastapi import FastAPI, status
 from fastapi.exceptions import RequestValidationError
 import uvicorn
 
-from backend.core_service.app.api.v1 import event, ticket_types, tickets, user
+from backend.core_service.app.api.v1 import (
+    admin,
+    event,
+    queue,
+    ticket_types,
+    tickets,
+    user,
+)
 from backend.core_service.app.core.exceptions_handlers import (
     not_found,
     rate_limit,
@@ -20,9 +27,7 @@ from backend.core_service.app.middleware.logger_handler import AccessLogMiddlewa
 from backend.core_service.app.middleware.rollback_handler import (
     SQLAlchemySessionMiddleware,
 )
-from backend.core_service.app.models.session import DBBaseModel, engine
-
-DBBaseModel.metadata.create_all(bind=engine)
+from backend.core_service.app.middleware.token_handler import TokenScopeMiddleware
 
 app = FastAPI(lifespan=lifespan)
 
@@ -33,6 +38,7 @@ app.add_exception_handler(status.HTTP_404_NOT_FOUND, not_found)
 
 setup_cors(app)
 app.add_middleware(SQLAlchemySessionMiddleware)
+app.add_middleware(TokenScopeMiddleware)
 app.add_middleware(ExceptionMiddleware)
 app.add_middleware(AccessLogMiddleware)
 
@@ -55,6 +61,12 @@ app.include_router(
 app.include_router(
     tickets.router, prefix="/api/v1/ticket", tags=["Ручки для управления билетами"]
 )
+app.include_router(
+    queue.router, prefix="/api/v1/queue", tags=["Очередь на продажу билетов"]
+)
+app.include_router(
+    admin.router, prefix="/api/v1/admin", tags=["Служебные ручки администратора"]
+)
 
 
 # if __name__ == "__main__":
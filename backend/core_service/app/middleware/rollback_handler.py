@@ -4,7 +4,7 @@ from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoin
 from starlette.requests import Request
 from starlette.responses import Response
 
-from backend.core_service.app.models.session import SessionLocal
+from models.session import SessionLocal
 
 
 class SQLAlchemySessionMiddleware(BaseHTTPMiddleware):
@@ -14,19 +14,19 @@ class SQLAlchemySessionMiddleware(BaseHTTPMiddleware):
         request.state.db = SessionLocal()
         try:
             response = await call_next(request)
-            request.state.db.commit()
+            await request.state.db.commit()
             return response
 
         except HTTPException:
             raise
 
         except SQLAlchemyError:
-            request.state.db.rollback()
+            await request.state.db.rollback()
             raise
 
         except Exception:
-            request.state.db.rollback()
+            await request.state.db.rollback()
             raise
 
         finally:
-            request.state.db.close()
+            await request.state.db.close()
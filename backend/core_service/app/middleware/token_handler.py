@@ -0,0 +1,14 @@
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+
+# тот же модуль, что импортируют сервисы/роутеры (иначе будет другой ContextVar)
+from security.token_cache import request_token_scope
+
+
+class TokenScopeMiddleware(BaseHTTPMiddleware):
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        with request_token_scope():
+            return await call_next(request)
@@ -2,12 +2,36 @@
 Костыльный модуль взаимодействия с бд без класса. позже нужно сделать как класс и сократить количество функций
 """
 
-from collections import defaultdict
-from typing import TYPE_CHECKING, Literal, Optional, TypeVar
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+import json
+import secrets
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Final,
+    Literal,
+    Optional,
+    TypeVar,
+)
 
-from sqlalchemy import func
+from sqlalchemy import (
+    case,
+    column,
+    delete,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    table,
+    tuple_,
+    update,
+)
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import InstrumentedAttribute, joinedload
 
 from core.config import config
 from core.exceptions import (
@@ -21,7 +45,8 @@ from core.exceptions import (
     ValidationError,
 )
 from core.logger import logger_api
-from models.models import Accounts, Events, Tickets, TicketTypes
+from models.models import Accounts, Events, Outbox, Tickets, TicketTypes
+from models.search import FTS_WEIGHTS, fts_match_query
 from models.session import DBBaseModel
 
 if TYPE_CHECKING:
@@ -29,31 +54,42 @@ if TYPE_CHECKING:
 
     from schemas import (
         ActivateQrCodeResult,
+        ActivateQrCodesResult,
+        CreateTicketsResult,
         IntEventCreatorId,
         IntUserId,
+        OutboxMessage,
         StrEventAddress,
         StrEventDescription,
         StrEventTitle,
         StrUserLogin,
         StrUserName,
         StrUserPassword,
+        TicketActivation,
+        TicketStatsMismatch,
         UserRegistrationResult,
     )
 
 T = TypeVar("T", bound=DBBaseModel)
+T_Result = TypeVar("T_Result")
 
 
 async def user_registration(
-    db: Session, name: "StrUserName", login: "StrUserLogin", password: "StrUserPassword"
+    db: AsyncSession,
+    name: "StrUserName",
+    login: "StrUserLogin",
+    password: "StrUserPassword",
+    notify: Optional[Callable[["Accounts"], "OutboxMessage"]] = None,
 ) -> "Accounts":
     """
     Функция для регистрации аккаунта.
 
     Args:
-        db (Session): Сессия SQLAlchemy для работы с БД.
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
         name (StrUserName): Имя пользователя.
         login (StrUserLogin): Логин пользователя.
         password (StrUserPassword): Пароль пользователя (хеш).
+        notify (Optional[Callable[[Accounts], OutboxMessage]]): Сообщение в outbox по результату (в той же транзакции). Defaults to None.
 
     Returns:
         Accounts (DBBaseModel): Всю информацию о пользователе.
@@ -71,11 +107,12 @@ async def user_registration(
             password_hash=password,
         )
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        _add_to_outbox(db, notify, new_user)
+        await db.commit()
+        await db.refresh(new_user)
         return new_user
     except IntegrityError as e:
-        db.rollback()
+        await db.rollback()
         if "users.login" in str(e).split():  # HACK: костыль
             logger_api.error("Логин уже занят")
             raise LoginAlreadyExistsException()
@@ -85,39 +122,58 @@ async def user_registration(
 
 
 async def create_ticket_event(
-    db: Session, event_id: int, user_id: int, ticket_type_id: int, unique_code: str
+    db: AsyncSession,
+    event_id: int,
+    user_id: int,
+    ticket_type_id: int,
+    make_code: Callable[[int, int, int], str],
+    held: int = 0,
+    notify: Optional[Callable[[Tickets], "OutboxMessage"]] = None,
 ) -> Tickets | None:
     """
     Создание билета на мероприятие.
 
     Args:
-        db (Session): Сессия SQLAlchemy для работы с БД.
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
         event_id (int): ID мероприятия.
         user_id (int): ID создателя.
         ticket_type_id (int): ID типа билета.
-        unique_code (str): hmac код билета.
+        make_code (Callable[[int, int, int], str]): Код билета по `(ticket_id, event_id, ticket_type_id)`.
+        held (int): Мест типа в чужих бронях (не продаются). Defaults to 0.
+        notify (Optional[Callable[[Tickets], OutboxMessage]]): Сообщение в outbox по результату (в той же транзакции). Defaults to None.
 
     Returns:
         Tickets: Информацию о билете, пользователе, типе билета и мероприятии.
 
     Raises:
+        ValidationError: Мероприятия/типа билета не существует.
+        TicketLimitError: Билеты этого типа закончились.
         InternalServerError: Ошибка сервера.
     """
-    if not (db.query(Events).filter(Events.id == event_id).first()):
-        logger_api.error(f"Данного мероприятия c {event_id = } не существует")
-        raise ValidationError()
-
-    ticket_type = db.query(TicketTypes).filter(TicketTypes.id == ticket_type_id).first()
-    if not ticket_type:
-        logger_api.error(f"Данного типа билета c {ticket_type_id = } не существует")
-        raise ValidationError()
-
-    count = (
-        db.query(func.count(Tickets.id))
-        .filter(Tickets.ticket_type_id == ticket_type.id)
-        .scalar()
+    # проверка остатка и резерв одним запросом: без гонки между COUNT и INSERT
+    reserved = await db.scalar(
+        update(TicketTypes)
+        .where(
+            TicketTypes.id == ticket_type_id,
+            TicketTypes.event_id == event_id,
+            TicketTypes.sold_count + held < TicketTypes.total_count,
+        )
+        .values(sold_count=TicketTypes.sold_count + 1)
+        .returning(TicketTypes.id)
+        .execution_options(synchronize_session=False)
     )
-    if ticket_type.total_count <= count:
+    if reserved is None:
+        # UPDATE без строк все равно держит блокировку записи: отпускаем до выяснения
+        await db.rollback()
+        if not await db.scalar(
+            select(TicketTypes.id).where(
+                TicketTypes.id == ticket_type_id, TicketTypes.event_id == event_id
+            )
+        ):
+            logger_api.error(
+                f"Типа билета c {ticket_type_id = } для {event_id = } не существует"
+            )
+            raise ValidationError()
         raise TicketLimitError()
 
     try:
@@ -125,47 +181,193 @@ async def create_ticket_event(
             event_id=event_id,
             user_id=user_id,
             ticket_type_id=ticket_type_id,
-            unique_code=unique_code,
+            unique_code=_pending_code(),
         )
         db.add(new_ticket)
-        db.commit()
-        db.refresh(new_ticket)
+        await db.flush()  # код подписывает ID билета: он известен только после INSERT
+        new_ticket.unique_code = make_code(new_ticket.id, event_id, ticket_type_id)
 
-        ticket_with_details = (
-            db.query(Tickets)
+        ticket_with_details = await db.scalar(
+            select(Tickets)
             .options(
                 joinedload(Tickets.event),
                 joinedload(Tickets.user),
                 joinedload(Tickets.ticket_type),
             )
-            .filter(Tickets.id == new_ticket.id)
-            .first()
+            .where(Tickets.id == new_ticket.id)
         )
+        _add_to_outbox(db, notify, ticket_with_details)
+        await db.commit()
         return ticket_with_details
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger_api.exception(f"Внутренняя ошибка сервера. Проблемы с сейвом БД: {e}")
         raise InternalServerError()
 
 
+async def create_tickets_event_bulk(
+    db: AsyncSession,
+    event_id: int,
+    user_id: int,
+    counts: dict[int, int],
+    make_code: Callable[[int, int, int], str],
+    held: Optional[dict[int, int]] = None,
+    notify: Optional[Callable[["CreateTicketsResult"], "OutboxMessage"]] = None,
+) -> "CreateTicketsResult":
+    """
+    Покупка нескольких билетов мероприятия одной транзакцией.
+
+    Остаток всех типов резервируется одним UPDATE, билеты вставляются одним
+    executemany. Если хотя бы одного типа не хватает, не покупается ничего.
+
+    Args:
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
+        event_id (int): ID мероприятия.
+        user_id (int): ID покупателя.
+        counts (dict[int, int]): Количество билетов по типам `{ticket_type_id: count}`.
+        make_code (Callable[[int, int, int], str]): Код билета по `(ticket_id, event_id, ticket_type_id)`.
+        held (Optional[dict[int, int]]): Мест типов в чужих бронях `{ticket_type_id: count}`. Defaults to None.
+        notify (Optional[Callable[[CreateTicketsResult], OutboxMessage]]): Сообщение в outbox по результату (в той же транзакции). Defaults to None.
+
+    Returns:
+        CreateTicketsResult (TypedDict): Название мероприятия, количество по типам, сумма и билеты.
+
+    Raises:
+        ValidationError: Мероприятия/типа билета не существует.
+        TicketLimitError: Билетов какого-то типа не хватает.
+        InternalServerError: Ошибка сервера.
+    """
+    if not counts:
+        raise ValidationError()
+
+    event = await db.get(Events, event_id)
+    if not event:
+        logger_api.error(f"Данного мероприятия c {event_id = } не существует")
+        raise ValidationError()
+
+    amount = case(counts, value=TicketTypes.id)
+    in_holds = case(held, value=TicketTypes.id, else_=0) if held else 0
+    reserved = (
+        await db.execute(
+            update(TicketTypes)
+            .where(
+                TicketTypes.id.in_(counts),
+                TicketTypes.event_id == event_id,
+                TicketTypes.sold_count + amount + in_holds <= TicketTypes.total_count,
+            )
+            .values(sold_count=TicketTypes.sold_count + amount)
+            .returning(TicketTypes.id, TicketTypes.type, TicketTypes.price)
+            .execution_options(synchronize_session=False)
+        )
+    ).all()
+
+    if len(reserved) != len(counts):
+        await db.rollback()  # отменяем резерв остальных типов
+        existing = await db.scalar(
+            select(func.count(TicketTypes.id)).where(
+                TicketTypes.id.in_(counts), TicketTypes.event_id == event_id
+            )
+        )
+        if existing != len(counts):
+            logger_api.error(f"Не все типы билетов {list(counts)} есть у {event_id = }")
+            raise ValidationError()
+        raise TicketLimitError()
+
+    rows = [
+        {
+            "event_id": event_id,
+            "user_id": user_id,
+            "ticket_type_id": ticket_type_id,
+            "unique_code": _pending_code(),
+        }
+        for ticket_type_id, count in counts.items()
+        for _ in range(count)
+    ]
+
+    try:
+        tickets = list(await db.scalars(insert(Tickets).returning(Tickets), rows))
+        for ticket in tickets:  # коды по ID: один executemany UPDATE при коммите
+            ticket.unique_code = make_code(ticket.id, event_id, ticket.ticket_type_id)
+
+        result: "CreateTicketsResult" = {
+            "event_title": event.title,
+            "by_type": {type_: counts[id_] for id_, type_, _ in reserved},
+            "total_price": sum(price * counts[id_] for id_, _, price in reserved),
+            "tickets": tickets,
+        }
+        _add_to_outbox(db, notify, result)
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        logger_api.exception(f"Внутренняя ошибка сервера. Проблемы с сейвом БД: {e}")
+        raise InternalServerError()
+
+    return result
+
+
+def _add_to_outbox(
+    db: AsyncSession,
+    notify: Optional[Callable[[T_Result], "OutboxMessage"]],
+    result: T_Result,
+) -> None:
+    """Сообщение в outbox в текущей транзакции (уйдет в RabbitMQ после коммита)"""
+    if notify is None:
+        return
+    message = notify(result)
+    db.add(
+        Outbox(
+            queue=message["queue"],
+            body=json.dumps(message["body"], ensure_ascii=False),
+        )
+    )
+
+
+def _pending_code() -> str:
+    """Временный уникальный код билета до подписи его ID (в той же транзакции)"""
+    return f"pending.{secrets.token_hex(16)}"
+
+
+async def get_ticket_type_remaining(
+    db: AsyncSession, event_id: int, ticket_type_id: int
+) -> int | None:
+    """
+    Непроданный остаток типа билета.
+
+    Args:
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
+        event_id (int): ID мероприятия.
+        ticket_type_id (int): ID типа билета.
+
+    Returns:
+        int | None: Остаток или None, если у мероприятия нет такого типа.
+    """
+    return await db.scalar(
+        select(TicketTypes.total_count - TicketTypes.sold_count).where(
+            TicketTypes.id == ticket_type_id, TicketTypes.event_id == event_id
+        )
+    )
+
+
 async def create_type_ticket_event(
-    db: Session,
+    db: AsyncSession,
     event_id: int,
     ticket_type: Literal["Vip", "Standard", "Econom"],
     description: str,
     price: int,
     total_count: int,
+    notify: Optional[Callable[["TicketTypes"], "OutboxMessage"]] = None,
 ) -> "TicketTypes":
     """
     Функция для создания типа билета для мероприятия.
 
     Args:
-        db (Session): Сессия SQLAlchemy для работы с БД.
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
         event_id (int): ID мероприятия для которого создаем тип билета.
         ticket_type (Literal["Vip", "Standard", "Econom"]): Тип билета.
         description (str): Описание типа билета мероприятия.
         price (int): Цена данного типа билета мероприятия.
         total_count (int): Стоимость данного типа белета мероприятия.
+        notify (Optional[Callable[[TicketTypes], OutboxMessage]]): Сообщение в outbox по результату (в той же транзакции). Defaults to None.
 
     Returns:
         TicketTypes (DBBaseModel): Всю информацию о созданном типе билета мероприятия.
@@ -179,14 +381,14 @@ async def create_type_ticket_event(
         logger_api.error(f"Неправильный тип мероприятия {ticket_type = }")
         raise ValidationError()
 
-    existing_ticket = (
-        db.query(TicketTypes)
-        .filter(
+    existing_ticket = await db.scalar(
+        select(TicketTypes)
+        .where(
             TicketTypes.event_id
             == event_id,  # находит все существующие типы этого мероприятия
             TicketTypes.type == ticket_type,  # и смотрит есть ли такой тип уже
         )
-        .first()
+        .limit(1)
     )
 
     if existing_ticket:
@@ -195,38 +397,33 @@ async def create_type_ticket_event(
         )
         raise TicketTypeError()
 
-    event = (
-        db.query(Events)
-        .filter(
-            Events.id == event_id,
-        )
-        .first()
-    )
+    # создатель мероприятия нужен сервису для письма
+    event = await db.get(Events, event_id, options=[joinedload(Events.creator)])
     if not event:
         logger_api.error(f"Мероприятие под {event_id = } не существует")
         raise ValidationError()
 
     try:
         new_type_ticket_event = TicketTypes(
-            event_id=event_id,
+            event=event,
             type=ticket_type,
             description=description,
             price=price,
             total_count=total_count,
         )
         db.add(new_type_ticket_event)
-        db.commit()
-        db.refresh(new_type_ticket_event)
+        _add_to_outbox(db, notify, new_type_ticket_event)
+        await db.commit()
 
         return new_type_ticket_event
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger_api.exception(f"Внутренняя ошибка сервера. Проблемы с сейвом БД: {e}")
         raise InternalServerError()
 
 
 async def create_event(
-    db: Session,
+    db: AsyncSession,
     creator_id: "IntEventCreatorId",
     status: Literal["опубликовано", "завершено", "черновик"],
     title: "StrEventTitle",
@@ -235,18 +432,20 @@ async def create_event(
     ],
     description: "StrEventDescription",
     address: "StrEventAddress",
+    notify: Optional[Callable[["Events"], "OutboxMessage"]] = None,
 ) -> "Events":
     """
     Функция для создания мероприятия
 
     Args:
-        db (Session): Сессия SQLAlchemy для работы с БД.
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
         creator_id (IntEventCreatorId): ID создателя мероприятия.
         status (Literal[...]): Статус мероприятия.
         title (StrEventTitle): Название мероприятия.
         category (Literal[...]): Категория мероприятия.
         description (StrEventDescription): Описание мероприятия.
         address (StrEventAddress): Адрес мероприятия.
+        notify (Optional[Callable[[Events], OutboxMessage]]): Сообщение в outbox по результату (в той же транзакции). Defaults to None.
 
     Returns:
         Events (DBBaseModel): Всю информацию о созданном мероприятии.
@@ -273,18 +472,25 @@ async def create_event(
             address=address,
         )
         db.add(new_event)
-        db.commit()
-        db.refresh(new_event)
+        await db.flush()
 
-        return new_event
+        # создатель нужен сервису для письма
+        event = await db.scalar(
+            select(Events)
+            .options(joinedload(Events.creator))
+            .where(Events.id == new_event.id)
+        )
+        _add_to_outbox(db, notify, event)
+        await db.commit()
+        return event
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger_api.exception(f"Внутренняя ошибка сервера. Проблемы с сейвом БД: {e}")
         raise InternalServerError()
 
 
 async def search_user(
-    db: Session,
+    db: AsyncSession,
     *,
     user_id: Optional["IntUserId"] = None,
     login: Optional["StrUserLogin"] = None,
@@ -293,36 +499,33 @@ async def search_user(
     Возвращает Результат поиска пользователя.
 
     Args:
-        db (Session): Сессия SQLAlchemy для работы с БД.
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
         user_id (IntUserId): ID пользователя.
         login (StrUserLogin): Логин пользователя.
 
     Returns:
         dict[str, Accounts | None]: Вернет `None`, если элемент не найден, либо данные не указаны. Иначе - все данные пользователя в формате `{'id': user_info, 'login': user_info}`.
     """
-    query = db.query(Accounts)
-
     result = {
-        "id": (
-            query.filter(Accounts.id == user_id).first()
-            if user_id is not None
-            else None
-        ),
+        "id": (await db.get(Accounts, user_id) if user_id is not None else None),
         "login": (
-            query.filter(Accounts.login == login).first() if login is not None else None
+            await db.scalar(select(Accounts).where(Accounts.login == login))
+            if login is not None
+            else None
         ),
     }
     return result
 
 
 async def all_info_table(
-    db: Session, table_name: Literal["Accounts", "Events", "TicketTypes", "Tickets"]
+    db: AsyncSession,
+    table_name: Literal["Accounts", "Events", "TicketTypes", "Tickets"],
 ) -> list["DBBaseModel"]:
     """
     Функция для возврата всех данных таблицы.
 
     Args:
-        db (Session): Сессия SQLAlchemy для работы с БД.
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
         table_name (Literal['Accounts', 'Events', 'TicketTypes', 'Tickets']): Название таблицы.
 
     Returns:
@@ -335,26 +538,127 @@ async def all_info_table(
         text_error = f"Неправильно переданы данные. {db = }, {table_name = }"
         raise ValueError(text_error)
 
-    result = db.query(config.GET_TABLE[table_name]).all()
-    return result
+    result = await db.scalars(select(config.GET_TABLE[table_name]))
+    return list(result)
+
+
+async def get_events_page(
+    db: AsyncSession,
+    limit: int,
+    after: Optional[tuple[datetime, int]] = None,
+    status: Optional[str] = None,
+    category: Optional[str] = None,
+    creator_id: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> list["Events"]:
+    """
+    Страница мероприятий (новые первыми) по keyset курсору.
 
+    Сортировка (datetime, id) по убыванию, поэтому страница - это поиск по
+    индексу (ix_events_*_datetime_id) и `limit` строк, сколько бы мероприятий
+    ни было до нее.
 
-async def get_types_ticket_event(db: Session, event_id: int) -> list["TicketTypes"]:
+    Args:
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
+        limit (int): Мероприятий на странице.
+        after (Optional[tuple[datetime, int]]): (datetime, id) последнего
+            мероприятия прошлой страницы. Defaults to None (первая страница).
+        status (Optional[str]): Статус. Defaults to None.
+        category (Optional[str]): Категория. Defaults to None.
+        creator_id (Optional[int]): ID создателя. Defaults to None.
+        date_from (Optional[datetime]): Дата от (включительно). Defaults to None.
+        date_to (Optional[datetime]): Дата до (не включая). Defaults to None.
+
+    Returns:
+        list[Events]: До `limit` мероприятий.
+    """
+    query = select(Events)
+    if status is not None:
+        query = query.where(Events.status == status)
+    if category is not None:
+        query = query.where(Events.category == category)
+    if creator_id is not None:
+        query = query.where(Events.creator_id == creator_id)
+    if date_from is not None:
+        query = query.where(Events.datetime >= date_from)
+    if date_to is not None:
+        query = query.where(Events.datetime < date_to)
+    if after is not None:
+        query = query.where(tuple_(Events.datetime, Events.id) < tuple_(*after))
+
+    result = await db.scalars(
+        query.order_by(Events.datetime.desc(), Events.id.desc()).limit(limit)
+    )
+    return list(result)
+
+
+async def search_events(
+    db: AsyncSession, text: str, limit: int, offset: int
+) -> list["Events"]:
+    """
+    Полнотекстовый поиск мероприятий по title/description/address.
+
+    Postgres: `search_vector @@ websearch_to_tsquery('russian', ...)`, порядок
+    по ts_rank (GIN индекс). SQLite: MATCH по events_fts, порядок по bm25.
+    Совпадение в названии весит больше, чем в описании и адресе.
+
+    Args:
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
+        text (str): Строка поиска.
+        limit (int): Мероприятий на странице.
+        offset (int): Сколько лучших совпадений пропустить.
+
+    Returns:
+        list[Events]: До `limit` мероприятий, лучшие совпадения первыми.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        vector = literal_column("events.search_vector")
+        ts_query = func.websearch_to_tsquery("russian", text)
+        query = (
+            select(Events)
+            .where(vector.op("@@")(ts_query))
+            .order_by(func.ts_rank(vector, ts_query).desc(), Events.id.desc())
+        )
+    else:
+        if not (match := fts_match_query(text)):
+            return []
+
+        fts = table("events_fts", column("rowid"))
+        query = (
+            select(Events)
+            .join(fts, fts.c.rowid == Events.id)
+            .where(literal_column("events_fts").op("MATCH")(match))
+            .order_by(
+                func.bm25(literal_column("events_fts"), *FTS_WEIGHTS), Events.id.desc()
+            )
+        )
+
+    result = await db.scalars(query.limit(limit).offset(offset))
+    return list(result)
+
+
+async def get_types_ticket_event(
+    db: AsyncSession, event_id: int
+) -> list["TicketTypes"]:
     """
     Возвращает типы билета мероприятия.
 
     Args:
-        db (Session): Сессия SQLAlchemy для работы с БД.
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
         event_id (int): ID мероприятия.
 
     Returns:
         list[DBBaseModel]: Результат поиска.
     """
-    return db.query(TicketTypes).filter(TicketTypes.event_id == event_id).all()
+    result = await db.scalars(
+        select(TicketTypes).where(TicketTypes.event_id == event_id)
+    )
+    return list(result)
 
 
 async def edit_data(
-    db: Session,
+    db: AsyncSession,
     table_name: Literal["Accounts", "Events", "TicketTypes", "Tickets"],
     id: int,
     data: "BaseModel",
@@ -363,7 +667,7 @@ async def edit_data(
     Редактирование информации в таблицах db.
 
     Args:
-        db (Session): Сессия SQLAlchemy для работы с БД.
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
         table_name (Literal['Accounts', 'Events', 'TicketTypes', 'Tickets']): Название таблицы.
         id (int): Айди нужного элемента для изменения.
         data (T): Данные которые нужно изменить.
@@ -383,20 +687,20 @@ async def edit_data(
     if not update_data:
         raise ValidationError()
 
-    obj = db.query(config.GET_TABLE[table_name]).filter_by(id=id).first()
+    obj = await db.get(config.GET_TABLE[table_name], id)
     if not obj:
         raise ValidationError()
 
     for field, value in update_data.items():
         setattr(obj, field, value)
 
-    db.commit()
-    db.refresh(obj)
+    await db.commit()
+    await db.refresh(obj)
     return obj
 
 
 async def del_event(
-    db: Session,
+    db: AsyncSession,
     event_id: int,
     user_id: int,
 ) -> None:
@@ -404,7 +708,7 @@ async def del_event(
     Удаление мероприятия вместе с типами и билетами.
 
     Args:
-        db (Session): Сессия SQLAlchemy для работы с БД.
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
         event_id (int): ID мероприятия.
         user_id (int): ID пользователя.
 
@@ -413,27 +717,33 @@ async def del_event(
         ForbiddenUserError: Отказано в доступе.
         InternalServerError: Ошибка сервера.
     """
-    event = db.query(Events).get(event_id)
+    event = await db.get(Events, event_id)
     if not event:
         raise ValidationError()
     if event.creator_id != user_id:
         raise ForbiddenUserError()
 
     try:
-        db.query(Tickets).filter(
-            Tickets.ticket_type_id.in_(
-                db.query(TicketTypes.id).filter(TicketTypes.event_id == event_id)
+        await db.execute(
+            delete(Tickets)
+            .where(
+                Tickets.ticket_type_id.in_(
+                    select(TicketTypes.id).where(TicketTypes.event_id == event_id)
+                )
             )
-        ).delete(synchronize_session=False)
+            .execution_options(synchronize_session=False)
+        )
 
-        db.query(TicketTypes).filter(TicketTypes.event_id == event_id).delete(
-            synchronize_session=False
+        await db.execute(
+            delete(TicketTypes)
+            .where(TicketTypes.event_id == event_id)
+            .execution_options(synchronize_session=False)
         )
 
-        db.delete(event)
-        db.commit()
+        await db.delete(event)
+        await db.commit()
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger_api.exception(f"Внутренняя ошибка сервера. Проблемы с сейвом БД: {e}")
         raise InternalServerError()
 
@@ -441,7 +751,7 @@ async def del_event(
 
 
 async def del_ticket_type(
-    db: Session,
+    db: AsyncSession,
     ticket_type_id: int,
     user_id: int,
 ) -> None:
@@ -449,7 +759,7 @@ async def del_ticket_type(
     Удаление типа мероприятия.
 
     Args:
-        db (Session): Сессия SQLAlchemy для работы с БД.
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
         ticket_type_id (int): ID типа билета.
         user_id (int): ID пользователя.
 
@@ -458,30 +768,31 @@ async def del_ticket_type(
         ForbiddenUserError: Отказано в доступе.
         InternalServerError: Ошибка сервера.
     """
-    ticket_type = (
-        db.query(TicketTypes)
+    ticket_type = await db.scalar(
+        select(TicketTypes)
         .join(Events)
-        .filter(TicketTypes.id == ticket_type_id, Events.creator_id == user_id)
-        .first()
+        .where(TicketTypes.id == ticket_type_id, Events.creator_id == user_id)
     )
 
     if not ticket_type:
-        exists = (
-            db.query(TicketTypes.id).filter(TicketTypes.id == ticket_type_id).first()
+        exists = await db.scalar(
+            select(TicketTypes.id).where(TicketTypes.id == ticket_type_id)
         )
         if not exists:
             raise ValidationError()
         raise ForbiddenUserError()
 
     try:
-        db.query(Tickets).filter(Tickets.ticket_type_id == ticket_type_id).delete(
-            synchronize_session=False
+        await db.execute(
+            delete(Tickets)
+            .where(Tickets.ticket_type_id == ticket_type_id)
+            .execution_options(synchronize_session=False)
         )
 
-        db.delete(ticket_type)
-        db.commit()
+        await db.delete(ticket_type)
+        await db.commit()
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger_api.exception(f"Внутренняя ошибка сервера. Проблемы с сейвом БД: {e}")
         raise InternalServerError()
 
@@ -489,7 +800,7 @@ async def del_ticket_type(
 
 
 async def delete_data(
-    db: Session,
+    db: AsyncSession,
     table_name: Literal["Accounts", "Events", "TicketTypes", "Tickets"],
     id: int,
     user_id: int | None,
@@ -498,7 +809,7 @@ async def delete_data(
     Удаление элемента в таблице.
 
     Args:
-        db (Session): Сессия SQLAlchemy для работы с БД.
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
         table_name (Literal["Accounts", "Events", "TicketTypes", "Tickets"]): Название таблицы.
         id (int): Айди нужного элемента для удаления.
 
@@ -506,28 +817,58 @@ async def delete_data(
         ValidationError (HTTPException): Неверные данные.
     """
 
-    data = db.get(config.GET_TABLE[table_name], id)
+    data = await db.get(config.GET_TABLE[table_name], id)
     if not data:
         raise ValidationError()
 
     if user_id is not None and user_id != data.user_id:
         raise ForbiddenUserError()
 
-    db.delete(data)
-    db.commit()
+    if isinstance(data, Tickets):
+        # is_used берем из удаленной строки: билет могли активировать после get
+        is_used = await db.scalar(
+            delete(Tickets).where(Tickets.id == id).returning(Tickets.is_used)
+        )
+        if is_used is None:
+            raise ValidationError()
+
+        # билет возвращается в продажу
+        await db.execute(
+            update(TicketTypes)
+            .where(TicketTypes.id == data.ticket_type_id)
+            .values(
+                sold_count=TicketTypes.sold_count - 1,
+                used_count=TicketTypes.used_count - int(bool(is_used)),
+            )
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        await db.delete(data)
+
+    await db.commit()
     return
 
 
 async def db_activate_qr_code(
-    db: Session, user_id: int, code: str
+    db: AsyncSession,
+    user_id: int,
+    code: str,
+    notify: Optional[Callable[["TicketActivation"], "OutboxMessage"]] = None,
 ) -> "ActivateQrCodeResult":
     """
     Активация билета на мероприятие.
 
+    Код, права создателя и `is_used` проверяются одним UPDATE ... FROM events
+    ... RETURNING: из одновременных сканов активирует только один. Причина
+    отказа (нет билета/чужое мероприятие/уже активирован) выясняется отдельным
+    запросом только при отказе, а логин и имя для письма - только после
+    успешной активации.
+
     Args:
-        db (Session): Сессия SQLAlchemy для работы с БД.
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
         user_id (int): ID пользователя.
         code (str): Код билета.
+        notify (Optional[Callable[[TicketActivation], OutboxMessage]]): Сообщение в outbox об активации (в той же транзакции). Defaults to None.
 
     Raises:
         ValidationError (HTTPException): Неверные данные.
@@ -537,58 +878,386 @@ async def db_activate_qr_code(
     Returns:
         ActivateQrCodeResult (TypedDict): Тело ответа.
     """
-    ticket = db.query(Tickets).filter(Tickets.unique_code == code).first()
+    ticket_type_id = await db.scalar(
+        update(Tickets)
+        .where(
+            Tickets.unique_code == code,
+            Tickets.is_used == False,
+            Tickets.event_id == Events.id,
+            Events.creator_id == user_id,
+        )
+        .values(is_used=True)
+        .returning(Tickets.ticket_type_id)
+        .execution_options(synchronize_session=False)
+    )
 
-    if not ticket:
-        raise ValidationError()
+    if ticket_type_id is None:
+        await db.rollback()
+        ticket = (
+            await db.execute(
+                select(Tickets.is_used, Events.creator_id)
+                .join(Events, Events.id == Tickets.event_id)
+                .where(Tickets.unique_code == code)
+            )
+        ).first()
+        if ticket is None:
+            raise ValidationError()
+        if ticket.creator_id != user_id:
+            raise ForbiddenError(
+                "Активировать билет может только создатель мероприятия"
+            )
+        return {"activate": False, "info": "Билет уже был активирован"}
 
-    if ticket.event.creator_id != user_id:
+    await db.execute(
+        update(TicketTypes)
+        .where(TicketTypes.id == ticket_type_id)
+        .values(used_count=TicketTypes.used_count + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if notify is not None:
+        recipient = (
+            await db.execute(
+                select(Accounts.login, Accounts.name).where(Accounts.id == user_id)
+            )
+        ).one()
+        activation: "TicketActivation" = {
+            "ticket_type_id": ticket_type_id,
+            "login": recipient.login,
+            "name": recipient.name,
+        }
+        _add_to_outbox(db, notify, activation)
+    await db.commit()
+
+    result: "ActivateQrCodeResult" = {
+        "activate": True,
+        "info": "Билет успешно активирован",
+    }
+    return result
+
+
+async def db_check_event_creator(db: AsyncSession, event_id: int, user_id: int) -> None:
+    """
+    Проверка, что пользователь - создатель мероприятия (сканеры на входе).
+
+    Args:
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
+        event_id (int): ID мероприятия.
+        user_id (int): ID пользователя.
+
+    Raises:
+        ValidationError: Мероприятия не существует.
+        ForbiddenError: Пользователь не создатель мероприятия.
+    """
+    creator_id = await db.scalar(select(Events.creator_id).where(Events.id == event_id))
+    if creator_id is None:
+        raise ValidationError()
+    if creator_id != user_id:
         raise ForbiddenError("Активировать билет может только создатель мероприятия")
 
-    if ticket.is_used:
-        return {"activate": False, "info": "Билет уже был активирован"}
 
-    ticket.is_used = True
-    db.commit()
+async def db_activate_qr_codes(
+    db: AsyncSession, event_id: int, codes: list[str]
+) -> "ActivateQrCodesResult":
+    """
+    Активация пачки билетов мероприятия одной транзакцией.
 
-    return {"activate": True, "info": "Билет успешно активирован"}
+    Один условный UPDATE ... RETURNING активирует все неактивированные билеты
+    пачки (из одновременных пачек билет достается одной), счетчики типов
+    меняются одним UPDATE. Права на мероприятие проверяет вызывающий
+    (`db_check_event_creator`).
 
+    Args:
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
+        event_id (int): ID мероприятия.
+        codes (list[str]): Коды билетов без повторов.
 
-async def db_all_active_tickets_event(
-    db: Session, event_id: int
-) -> tuple[dict[str, int], int]:
-    tickets = (
-        db.query(Tickets)
-        .options(joinedload(Tickets.ticket_type))
-        .filter(Tickets.is_used == True, Tickets.event_id == event_id)
-        .all()
+    Returns:
+        ActivateQrCodesResult (TypedDict): Активированные, уже активированные и неизвестные коды.
+
+    Raises:
+        InternalServerError: Ошибка сервера.
+    """
+    try:
+        activated = (
+            await db.execute(
+                update(Tickets)
+                .where(
+                    Tickets.event_id == event_id,
+                    Tickets.unique_code.in_(codes),
+                    Tickets.is_used == False,
+                )
+                .values(is_used=True)
+                .returning(Tickets.unique_code, Tickets.ticket_type_id)
+                .execution_options(synchronize_session=False)
+            )
+        ).all()
+
+        by_type = Counter(ticket_type_id for _, ticket_type_id in activated)
+        if by_type:
+            await db.execute(
+                update(TicketTypes)
+                .where(TicketTypes.id.in_(by_type))
+                .values(
+                    used_count=TicketTypes.used_count
+                    + case(by_type, value=TicketTypes.id)
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+        done = {code for code, _ in activated}
+        rest = [code for code in codes if code not in done]
+        existing = set()
+        if rest:
+            existing = set(
+                await db.scalars(
+                    select(Tickets.unique_code).where(
+                        Tickets.event_id == event_id, Tickets.unique_code.in_(rest)
+                    )
+                )
+            )
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        logger_api.exception(f"Внутренняя ошибка сервера. Проблемы с сейвом БД: {e}")
+        raise InternalServerError()
+
+    return {
+        "activated": [code for code in codes if code in done],
+        "used": [code for code in rest if code in existing],
+        "unknown": [code for code in rest if code not in existing],
+    }
+
+
+async def stream_event_manifest(
+    session_factory: async_sessionmaker[AsyncSession], event_id: int, chunk: int
+) -> AsyncIterator[list[tuple[int, int, str, bool]]]:
+    """
+    Билеты мероприятия для манифеста сканеров порциями по `chunk` строк.
+
+    Читается серверным курсором в своей сессии: ответ стримится уже после
+    закрытия сессии запроса.
+
+    Args:
+        session_factory (async_sessionmaker[AsyncSession]): Фабрика сессий.
+        event_id (int): ID мероприятия.
+        chunk (int): Строк в порции.
+
+    Yields:
+        list[tuple[int, int, str, bool]]: `(id, ticket_type_id, unique_code, is_used)`.
+    """
+    async with session_factory() as db:
+        result = await db.stream(
+            select(
+                Tickets.id, Tickets.ticket_type_id, Tickets.unique_code, Tickets.is_used
+            )
+            .where(Tickets.event_id == event_id)
+            .execution_options(yield_per=chunk)
+        )
+        async for partition in result.partitions():
+            yield [tuple(row) for row in partition]
+
+
+# коды старого формата `TKT.<payload>.<signature>` (в подписанных точка одна)
+_LEGACY_CODE_PATTERN: Final[str] = "TKT.%.%"
+
+
+async def count_legacy_ticket_codes(db: AsyncSession) -> int:
+    """Количество билетов с кодом старого формата (размер префильтра)"""
+    return await db.scalar(
+        select(func.count()).where(Tickets.unique_code.like(_LEGACY_CODE_PATTERN))
     )
 
-    result = defaultdict(int)
-    total = 0
-    for ticket in tickets:
-        result[ticket.ticket_type.type] += 1
-        total += 1
-    return result, total
+
+async def stream_legacy_ticket_codes(
+    session_factory: async_sessionmaker[AsyncSession], chunk: int
+) -> AsyncIterator[list[str]]:
+    """
+    Коды билетов старого формата порциями по `chunk` (для префильтра).
+
+    Args:
+        session_factory (async_sessionmaker[AsyncSession]): Фабрика сессий.
+        chunk (int): Кодов в порции.
+
+    Yields:
+        list[str]: Коды билетов.
+    """
+    async with session_factory() as db:
+        result = await db.stream_scalars(
+            select(Tickets.unique_code)
+            .where(Tickets.unique_code.like(_LEGACY_CODE_PATTERN))
+            .execution_options(yield_per=chunk)
+        )
+        async for partition in result.partitions():
+            yield list(partition)
+
+
+async def db_all_active_tickets_event(
+    db: AsyncSession, event_id: int
+) -> tuple[dict[str, int], int]:
+    return await _ticket_stats_by_type(db, event_id, TicketTypes.used_count)
 
 
 async def db_all_tickets_event(
-    db: Session, event_id: int
+    db: AsyncSession, event_id: int
+) -> tuple[dict[str, int], int]:
+    return await _ticket_stats_by_type(db, event_id, TicketTypes.sold_count)
+
+
+async def _ticket_stats_by_type(
+    db: AsyncSession, event_id: int, counter: InstrumentedAttribute[int]
 ) -> tuple[dict[str, int], int]:
-    tickets = (
-        db.query(Tickets)
-        .options(joinedload(Tickets.ticket_type))
-        .filter(Tickets.event_id == event_id)
-        .all()
+    """
+    Количество билетов мероприятия по типам из счетчиков ticket_types.
+
+    Счетчики меняются в одной транзакции с покупкой/активацией/удалением,
+    поэтому сами билеты не читаются: строк столько, сколько типов.
+
+    Args:
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
+        event_id (int): ID мероприятия.
+        counter (InstrumentedAttribute[int]): sold_count или used_count.
+
+    Returns:
+        tuple[dict[str, int], int]: Количество по типам и всего.
+    """
+    rows = await db.execute(
+        select(TicketTypes.type, counter).where(
+            TicketTypes.event_id == event_id, counter > 0
+        )
     )
 
     result = defaultdict(int)
-    total = 0
-    for ticket in tickets:
-        result[ticket.ticket_type.type] += 1
-        total += 1
-    return result, total
+    for type_, count in rows:
+        result[type_] += count
+    return result, sum(result.values())
+
+
+async def reconcile_ticket_stats(db: AsyncSession) -> list["TicketStatsMismatch"]:
+    """
+    Сверка счетчиков ticket_types (sold_count/used_count) с таблицей tickets.
+
+    Расхождения ищутся одним GROUP BY. Каждый найденный тип пересчитывается
+    под блокировкой строки типа: покупки/активации этого типа ждут, и новый
+    счетчик не затрет их изменения.
+
+    Args:
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
+
+    Returns:
+        list[TicketStatsMismatch]: Исправленные расхождения (пусто - все сошлось).
+    """
+    counts = (
+        select(
+            Tickets.ticket_type_id,
+            func.count().label("sold"),
+            func.count().filter(Tickets.is_used == True).label("used"),
+        )
+        .group_by(Tickets.ticket_type_id)
+        .subquery()
+    )
+    sold = func.coalesce(counts.c.sold, 0)
+    used = func.coalesce(counts.c.used, 0)
+
+    mismatched = (
+        await db.scalars(
+            select(TicketTypes.id)
+            .outerjoin(counts, counts.c.ticket_type_id == TicketTypes.id)
+            .where(or_(TicketTypes.sold_count != sold, TicketTypes.used_count != used))
+        )
+    ).all()
+    await db.rollback()
+
+    fixed: list["TicketStatsMismatch"] = []
+    for ticket_type_id in mismatched:
+        ticket_type = await db.scalar(
+            select(TicketTypes)
+            .where(TicketTypes.id == ticket_type_id)
+            .with_for_update()
+        )
+        if ticket_type is None:  # тип удалили
+            await db.rollback()
+            continue
+
+        real_sold, real_used = (
+            await db.execute(
+                select(
+                    func.count(), func.count().filter(Tickets.is_used == True)
+                ).where(Tickets.ticket_type_id == ticket_type_id)
+            )
+        ).one()
+        if (ticket_type.sold_count, ticket_type.used_count) != (real_sold, real_used):
+            fixed.append(
+                {
+                    "ticket_type_id": ticket_type_id,
+                    "sold_count": ticket_type.sold_count,
+                    "sold": real_sold,
+                    "used_count": ticket_type.used_count,
+                    "used": real_used,
+                }
+            )
+            ticket_type.sold_count = real_sold
+            ticket_type.used_count = real_used
+        await db.commit()
+
+    return fixed
+
+
+async def claim_outbox_batch(
+    db: AsyncSession, limit: int, lease: float
+) -> list[Outbox]:
+    """
+    Захват пачки сообщений outbox релеем: аренда на `lease` секунд.
+
+    Свободные строки (без аренды или с истекшей) помечаются одним
+    UPDATE ... RETURNING и сразу коммитятся, поэтому релеи разных воркеров
+    не получат одно сообщение одновременно: на SQLite запись сериализована,
+    на Postgres занятые строки пропускаются (SKIP LOCKED), а аренда
+    перепроверяется в UPDATE. Неотправленные сообщения (релей упал/брокер
+    не подтвердил) захватываются снова после истечения аренды.
+
+    Args:
+        db (AsyncSession): Сессия SQLAlchemy для работы с БД.
+        limit (int): Размер пачки.
+        lease (float): Время аренды (сек).
+
+    Returns:
+        list[Outbox]: Сообщения в порядке записи.
+    """
+    now = datetime.now(timezone.utc)
+    free = or_(Outbox.claimed_until.is_(None), Outbox.claimed_until < now)
+
+    messages = list(
+        await db.scalars(
+            update(Outbox)
+            .where(
+                Outbox.id.in_(
+                    select(Outbox.id)
+                    .where(free)
+                    .order_by(Outbox.id)
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                ),
+                free,
+            )
+            .values(claimed_until=now + timedelta(seconds=lease))
+            .returning(Outbox)
+            .execution_options(synchronize_session=False)
+        )
+    )
+    await db.commit()
+
+    return sorted(messages, key=lambda message: message.id)
+
+
+async def delete_outbox(db: AsyncSession, ids: list[int]) -> None:
+    """Удаление отправленных сообщений outbox (коммит - за вызывающим)"""
+    if ids:
+        await db.execute(
+            delete(Outbox)
+            .where(Outbox.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
 
 
-async def db_get_info_user(db: Session, user_id: int):
-    return db.query(Accounts).filter(Accounts.id == user_id).first()
+async def db_get_info_user(db: AsyncSession, user_id: int):
+    return await db.get(Accounts, user_id)
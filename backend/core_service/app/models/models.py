@@ -1,9 +1,26 @@
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, func
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import relationship
 
+from models.search import register_events_search
 from models.session import DBBaseModel
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class Accounts(DBBaseModel):
     __tablename__ = "users"
 
@@ -22,6 +39,13 @@ class Accounts(DBBaseModel):
 
 class Events(DBBaseModel):
     __tablename__ = "events"
+    __table_args__ = (
+        # список мероприятий: keyset (datetime, id) без фильтра и с каждым фильтром
+        Index("ix_events_datetime_id", "datetime", "id"),
+        Index("ix_events_status_datetime_id", "status", "datetime", "id"),
+        Index("ix_events_category_datetime_id", "category", "datetime", "id"),
+        Index("ix_events_creator_datetime_id", "creator_id", "datetime", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)  # Айди мероприятия
     creator_id = Column(
@@ -34,8 +58,12 @@ class Events(DBBaseModel):
     title = Column(String, nullable=False)  # Название мероприятия
     description = Column(String, nullable=False)  # Полное описание мероприятия
     address = Column(String, nullable=False)  # Адрес мероприятия
+    # default из Python: в SQLite все даты в одном текстовом формате (keyset по дате)
     datetime = Column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
+        DateTime(timezone=True),
+        nullable=False,
+        default=_utcnow,
+        server_default=func.now(),
     )  # Дата в формате 11:11 21.05.2025
     # end_datetime = Column(DateTime(timezone=True), nullable=False, server_default=func.now()) # Дата в формате 11:11 21.05.2025 # TODO: сделать
 
@@ -53,12 +81,18 @@ class TicketTypes(DBBaseModel):
         Integer, primary_key=True, index=True
     )  # Айди билета (это тип. родитель.)
     event_id = Column(
-        Integer, ForeignKey("events.id"), nullable=False
+        Integer, ForeignKey("events.id"), index=True, nullable=False
     )  # Айди мероприятия, к которму относится билет (event.id)
     type = Column(String, nullable=False)  # Тип билета (Vip, Standard, Econom)
     description = Column(String)  # Описание билета
     price = Column(Integer, nullable=False)  # Цена билета
     total_count = Column(Integer, nullable=False)  # Сколько всего таких билетов будет
+    sold_count = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )  # Сколько продано (меняется атомарно в create_ticket_event)
+    used_count = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )  # Сколько активировано (меняется атомарно в db_activate_qr_code)
 
     event = relationship("Events", back_populates="ticket_types")
     ticket = relationship("Tickets", back_populates="ticket_type")
@@ -68,13 +102,17 @@ class Tickets(DBBaseModel):
     """Сами билеты"""
 
     __tablename__ = "tickets"
+    __table_args__ = (
+        # статистика билетов мероприятия (GROUP BY по индексу, без чтения таблицы)
+        Index("ix_tickets_event_used_type", "event_id", "is_used", "ticket_type_id"),
+    )
 
     id = Column(
         Integer, primary_key=True, index=True
     )  # Айди билета (кьюаркода) (это сам билет)
     event_id = Column(
-        Integer, ForeignKey("events.id"), index=True, nullable=False
-    )  # Айди мероприятия, на который куплен билет
+        Integer, ForeignKey("events.id"), nullable=False
+    )  # Айди мероприятия, на который куплен билет (индекс - ix_tickets_event_used_type)
     user_id = Column(
         Integer, ForeignKey("users.id"), index=True, nullable=False
     )  # Айди пользователя, который купил билет
@@ -89,3 +127,25 @@ class Tickets(DBBaseModel):
     event = relationship("Events", back_populates="tickets")
     user = relationship("Accounts", back_populates="tickets")
     ticket_type = relationship("TicketTypes", back_populates="ticket")
+
+
+class Outbox(DBBaseModel):
+    """Сообщения в RabbitMQ, записанные в транзакции изменения (transactional outbox)"""
+
+    __tablename__ = "outbox"
+
+    id = Column(Integer, primary_key=True)  # Айди сообщения (message_id в RabbitMQ)
+    queue = Column(String, nullable=False)  # Очередь RabbitMQ
+    body = Column(Text, nullable=False)  # Тело сообщения (JSON)
+    created_at = Column(
+        DateTime(timezone=True), default=_utcnow, nullable=False
+    )  # Время записи
+    claimed_until = Column(
+        DateTime(timezone=True), nullable=True
+    )  # Аренда релея: до этого времени сообщение не захватывается повторно
+
+    # строка удаляется релеем после подтверждения брокером (publisher confirms)
+
+
+# полнотекстовый поиск (FTS5 / tsvector) создается вместе с таблицей
+register_events_search(Events.__table__)
@@ -0,0 +1,118 @@
+"""
+Полнотекстовый поиск мероприятий (title, description, address).
+
+SQLite: FTS5 таблица `events_fts` (external content над events), которую
+синхронизируют триггеры. Postgres: генерируемая колонка `search_vector`
+(tsvector, словарь russian) и GIN индекс по ней.
+
+DDL навешивается на создание таблицы events (`create_all`), в миграции - копия.
+"""
+
+import re
+from typing import Final
+
+from sqlalchemy import DDL, Table, event
+
+EVENTS_SEARCH_DDL: Final[dict[str, tuple[str, ...]]] = {
+    "sqlite": (
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+            title, description, address,
+            content='events', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
+            INSERT INTO events_fts(rowid, title, description, address)
+            VALUES (new.id, new.title, new.description, new.address);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
+            INSERT INTO events_fts(events_fts, rowid, title, description, address)
+            VALUES ('delete', old.id, old.title, old.description, old.address);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS events_fts_au
+        AFTER UPDATE OF title, description, address ON events BEGIN
+            INSERT INTO events_fts(events_fts, rowid, title, description, address)
+            VALUES ('delete', old.id, old.title, old.description, old.address);
+            INSERT INTO events_fts(rowid, title, description, address)
+            VALUES (new.id, new.title, new.description, new.address);
+        END
+        """,
+    ),
+    "postgresql": (
+        """
+        ALTER TABLE events ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('russian', coalesce(title, '')), 'A')
+            || setweight(to_tsvector('russian', coalesce(description, '')), 'B')
+            || setweight(to_tsvector('russian', coalesce(address, '')), 'C')
+        ) STORED
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS ix_events_search_vector
+        ON events USING GIN (search_vector)
+        """,
+    ),
+}
+
+# FTS5 таблица не удаляется вместе с events (триггеры удаляются)
+EVENTS_SEARCH_DROP_DDL: Final[dict[str, tuple[str, ...]]] = {
+    "sqlite": ("DROP TABLE IF EXISTS events_fts",),
+}
+
+
+def register_events_search(table: Table) -> None:
+    """DDL поиска после CREATE TABLE events и перед DROP (для своего диалекта)"""
+    for name, ddl in (
+        ("after_create", EVENTS_SEARCH_DDL),
+        ("before_drop", EVENTS_SEARCH_DROP_DDL),
+    ):
+        for dialect, statements in ddl.items():
+            for statement in statements:
+                event.listen(table, name, DDL(statement).execute_if(dialect=dialect))
+
+
+# веса bm25 колонок events_fts (как A/B/C в Postgres)
+FTS_WEIGHTS: Final[tuple[float, float, float]] = (10.0, 3.0, 1.0)
+
+# окончания для поиска по основе слова: в FTS5 нет русского стеммера
+_RU_ENDINGS: Final[tuple[str, ...]] = tuple(
+    sorted(
+        "иями ями ами ого его ому ему ыми ими ией иях ах ях ов ев ей ий ый ой ая "
+        "яя ое ее ые ие ую юю ом ем ам ям ия ью а я о е ы и у ю ь".split(),
+        key=len,
+        reverse=True,
+    )
+)
+_MIN_STEM: Final[int] = 3
+_WORD: Final[re.Pattern[str]] = re.compile(r"\w+")
+
+
+def _stem_ru(word: str) -> str:
+    """Основа слова: самое длинное окончание из `_RU_ENDINGS` (основа >= 3)"""
+    for ending in _RU_ENDINGS:
+        if word.endswith(ending) and len(word) - len(ending) >= _MIN_STEM:
+            return word[: -len(ending)]
+    return word
+
+
+def fts_match_query(text: str) -> str:
+    """
+    Запрос FTS5 MATCH из пользовательской строки.
+
+    Каждое слово - префиксный поиск по его основе ("концертов" -> "концерт"*),
+    все слова должны найтись (AND). Слова только из \\w, поэтому синтаксис
+    FTS5 из ввода не попадает в запрос.
+
+    Args:
+        text (str): Строка поиска.
+
+    Returns:
+        str: Выражение MATCH или пустая строка (слов нет).
+    """
+    return " ".join(f'"{_stem_ru(word)}"*' for word in _WORD.findall(text.lower()))
@@ -1,13 +1,119 @@
-from typing import Generator
+import os
+from typing import Any, Final
 
 from fastapi import Request
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy import URL, event, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase
 
-DATABASE_URL = "sqlite:///./eventpass.db"
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# async драйвер для URL без явного драйвера (postgresql://..., sqlite:///...)
+_ASYNC_DRIVERS: Final[dict[str, str]] = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+class _SettingsDB:
+    """Настройки БД (core.config импортирует модели, поэтому настройки здесь)"""
+
+    URL: Final[str] = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./eventpass.db")
+    POOL_SIZE: Final[int] = int(os.getenv("DB_POOL_SIZE", 20))
+    MAX_OVERFLOW: Final[int] = int(
+        os.getenv("DB_MAX_OVERFLOW", 10)
+    )  # соединений сверх POOL_SIZE на пиках
+    POOL_TIMEOUT: Final[float] = float(
+        os.getenv("DB_POOL_TIMEOUT", 10)
+    )  # ожидание свободного соединения (сек)
+    POOL_RECYCLE: Final[int] = int(
+        os.getenv("DB_POOL_RECYCLE", 1800)
+    )  # пересоздание соединения старше N сек (обрывы со стороны БД/прокси)
+    POOL_PRE_PING: Final[bool] = os.getenv("DB_POOL_PRE_PING", "1") == "1"
+    STATEMENT_TIMEOUT_MS: Final[int] = int(
+        os.getenv("DB_STATEMENT_TIMEOUT_MS", 5_000)
+    )  # Postgres прерывает запрос дольше (0 - без лимита)
+    SQLITE_BUSY_TIMEOUT_MS: Final[int] = int(
+        os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5_000)
+    )  # ожидание лока записи вместо мгновенного "database is locked"
+    SQLITE_MMAP_SIZE: Final[int] = int(
+        os.getenv("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)
+    )  # чтение файла БД через mmap
+
+
+def _database_url(url: str) -> URL:
+    """URL с async драйвером"""
+    parsed = make_url(url)
+    if parsed.drivername in _ASYNC_DRIVERS:
+        parsed = parsed.set(drivername=_ASYNC_DRIVERS[parsed.drivername])
+    return parsed
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """
+    PRAGMA для каждого нового соединения SQLite.
+
+    WAL: читатели не блокируются писателем (и наоборот), пишет один писатель.
+    synchronous=NORMAL в WAL безопасен при падении процесса и не делает fsync
+    на каждый commit.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={_SettingsDB.SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA mmap_size={_SettingsDB.SQLITE_MMAP_SIZE}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def create_engine_from_url(url: str) -> AsyncEngine:
+    """
+    Создание движка с настройками пула под бэкенд БД.
+
+    Args:
+        url (str): URL БД (`postgresql://`, `postgresql+asyncpg://`, `sqlite:///`...).
+
+    Returns:
+        AsyncEngine: Async движок SQLAlchemy.
+    """
+    database_url = _database_url(url)
+    options: dict[str, Any] = {"pool_pre_ping": _SettingsDB.POOL_PRE_PING}
+
+    if database_url.database not in (None, "", ":memory:"):
+        # у in-memory SQLite одно соединение на процесс (StaticPool)
+        options |= {
+            "pool_size": _SettingsDB.POOL_SIZE,
+            "max_overflow": _SettingsDB.MAX_OVERFLOW,
+            "pool_timeout": _SettingsDB.POOL_TIMEOUT,
+            "pool_recycle": _SettingsDB.POOL_RECYCLE,
+        }
+
+    backend = database_url.get_backend_name()
+    if backend == "postgresql" and database_url.drivername.endswith("asyncpg"):
+        options["connect_args"] = {
+            "server_settings": {
+                "statement_timeout": str(_SettingsDB.STATEMENT_TIMEOUT_MS),
+                "application_name": "eventpass",
+            },
+        }
+    elif backend == "sqlite":
+        options["connect_args"] = {"timeout": _SettingsDB.SQLITE_BUSY_TIMEOUT_MS / 1000}
+
+    engine = create_async_engine(database_url, **options)
+    if backend == "sqlite":
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+DATABASE_URL = _database_url(_SettingsDB.URL)
+engine = create_engine_from_url(_SettingsDB.URL)
+
+# expire_on_commit=False: после commit атрибуты не перечитываются лениво
+# (ленивая загрузка в AsyncSession недоступна)
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 
 class DBBaseModel(DeclarativeBase):
@@ -16,15 +122,12 @@ class DBBaseModel(DeclarativeBase):
     pass
 
 
-# def get_db() -> Generator[Session, None, None]:
-#     """Сессия БД"""
-#     db = SessionLocal()
-#     try:
-#         yield db
-#     finally:
-#         db.close()
+async def create_tables() -> None:
+    """Создание таблиц (если их еще нет)"""
+    async with engine.begin() as conn:
+        await conn.run_sync(DBBaseModel.metadata.create_all)
 
 
-def get_db(request: Request) -> Session:
+def get_db(request: Request) -> AsyncSession:
     """Сессия БД"""
     return request.state.db
@@ -1,24 +1,45 @@
 # === TypedDict ===
 from .dicts import (
     ActivateQrCodeResult,
+    ActivateQrCodesResult,
+    CreateTicketsResult,
     EventCreatedResult,
     LoginUserResult,
+    OutboxMessage,
+    TicketActivation,
+    TicketStatsMismatch,
     UserRegistrationResult,
 )
 
 # === Protocol ===
+from .protocols.protocol_admin import ManagementAdminProtocol
 from .protocols.protocol_event import ManagementEventsProtocol
+from .protocols.protocol_queue import ManagementWaitingRoomProtocol
 from .protocols.protocol_ticket import ManagementTicketsProtocol
 from .protocols.protocol_ticket_types import ManagementTicketTypeProtocol
 from .protocols.protocol_user import ManagementUsersProtocol
 
 # === Pydantic ===
+from .pydantics.routers.admin import (
+    CacheNameStatsResponseDTO,
+    CacheStatsResponseDTO,
+    TicketCodeFilterStatsResponseDTO,
+)
 from .pydantics.routers.event import (
     AllElementsResponseDTO,
     CreateEventDTO,
     CreateEventResponseDTO,
     EditEventDTO,
     EditEventResponseDTO,
+    EventsFilterDTO,
+    EventsPageResponseDTO,
+    EventsSearchDTO,
+    EventsSearchResponseDTO,
+)
+from .pydantics.routers.queue import (
+    QueueConfigDTO,
+    QueueJoinResponseDTO,
+    QueueStatusResponseDTO,
 )
 from .pydantics.routers.ticket_types import (
     CreateTicketTypeDTO,
@@ -31,8 +52,16 @@ from .pydantics.routers.tickets import (
     ActivateQrCodeResponseDTO,
     AllActiveTicketsEventResponseDTO,
     AllTicketsEventResponseDTO,
+    ScanBatchDTO,
+    ScanBatchResponseDTO,
+    ScanConflictDTO,
     TicketCreateDTO,
     TicketCreateResponseDTO,
+    TicketHoldDTO,
+    TicketHoldResponseDTO,
+    TicketsCreateDTO,
+    TicketsCreateItemDTO,
+    TicketsCreateResponseDTO,
 )
 from .pydantics.routers.user import (
     CreateUserDTO,
@@ -88,4 +117,29 @@ __all__ = [
     "AllActiveTicketsEventResponseDTO",
     "ActivateQrCodeResult",
     "ActivateQrCodeResponseDTO",
+    "ManagementAdminProtocol",
+    "CacheNameStatsResponseDTO",
+    "CacheStatsResponseDTO",
+    "CreateTicketsResult",
+    "TicketsCreateDTO",
+    "TicketsCreateItemDTO",
+    "TicketsCreateResponseDTO",
+    "TicketHoldDTO",
+    "TicketHoldResponseDTO",
+    "ManagementWaitingRoomProtocol",
+    "QueueConfigDTO",
+    "QueueJoinResponseDTO",
+    "QueueStatusResponseDTO",
+    "TicketStatsMismatch",
+    "EventsFilterDTO",
+    "EventsPageResponseDTO",
+    "EventsSearchDTO",
+    "EventsSearchResponseDTO",
+    "ActivateQrCodesResult",
+    "ScanBatchDTO",
+    "ScanBatchResponseDTO",
+    "ScanConflictDTO",
+    "TicketCodeFilterStatsResponseDTO",
+    "OutboxMessage",
+    "TicketActivation",
 ]
@@ -1,8 +1,11 @@
 from datetime import datetime
-from typing import Literal, NotRequired, Optional, TypedDict
+from typing import TYPE_CHECKING, Any, Literal, NotRequired, Optional, TypedDict
 
 from sqlalchemy import Column
 
+if TYPE_CHECKING:
+    from models.models import Tickets
+
 
 # [SearchUserResult]
 class SearchUserResult(TypedDict):
@@ -49,9 +52,56 @@ class LoginUserResult(TypedDict):
     name: Column[str]
 
 
+# [CreateTicketsResult]
+class CreateTicketsResult(TypedDict):
+    """Формат ответа"""
+
+    event_title: str
+    by_type: dict[str, int]
+    total_price: int
+    tickets: list["Tickets"]
+
+
+# [TicketStatsMismatch]
+class TicketStatsMismatch(TypedDict):
+    """Расхождение счетчиков типа билета с таблицей tickets"""
+
+    ticket_type_id: int
+    sold_count: int  # было в ticket_types
+    sold: int  # билетов в tickets
+    used_count: int
+    used: int
+
+
 # [ActivateQrCodeResult]
 class ActivateQrCodeResult(TypedDict):
     """Формат ответа"""
 
     activate: bool
     info: str
+
+
+# [TicketActivation]
+class TicketActivation(TypedDict):
+    """Активированный билет и тот, кто его сканировал (получатель письма)"""
+
+    ticket_type_id: int
+    login: str
+    name: str
+
+
+# [OutboxMessage]
+class OutboxMessage(TypedDict):
+    """Сообщение в RabbitMQ (пишется в outbox в транзакции изменения)"""
+
+    queue: str
+    body: dict[str, Any]
+
+
+# [ActivateQrCodesResult]
+class ActivateQrCodesResult(TypedDict):
+    """Разбор пачки кодов с одного мероприятия"""
+
+    activated: list[str]
+    used: list[str]  # уже были активированы
+    unknown: list[str]  # билета нет (удален/другое мероприятие)
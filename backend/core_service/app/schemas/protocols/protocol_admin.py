@@ -0,0 +1,88 @@
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from infrastructure.admission.store import AdmissionStore
+    from infrastructure.prefilter.ticket_codes import BloomFilter
+    from schemas import (
+        CacheStatsResponseDTO,
+        QueueConfigDTO,
+        TicketCodeFilterStatsResponseDTO,
+    )
+
+
+class ManagementAdminProtocol(Protocol):
+    """Протокол ManagementAdmin"""
+
+    async def cache_stats(self, jwt_token: str) -> "CacheStatsResponseDTO":
+        """
+        Статистика кеша (ICache).
+
+        Args:
+            jwt_token (str): Токен пользователя.
+
+        Returns:
+            CacheStatsResponseDTO: Сводка по unique_name, тегам и L1.
+
+        Raises:
+            NoTokenError (HTTPException): Отсутствует/неправильный токен.
+            ForbiddenError (HTTPException): Пользователь не администратор.
+        """
+        ...
+
+    async def ticket_code_filter_stats(
+        self, jwt_token: str, code_filter: "BloomFilter"
+    ) -> "TicketCodeFilterStatsResponseDTO":
+        """
+        Статистика префильтра кодов билетов (память, ложные срабатывания).
+
+        Args:
+            jwt_token (str): Токен пользователя.
+            code_filter (BloomFilter): Префильтр кодов старого формата.
+
+        Returns:
+            TicketCodeFilterStatsResponseDTO: Статистика фильтра воркера.
+
+        Raises:
+            NoTokenError (HTTPException): Отсутствует/неправильный токен.
+            ForbiddenError (HTTPException): Пользователь не администратор.
+        """
+        ...
+
+    async def configure_queue(
+        self,
+        event_id: int,
+        data: "QueueConfigDTO",
+        jwt_token: str,
+        store: "AdmissionStore",
+    ) -> None:
+        """
+        Включение/изменение очереди на мероприятие.
+
+        Args:
+            event_id (int): ID мероприятия.
+            data (QueueConfigDTO): Скорость и запас пропусков.
+            jwt_token (str): Токен пользователя.
+            store (AdmissionStore): Хранилище очереди.
+
+        Raises:
+            NoTokenError (HTTPException): Отсутствует/неправильный токен.
+            ForbiddenError (HTTPException): Пользователь не администратор.
+        """
+        ...
+
+    async def disable_queue(
+        self, event_id: int, jwt_token: str, store: "AdmissionStore"
+    ) -> None:
+        """
+        Выключение очереди на мероприятие (покупка снова без пропуска).
+
+        Args:
+            event_id (int): ID мероприятия.
+            jwt_token (str): Токен пользователя.
+            store (AdmissionStore): Хранилище очереди.
+
+        Raises:
+            NoTokenError (HTTPException): Отсутствует/неправильный токен.
+            ForbiddenError (HTTPException): Пользователь не администратор.
+        """
+        ...
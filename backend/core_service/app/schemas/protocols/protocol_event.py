@@ -1,13 +1,15 @@
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
-    from infrastructure.messaging.producer import RabbitProducer
     from schemas import (
-        AllElementsResponseDTO,
         CreateEventDTO,
         CreateEventResponseDTO,
         EditEventDTO,
         EditEventResponseDTO,
+        EventsFilterDTO,
+        EventsPageResponseDTO,
+        EventsSearchDTO,
+        EventsSearchResponseDTO,
     )
 
 
@@ -18,7 +20,7 @@ class ManagementEventsProtocol(Protocol):
         self,
         jwt_token: str,
         event: "CreateEventDTO",
-        rabbit_producer: "RabbitProducer",
+        file: bytes,
     ) -> "CreateEventResponseDTO":
         """
         Метод для создания мероприятия.
@@ -38,15 +40,37 @@ class ManagementEventsProtocol(Protocol):
         """
         ...
 
-    async def all_events(self, jwt_token: str) -> list["AllElementsResponseDTO"]:
+    async def all_events(
+        self, jwt_token: str, filters: "EventsFilterDTO"
+    ) -> "EventsPageResponseDTO":
         """
-        Метод для вывода всех мероприятий (не оптимизирован для больших данных).
+        Метод для вывода страницы мероприятий (новые первыми).
 
         Args:
             jwt_token (str): Токен пользователя.
+            filters (EventsFilterDTO): Фильтры, размер страницы и курсор.
 
         Returns:
-           AllElementsResponseDTO (list[BaseModel]): Все мероприятия.
+           EventsPageResponseDTO (BaseModel): Мероприятия и курсор следующей страницы.
+
+        Raises:
+            NoTokenError (HTTPException): Токен отсутствует.
+            ValidationError (HTTPException): Неверный курсор.
+        """
+        ...
+
+    async def search_events(
+        self, jwt_token: str, search: "EventsSearchDTO"
+    ) -> "EventsSearchResponseDTO":
+        """
+        Метод для полнотекстового поиска мероприятий (лучшие совпадения первыми).
+
+        Args:
+            jwt_token (str): Токен пользователя.
+            search (EventsSearchDTO): Строка поиска и страница.
+
+        Returns:
+           EventsSearchResponseDTO (BaseModel): Мероприятия и номер следующей страницы.
 
         Raises:
             NoTokenError (HTTPException): Токен отсутствует.
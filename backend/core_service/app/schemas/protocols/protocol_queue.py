@@ -0,0 +1,47 @@
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from infrastructure.admission.store import AdmissionStore
+    from schemas import QueueJoinResponseDTO, QueueStatusResponseDTO
+
+
+class ManagementWaitingRoomProtocol(Protocol):
+    """Протокол ManagementWaitingRoom"""
+
+    async def join(
+        self, event_id: int, jwt_token: str, store: "AdmissionStore"
+    ) -> "QueueJoinResponseDTO":
+        """
+        Метод для входа в очередь мероприятия.
+
+        Args:
+            event_id (int): ID мероприятия.
+            jwt_token (str): JWT токен пользователя.
+            store (AdmissionStore): Хранилище очереди.
+
+        Returns:
+            QueueJoinResponseDTO: Пропуск очереди и место в ней.
+
+        Raises:
+            NoTokenError: Токен неправильный/отсутствует.
+        """
+        ...
+
+    async def status(
+        self, event_id: int, queue_token: str, store: "AdmissionStore"
+    ) -> "QueueStatusResponseDTO":
+        """
+        Метод для опроса места в очереди.
+
+        Args:
+            event_id (int): ID мероприятия.
+            queue_token (str): Пропуск очереди.
+            store (AdmissionStore): Хранилище очереди.
+
+        Returns:
+            QueueStatusResponseDTO: Место в очереди и оценка ожидания.
+
+        Raises:
+            QueueTokenError: Пропуск неверный/истек/от другого мероприятия.
+        """
+        ...
@@ -1,13 +1,20 @@
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, AsyncIterator, Protocol
 
 if TYPE_CHECKING:
-    from infrastructure.messaging.producer import RabbitProducer
+    from infrastructure.prefilter.ticket_codes import BloomFilter
+    from infrastructure.reservations.holds import TicketHolds
     from schemas import (
         ActivateQrCodeResponseDTO,
         AllActiveTicketsEventResponseDTO,
         AllTicketsEventResponseDTO,
+        ScanBatchDTO,
+        ScanBatchResponseDTO,
         TicketCreateDTO,
         TicketCreateResponseDTO,
+        TicketHoldDTO,
+        TicketHoldResponseDTO,
+        TicketsCreateDTO,
+        TicketsCreateResponseDTO,
     )
 
 
@@ -18,7 +25,7 @@ class ManagementTicketsProtocol(Protocol):
         self,
         data: "TicketCreateDTO",
         jwt_token: str,
-        rabbit_producer: "RabbitProducer",
+        ticket_holds: "TicketHolds",
     ) -> "TicketCreateResponseDTO":
         """
         Метод для создания билета на мероприятие.
@@ -26,6 +33,7 @@ class ManagementTicketsProtocol(Protocol):
         Args:
             data (TicketCreateDTO): Данные для создания билета.
             jwt_token (str): JWT токен пользователя.
+            ticket_holds (TicketHolds): Брони (места в чужих бронях не продаются).
 
         Returns:
             TicketCreateResponseDTO: Возвращает данные о созданном билете.
@@ -35,6 +43,97 @@ class ManagementTicketsProtocol(Protocol):
         """
         ...
 
+    async def create_tickets(
+        self,
+        data: "TicketsCreateDTO",
+        jwt_token: str,
+        ticket_holds: "TicketHolds",
+    ) -> "TicketsCreateResponseDTO":
+        """
+        Метод для покупки нескольких билетов мероприятия одной транзакцией.
+
+        Args:
+            data (TicketsCreateDTO): Мероприятие, типы билетов и их количество.
+            jwt_token (str): JWT токен пользователя.
+            ticket_holds (TicketHolds): Брони (места в чужих бронях не продаются).
+
+        Returns:
+            TicketsCreateResponseDTO: Возвращает купленные билеты.
+
+        Raises:
+            NoTokenError: Токен неправильный/отсутствует.
+            TokenError: Пользователя из токена не существует.
+            ValidationError: Неверные данные/превышен лимит билетов в покупке.
+            TicketLimitError: Билетов какого-то типа не хватает.
+        """
+        ...
+
+    async def hold_tickets(
+        self, data: "TicketHoldDTO", jwt_token: str, ticket_holds: "TicketHolds"
+    ) -> "TicketHoldResponseDTO":
+        """
+        Метод для брони мест на `HOLD_TTL_SECONDS` (до подтверждения покупки).
+
+        Args:
+            data (TicketHoldDTO): Мероприятие, тип билета и количество мест.
+            jwt_token (str): JWT токен пользователя.
+            ticket_holds (TicketHolds): Брони.
+
+        Returns:
+            TicketHoldResponseDTO: Возвращает бронь и время ее истечения.
+
+        Raises:
+            NoTokenError: Токен неправильный/отсутствует.
+            ValidationError: Типа билета у мероприятия не существует.
+            TicketLimitError: Свободных мест не хватает.
+        """
+        ...
+
+    async def confirm_hold(
+        self,
+        hold_id: str,
+        jwt_token: str,
+        ticket_holds: "TicketHolds",
+    ) -> "TicketsCreateResponseDTO":
+        """
+        Метод для подтверждения брони: места брони становятся билетами.
+
+        Бронь снимается только после коммита покупки: до него места брони не
+        видны другим покупателям, а если покупка не удалась, бронь остается.
+
+        Args:
+            hold_id (str): ID брони.
+            jwt_token (str): JWT токен пользователя.
+            ticket_holds (TicketHolds): Брони.
+
+        Returns:
+            TicketsCreateResponseDTO: Возвращает купленные билеты.
+
+        Raises:
+            NoTokenError: Токен неправильный/отсутствует.
+            HoldError: Брони нет или она истекла.
+            ForbiddenError: Бронь другого пользователя.
+        """
+        ...
+
+    async def release_hold(
+        self, hold_id: str, jwt_token: str, ticket_holds: "TicketHolds"
+    ) -> None:
+        """
+        Метод для отмены брони (места сразу возвращаются в продажу).
+
+        Args:
+            hold_id (str): ID брони.
+            jwt_token (str): JWT токен пользователя.
+            ticket_holds (TicketHolds): Брони.
+
+        Raises:
+            NoTokenError: Токен неправильный/отсутствует.
+            HoldError: Брони нет или она истекла.
+            ForbiddenError: Бронь другого пользователя.
+        """
+        ...
+
     async def delete_ticket(self, ticket_id: int, jwt_token: str) -> None:
         """
         Метод для удаления билета.
@@ -49,7 +148,10 @@ class ManagementTicketsProtocol(Protocol):
         ...
 
     async def activate_qr_code(
-        self, jwt_token: str, code: str, rabbit_producer: "RabbitProducer"
+        self,
+        jwt_token: str,
+        code: str,
+        code_filter: "BloomFilter",
     ) -> "ActivateQrCodeResponseDTO":
         """
         Метод для активации кьюаркода.
@@ -57,12 +159,55 @@ class ManagementTicketsProtocol(Protocol):
         Args:
             jwt_token (str): JWT токен пользователя.
             code (str): Уникальный код билета
+            code_filter (BloomFilter): Префильтр кодов старого формата.
 
         Returns:
             ActivateQrCodeResponseDTO (BaseModel): Возвращает пайдемик модель.
 
         Raises:
             NoTokenError: Токен неправильный/отсутствует.
+            ValidationError: Код поддельный (отсекается без запроса в БД).
+        """
+        ...
+
+    async def scan_batch(
+        self, jwt_token: str, data: "ScanBatchDTO", code_filter: "BloomFilter"
+    ) -> "ScanBatchResponseDTO":
+        """
+        Метод для активации пачки сканов (сканер копит их офлайн и отправляет разом).
+
+        Args:
+            jwt_token (str): JWT токен пользователя.
+            data (ScanBatchDTO): Мероприятие и коды билетов.
+            code_filter (BloomFilter): Префильтр кодов старого формата.
+
+        Returns:
+            ScanBatchResponseDTO: Сколько активировано, повторы и конфликты по кодам.
+
+        Raises:
+            NoTokenError: Токен неправильный/отсутствует.
+            ValidationError: Мероприятия не существует.
+            ForbiddenError: Пользователь не создатель мероприятия.
+        """
+        ...
+
+    async def event_manifest(
+        self, jwt_token: str, event_id: int
+    ) -> AsyncIterator[bytes]:
+        """
+        Метод для манифеста мероприятия (NDJSON) для сканеров на входе.
+
+        Args:
+            jwt_token (str): JWT токен пользователя.
+            event_id (int): ID мероприятия.
+
+        Returns:
+            AsyncIterator[bytes]: Строки манифеста порциями по `MANIFEST_CHUNK`.
+
+        Raises:
+            NoTokenError: Токен неправильный/отсутствует.
+            ValidationError: Мероприятия не существует.
+            ForbiddenError: Пользователь не создатель мероприятия.
         """
         ...
 
@@ -1,7 +1,6 @@
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
-    from infrastructure.messaging.producer import RabbitProducer
     from models.models import TicketTypes
     from models.session import DBBaseModel
     from schemas import CreateTicketTypeDTO, EditTicketTypeDTO
@@ -14,7 +13,6 @@ class ManagementTicketTypeProtocol(Protocol):
         self,
         jwt_token: str,
         ticket_type_data: "CreateTicketTypeDTO",
-        rabbit_producer: "RabbitProducer",
     ) -> "TicketTypes":
         """
         Метод для создания типа билета для мероприятия.
@@ -3,7 +3,6 @@ from typing import TYPE_CHECKING, Protocol
 from fastapi import Response
 
 if TYPE_CHECKING:
-    from infrastructure.messaging.producer import RabbitProducer
     from schemas import (
         CreateUserDTO,
         CreateUserResponseDTO,
@@ -20,7 +19,6 @@ class ManagementUsersProtocol(Protocol):
         self,
         response: Response,
         user: "CreateUserDTO",
-        rabbit_producer: "RabbitProducer",
     ) -> "CreateUserResponseDTO":
         """
         Метод для создания пользователя в базе данных.
@@ -0,0 +1,69 @@
+from typing import Annotated, Any
+
+from pydantic import BaseModel, Field
+
+
+# [CacheStats]
+class CacheNameStatsResponseDTO(BaseModel):
+    """Статистика кеша одного unique_name"""
+
+    keys: Annotated[int, Field(description="Ключей со значением")] = 0
+    stale_keys: Annotated[int, Field(description="Stale копий (SWR)")] = 0
+    locks: Annotated[int, Field(description="Активных локов пересчета")] = 0
+    bytes: Annotated[
+        int, Field(description="Оценка памяти в Redis (MEMORY USAGE по выборке)")
+    ] = 0
+
+    # счетчики воркера, который обработал запрос
+    hits: Annotated[int, Field(description="Попадания в Redis")] = 0
+    hits_l1: Annotated[int, Field(description="Попадания в L1")] = 0
+    hits_stale: Annotated[int, Field(description="Отданные stale значения")] = 0
+    misses: Annotated[int, Field(description="Промахи")] = 0
+    bypassed: Annotated[
+        int, Field(description="Вызовы в обход Redis (предохранитель открыт)")
+    ] = 0
+    saves: Annotated[int, Field(description="Сохранения")] = 0
+    invalidations: Annotated[int, Field(description="Удаленные ключи")] = 0
+    decode_errors: Annotated[int, Field(description="Ошибки декодирования")] = 0
+    mean_decode_us: Annotated[
+        float, Field(description="Среднее время декодирования (мкс)")
+    ] = 0.0
+
+
+class CacheStatsResponseDTO(BaseModel):
+    """Модель ответа статистики кеша"""
+
+    names: Annotated[
+        dict[str, CacheNameStatsResponseDTO],
+        Field(description="Статистика по unique_name"),
+    ]
+    tags: Annotated[dict[str, int], Field(description="Число ключей в каждом теге")]
+    l1: Annotated[dict[str, int], Field(description="Состояние L1 воркера")]
+    breaker: Annotated[
+        dict[str, Any], Field(description="Предохранитель Redis воркера")
+    ]
+    scanned_keys: Annotated[int, Field(description="Просмотрено ключей (SCAN)")]
+    degraded: Annotated[
+        bool, Field(description="Redis недоступен: только счетчики воркера")
+    ] = False
+
+
+# [TicketCodeFilterStats]
+class TicketCodeFilterStatsResponseDTO(BaseModel):
+    """Префильтр кодов билетов старого формата (воркер, обработавший запрос)"""
+
+    items: Annotated[int, Field(description="Кодов в фильтре")]
+    bits: Annotated[int, Field(description="Размер фильтра (бит)")]
+    hashes: Annotated[int, Field(description="Хеш-функций")]
+    bytes: Annotated[int, Field(description="Память фильтра")]
+    expected_fp_rate: Annotated[
+        float, Field(description="Ожидаемая доля ложных срабатываний")
+    ]
+    checks: Annotated[int, Field(description="Проверок кодов")]
+    rejected: Annotated[int, Field(description="Отсеяно без БД")]
+    false_positives: Annotated[
+        int, Field(description="Прошли фильтр, но билета в БД нет")
+    ]
+    observed_fp_rate: Annotated[
+        float, Field(description="Наблюдаемая доля ложных срабатываний")
+    ]
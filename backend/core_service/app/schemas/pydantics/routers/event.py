@@ -2,9 +2,10 @@ from datetime import datetime
 from enum import Enum, unique
 from typing import Annotated, Self
 
-from fastapi import Form
+from fastapi import Form, Query
 from pydantic import BaseModel, Field
 
+from core.config import config
 from schemas.pydantics.cfg_base_model import ConfigBaseModelResponseDTO
 
 
@@ -136,3 +137,87 @@ class EditEventResponseDTO(CreateEventResponseDTO):
 # [AllElements]
 class AllElementsResponseDTO(CreateEventResponseDTO):
     pass
+
+
+class EventsFilterDTO(BaseModel):
+    """Фильтры и страница списка мероприятий"""
+
+    status: StatusForm | None = None
+    category: CategoriesForm | None = None
+    creator_id: int | None = None
+    date_from: datetime | None = None
+    date_to: datetime | None = None
+    limit: int = 20
+    cursor: str | None = None
+
+    @classmethod
+    def validate_query(
+        cls,
+        status: Annotated[
+            StatusForm | None, Query(description="Статус мероприятия")
+        ] = None,
+        category: Annotated[
+            CategoriesForm | None, Query(description="Категория мероприятия")
+        ] = None,
+        creator_id: Annotated[
+            int | None,
+            Query(description="ID создателя", ge=1, le=config.MAX_ID),
+        ] = None,
+        date_from: Annotated[
+            datetime | None, Query(description="Дата мероприятия от (включительно)")
+        ] = None,
+        date_to: Annotated[
+            datetime | None, Query(description="Дата мероприятия до (не включая)")
+        ] = None,
+        limit: Annotated[
+            int, Query(description="Мероприятий на странице", ge=1, le=100)
+        ] = 20,
+        cursor: Annotated[
+            str | None,
+            Query(description="next_cursor прошлой страницы", max_length=200),
+        ] = None,
+    ) -> Self:
+        return cls(**locals())
+
+
+class EventsSearchDTO(BaseModel):
+    """Запрос полнотекстового поиска мероприятий"""
+
+    q: str
+    page: int = 1
+    limit: int = 20
+
+    @classmethod
+    def validate_query(
+        cls,
+        q: Annotated[
+            str,
+            Query(
+                ...,
+                description="Слова из названия, описания или адреса",
+                examples=["концерт в парке"],
+                min_length=2,
+                max_length=200,
+            ),
+        ],
+        page: Annotated[int, Query(description="Номер страницы", ge=1, le=50)] = 1,
+        limit: Annotated[
+            int, Query(description="Мероприятий на странице", ge=1, le=50)
+        ] = 20,
+    ) -> Self:
+        return cls(**locals())
+
+
+class EventsSearchResponseDTO(ConfigBaseModelResponseDTO):
+    items: list[AllElementsResponseDTO]
+    page: int
+    next_page: Annotated[
+        int | None, Field(description="Следующая страница (None - последняя)")
+    ]
+
+
+class EventsPageResponseDTO(ConfigBaseModelResponseDTO):
+    items: list[AllElementsResponseDTO]
+    next_cursor: Annotated[
+        str | None, Field(description="Курсор следующей страницы (None - последняя)")
+    ]
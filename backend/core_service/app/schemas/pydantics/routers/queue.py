@@ -0,0 +1,41 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from schemas.pydantics.cfg_base_model import ConfigBaseModelResponseDTO
+
+
+# [QueueConfig]
+class QueueConfigDTO(BaseModel):
+    """Модель для включения очереди на мероприятие"""
+
+    rate: Annotated[
+        float,
+        Field(description="Пропусков в секунду", examples=[5.0], gt=0, le=10_000),
+    ]
+
+    burst: Annotated[
+        int,
+        Field(
+            description="Запас пропусков (сколько пускается сразу)",
+            examples=[50],
+            ge=1,
+            le=100_000,
+        ),
+    ]
+
+
+# [QueueStatus]
+class QueueStatusResponseDTO(ConfigBaseModelResponseDTO):
+    event_id: int
+    admitted: bool
+    position: Annotated[
+        int, Field(description="Место в очереди (0 - допущен, -1 - допуск истек)")
+    ]
+    eta_seconds: Annotated[float, Field(description="Оценка ожидания (сек)")]
+
+
+class QueueJoinResponseDTO(QueueStatusResponseDTO):
+    queue_token: Annotated[
+        str, Field(description="Пропуск очереди (заголовок X-Queue-Token)")
+    ]
@@ -1,4 +1,5 @@
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, Field
 
@@ -7,6 +8,7 @@ from schemas.pydantics.cfg_base_model import ConfigBaseModelResponseDTO
 from schemas.pydantics.table_db import (
     AccountResponseDTO,
     EventResponseDTO,
+    TicketResponseDTO,
     TicketTypeResponseDTO,
 )
 
@@ -36,6 +38,81 @@ class TicketCreateResponseDTO(ConfigBaseModelResponseDTO):
     event: EventResponseDTO
 
 
+# [TicketsCreate]
+class TicketsCreateItemDTO(BaseModel):
+    """Сколько билетов одного типа купить"""
+
+    ticket_type_id: Annotated[
+        int, Field(description="ID типа билета", examples=[1], ge=1, le=config.MAX_ID)
+    ]
+
+    count: Annotated[
+        int,
+        Field(
+            description="Количество билетов",
+            examples=[2],
+            ge=1,
+            le=config.BULK_TICKETS_LIMIT,
+        ),
+    ]
+
+
+class TicketsCreateDTO(BaseModel):
+    """Модель для покупки нескольких билетов мероприятия"""
+
+    event_id: Annotated[
+        int, Field(description="ID мероприятия", examples=[1], ge=1, le=config.MAX_ID)
+    ]
+
+    tickets: Annotated[
+        list[TicketsCreateItemDTO],
+        Field(
+            description="Типы билетов и их количество",
+            min_length=1,
+            max_length=config.BULK_TICKETS_LIMIT,
+        ),
+    ]
+
+
+class TicketsCreateResponseDTO(ConfigBaseModelResponseDTO):
+    event_id: int
+    total: int
+    total_price: int
+    by_type: dict[str, int]
+    tickets: list[TicketResponseDTO]
+
+
+# [TicketHold]
+class TicketHoldDTO(BaseModel):
+    """Модель для брони мест"""
+
+    event_id: Annotated[
+        int, Field(description="ID мероприятия", examples=[1], ge=1, le=config.MAX_ID)
+    ]
+
+    ticket_type_id: Annotated[
+        int, Field(description="ID типа билета", examples=[1], ge=1, le=config.MAX_ID)
+    ]
+
+    count: Annotated[
+        int,
+        Field(
+            description="Количество мест",
+            examples=[2],
+            ge=1,
+            le=config.BULK_TICKETS_LIMIT,
+        ),
+    ]
+
+
+class TicketHoldResponseDTO(ConfigBaseModelResponseDTO):
+    hold_id: str
+    event_id: int
+    ticket_type_id: int
+    count: int
+    expires_at: datetime
+
+
 # [AllTicketsEvent]
 class AllTicketsEventResponseDTO(ConfigBaseModelResponseDTO):
     total: int
@@ -51,3 +128,38 @@ class AllActiveTicketsEventResponseDTO(AllTicketsEventResponseDTO):
 class ActivateQrCodeResponseDTO(ConfigBaseModelResponseDTO):
     activate: bool
     info: str
+
+
+# [ScanBatch]
+class ScanBatchDTO(BaseModel):
+    """Модель для пачки сканов со сканера на входе"""
+
+    event_id: Annotated[
+        int, Field(description="ID мероприятия", examples=[1], ge=1, le=config.MAX_ID)
+    ]
+
+    codes: Annotated[
+        list[Annotated[str, Field(min_length=2, max_length=1000)]],
+        Field(
+            description="Коды отсканированных билетов (повторы допускаются)",
+            min_length=1,
+            max_length=config.SCAN_BATCH_LIMIT,
+        ),
+    ]
+
+
+class ScanConflictDTO(ConfigBaseModelResponseDTO):
+    code: str
+    reason: Annotated[
+        Literal["used", "unknown", "invalid"],
+        Field(
+            description="used - уже активирован, unknown - нет билета, invalid - подпись"
+        ),
+    ]
+
+
+class ScanBatchResponseDTO(ConfigBaseModelResponseDTO):
+    event_id: int
+    activated: int
+    duplicates: Annotated[int, Field(description="Повторы кодов внутри пачки")]
+    conflicts: list[ScanConflictDTO]
@@ -1,17 +1,105 @@
 import base64
+import binascii
 import hashlib
 import hmac
-import secrets
+import struct
+from typing import Final, NamedTuple, Optional
 
 from core.config import config
 
+TICKET_CODE_VERSION: Final[int] = 1
+_PREFIX: Final[str] = "TKT."
+# версия, ID билета, ID мероприятия, ID типа билета
+_PAYLOAD: Final[struct.Struct] = struct.Struct(">BQQQ")
+_MAC_SIZE: Final[int] = hashlib.sha256().digest_size
+_CODE_SIZE: Final[int] = _PAYLOAD.size + _MAC_SIZE
 
-def generate_code_hmac_ticket(user_id: int, event_id: int, ticket_type_id: int) -> str:
-    payload = secrets.token_hex(8)  # 16 символов
-    data = f"{user_id}:{event_id}:{ticket_type_id}:{payload}"
 
-    signature = hmac.new(
-        config.SECRET_KEY_HMAC, data.encode(), hashlib.sha256
-    ).hexdigest()[:16]
+class TicketCode(NamedTuple):
+    """Содержимое проверенного кода билета"""
 
-    return f"TKT.{payload}.{signature}"
+    ticket_id: int
+    event_id: int
+    ticket_type_id: int
+    version: int
+
+
+def generate_ticket_code(ticket_id: int, event_id: int, ticket_type_id: int) -> str:
+    """
+    Код билета для кьюаркода: `TKT.` + base32(данные + HMAC-SHA256).
+
+    Код самоописывающий: сканер проверяет подпись и мероприятие без БД.
+    Base32 (A-Z, 2-7) входит в alphanumeric режим QR, поэтому кьюаркод меньше.
+
+    Args:
+        ticket_id (int): ID билета.
+        event_id (int): ID мероприятия.
+        ticket_type_id (int): ID типа билета.
+
+    Returns:
+        str: Код билета.
+    """
+    payload = _PAYLOAD.pack(TICKET_CODE_VERSION, ticket_id, event_id, ticket_type_id)
+    mac = hmac.digest(config.SECRET_KEY_HMAC, payload, hashlib.sha256)
+    return _PREFIX + base64.b32encode(payload + mac).decode().rstrip("=")
+
+
+def verify_ticket_code(
+    code: str, event_id: Optional[int] = None
+) -> Optional[TicketCode]:
+    """
+    Проверка кода билета без БД (подпись целиком, версия, мероприятие).
+
+    Args:
+        code (str): Код билета.
+        event_id (Optional[int]): Мероприятие, на котором сканируют. Defaults to None.
+
+    Returns:
+        Optional[TicketCode]: Содержимое кода или None (поддельный/чужой/не тот формат).
+    """
+    if not code.startswith(_PREFIX):
+        return None
+
+    body = code[len(_PREFIX) :]
+    try:
+        raw = base64.b32decode(body + "=" * (-len(body) % 8))
+    except (binascii.Error, ValueError):
+        return None
+    if len(raw) != _CODE_SIZE:
+        return None
+
+    payload, mac = raw[: _PAYLOAD.size], raw[_PAYLOAD.size :]
+    expected = hmac.digest(config.SECRET_KEY_HMAC, payload, hashlib.sha256)
+    if not hmac.compare_digest(mac, expected):
+        return None
+
+    version, ticket_id, code_event_id, ticket_type_id = _PAYLOAD.unpack(payload)
+    if version != TICKET_CODE_VERSION:
+        return None
+    if event_id is not None and code_event_id != event_id:
+        return None
+
+    return TicketCode(ticket_id, code_event_id, ticket_type_id, version)
+
+
+def is_legacy_ticket_code(code: str) -> bool:
+    """Код старого формата `TKT.<payload>.<signature>` (проверяется только по БД)"""
+    parts = code.split(".")
+    return (
+        len(parts) == 3
+        and parts[0] == "TKT"
+        and all(len(part) == 16 for part in parts[1:])
+    )
+
+
+def ticket_code_digest(code: str) -> str:
+    """
+    Отпечаток кода билета для манифеста сканеров (сам код в манифест не попадает).
+
+    Args:
+        code (str): Код билета.
+
+    Returns:
+        str: Первые 16 байт SHA-256 кода (hex).
+    """
+    return hashlib.sha256(code.encode()).hexdigest()[:32]
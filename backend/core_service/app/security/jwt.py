@@ -6,6 +6,9 @@ from jose import JWTError, jwt
 from sqlalchemy import Column
 
 from core.config import config
+from security.token_cache import VerifiedTokenCache, request_tokens
+
+verified_tokens = VerifiedTokenCache(config.JWT_CACHE_SIZE, config.JWT_CACHE_TTL)
 
 
 async def set_jwt_cookie(response: Response, token: str) -> None:
@@ -55,15 +58,38 @@ async def token_verification(jwt_token: str) -> Optional[int]:
     if not jwt_token:
         return None
 
+    # в рамках запроса токен проверяется один раз (ICache IParam + сервис)
+    checked = request_tokens()
+    if checked is not None and jwt_token in checked:
+        return checked[jwt_token]
+
+    digest = verified_tokens.digest(jwt_token)
+    if (user_id := verified_tokens.get(digest)) is None:
+        user_id = _decode_token(jwt_token, digest)
+
+    if checked is not None:
+        checked[jwt_token] = user_id
+    return user_id
+
+
+def _decode_token(jwt_token: str, digest: bytes) -> Optional[int]:
+    """Проверка подписи/exp и сохранение результата в `verified_tokens`"""
     try:
         payload = jwt.decode(
             jwt_token, config.SECRET_KEY, algorithms=[config.ALGORITHM]
         )
         user_id = payload.get("sub")
-        return int(user_id) if user_id else None
+        user_id = int(user_id) if user_id else None
     except (JWTError, ValueError):
         return None
 
+    if user_id is not None:
+        exp = payload.get("exp")
+        verified_tokens.set(
+            digest, user_id, exp if isinstance(exp, (int, float)) else None
+        )
+    return user_id
+
 
 # curl.exe -X POST "http://192.168.0.107:8000/api/auth/exists-login" `
 #   -H "accept: application/json" `
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta, timezone
+from typing import Final, NamedTuple, Optional
+
+from jose import JWTError, jwt
+
+from core.config import config
+
+# audience отделяет пропуск очереди от JWT авторизации (друг друга не заменяют)
+_AUDIENCE: Final[str] = "queue"
+
+
+class QueueTicket(NamedTuple):
+    """Содержимое пропуска очереди"""
+
+    event_id: int
+    user_id: int
+    queue_id: str
+
+
+def create_queue_token(event_id: int, user_id: int, queue_id: str) -> str:
+    """
+    Создание пропуска очереди мероприятия.
+
+    Args:
+        event_id (int): ID мероприятия.
+        user_id (int): ID пользователя.
+        queue_id (str): ID места в очереди.
+
+    Returns:
+        str: Подписанный пропуск (живет `QUEUE_TOKEN_TTL`).
+    """
+    expires = datetime.now(timezone.utc) + timedelta(seconds=config.QUEUE_TOKEN_TTL)
+    payload = {
+        "sub": str(user_id),
+        "event": event_id,
+        "qid": queue_id,
+        "aud": _AUDIENCE,
+        "exp": expires,
+    }
+    return jwt.encode(payload, config.SECRET_KEY, algorithm=config.ALGORITHM)
+
+
+def read_queue_token(token: Optional[str]) -> Optional[QueueTicket]:
+    """
+    Проверка подписи/срока пропуска очереди.
+
+    Args:
+        token (Optional[str]): Пропуск.
+
+    Returns:
+        Optional[QueueTicket]: Содержимое или None (нет пропуска/неверный/истек).
+    """
+    if not token:
+        return None
+
+    try:
+        payload = jwt.decode(
+            token, config.SECRET_KEY, algorithms=[config.ALGORITHM], audience=_AUDIENCE
+        )
+        return QueueTicket(int(payload["event"]), int(payload["sub"]), payload["qid"])
+    except (JWTError, KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,109 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+import hashlib
+import threading
+import time
+from typing import Iterator, Optional, final
+
+# токены, уже проверенные в текущем запросе (включая неудачные проверки)
+_request_tokens: ContextVar[Optional[dict[str, Optional[int]]]] = ContextVar(
+    "request_tokens", default=None
+)
+
+
+@final
+class VerifiedTokenCache:
+    """
+    LRU успешно проверенных JWT: `sha256(токен) -> user_id`.
+
+    Запись живет не дольше `exp` токена и не дольше `ttl`, поэтому истекший
+    токен из кеша не вернется. Неудачные проверки не кешируются: иначе мусорные
+    токены вытесняли бы настоящие.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """
+        Args:
+            max_size (int): Максимум записей.
+            ttl (float): Максимальное время жизни записи (сек).
+
+        Raises:
+            ValueError: Неверные входные данные.
+        """
+        if max_size <= 0 or ttl <= 0:
+            raise ValueError("max_size и ttl должны быть больше 0")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.__entries: OrderedDict[bytes, tuple[int, float]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def digest(jwt_token: str) -> bytes:
+        """Ключ записи (сам токен в памяти не храним)"""
+        return hashlib.sha256(jwt_token.encode()).digest()
+
+    def get(self, digest: bytes) -> Optional[int]:
+        """
+        ID пользователя проверенного токена.
+
+        Args:
+            digest (bytes): Результат `digest(токен)`.
+
+        Returns:
+            Optional[int]: ID пользователя или None (нет записи/истекла).
+        """
+        with self.__lock:
+            if (entry := self.__entries.get(digest)) is None:
+                return None
+
+            user_id, expires_at = entry
+            if expires_at <= time.time():
+                del self.__entries[digest]
+                return None
+
+            self.__entries.move_to_end(digest)
+            return user_id
+
+    def set(self, digest: bytes, user_id: int, exp: Optional[float] = None) -> None:
+        """
+        Сохранение проверенного токена.
+
+        Args:
+            digest (bytes): Результат `digest(токен)`.
+            user_id (int): ID пользователя из токена.
+            exp (Optional[float]): Время истечения токена (unix time). Defaults to None.
+        """
+        expires_at = time.time() + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, exp)
+
+        with self.__lock:
+            self.__entries[digest] = (user_id, expires_at)
+            self.__entries.move_to_end(digest)
+
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+@contextmanager
+def request_token_scope() -> Iterator[None]:
+    """Область одного запроса: токен проверяется в ней не больше одного раза"""
+    token = _request_tokens.set({})
+    try:
+        yield
+    finally:
+        _request_tokens.reset(token)
+
+
+def request_tokens() -> Optional[dict[str, Optional[int]]]:
+    """Проверенные в текущем запросе токены (None вне `request_token_scope`)"""
+    return _request_tokens.get()
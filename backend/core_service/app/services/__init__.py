@@ -1,3 +1,5 @@
+from .admin.get_service import get_admin_service
+from .admin.services import ManagementAdmin
 from .event.get_service import get_event_service
 from .event.responses import CREATE_EVENT_RESPONSES
 from .event.services import ManagementEvents
@@ -12,6 +14,8 @@ from .tickets.services import ManagementTickets
 from .user.get_service import get_user_service
 from .user.responses import CREATE_USER_RESPONSES, LOGIN_USER_RESPONSES
 from .user.services import ManagementUsers
+from .waiting_room.get_service import get_waiting_room_service
+from .waiting_room.services import ManagementWaitingRoom
 
 __all__ = [
     "get_user_service",
@@ -25,4 +29,8 @@ __all__ = [
     "ManagementTicketTypes",
     "get_tickets_service",
     "ManagementTickets",
+    "get_admin_service",
+    "ManagementAdmin",
+    "get_waiting_room_service",
+    "ManagementWaitingRoom",
 ]
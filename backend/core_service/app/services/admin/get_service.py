@@ -0,0 +1,6 @@
+from services.admin.services import ManagementAdmin
+
+
+def get_admin_service() -> ManagementAdmin:
+    """Функция возвращает сервис админ ручек"""
+    return ManagementAdmin()
@@ -0,0 +1,110 @@
+from core.config import config
+from core.exceptions import ForbiddenError, NoTokenError
+from infrastructure.admission.store import AdmissionStore
+from infrastructure.cache.cache_v2 import istats
+from infrastructure.prefilter.ticket_codes import BloomFilter
+from schemas import (
+    CacheStatsResponseDTO,
+    QueueConfigDTO,
+    TicketCodeFilterStatsResponseDTO,
+)
+from security.jwt import token_verification
+
+
+class ManagementAdmin:
+    """
+    Модуль (класс) для служебных ручек администратора.
+    """
+
+    async def cache_stats(self, jwt_token: str) -> CacheStatsResponseDTO:
+        """
+        Статистика кеша (ICache).
+
+        Args:
+            jwt_token (str): Токен пользователя.
+
+        Returns:
+            CacheStatsResponseDTO: Сводка по unique_name, тегам и L1.
+
+        Raises:
+            NoTokenError (HTTPException): Отсутствует/неправильный токен.
+            ForbiddenError (HTTPException): Пользователь не администратор.
+        """
+        await self.__check_admin(jwt_token)
+
+        return CacheStatsResponseDTO.model_validate(await istats.summary())
+
+    async def ticket_code_filter_stats(
+        self, jwt_token: str, code_filter: BloomFilter
+    ) -> TicketCodeFilterStatsResponseDTO:
+        """
+        Статистика префильтра кодов билетов (память, ложные срабатывания).
+
+        Args:
+            jwt_token (str): Токен пользователя.
+            code_filter (BloomFilter): Префильтр кодов старого формата.
+
+        Returns:
+            TicketCodeFilterStatsResponseDTO: Статистика фильтра воркера.
+
+        Raises:
+            NoTokenError (HTTPException): Отсутствует/неправильный токен.
+            ForbiddenError (HTTPException): Пользователь не администратор.
+        """
+        await self.__check_admin(jwt_token)
+
+        return TicketCodeFilterStatsResponseDTO.model_validate(code_filter.stats())
+
+    async def configure_queue(
+        self,
+        event_id: int,
+        data: QueueConfigDTO,
+        jwt_token: str,
+        store: AdmissionStore,
+    ) -> None:
+        """
+        Включение/изменение очереди на мероприятие.
+
+        Args:
+            event_id (int): ID мероприятия.
+            data (QueueConfigDTO): Скорость и запас пропусков.
+            jwt_token (str): Токен пользователя.
+            store (AdmissionStore): Хранилище очереди.
+
+        Raises:
+            NoTokenError (HTTPException): Отсутствует/неправильный токен.
+            ForbiddenError (HTTPException): Пользователь не администратор.
+        """
+        await self.__check_admin(jwt_token)
+
+        await store.configure(event_id, data.rate, data.burst)
+        return
+
+    async def disable_queue(
+        self, event_id: int, jwt_token: str, store: AdmissionStore
+    ) -> None:
+        """
+        Выключение очереди на мероприятие (покупка снова без пропуска).
+
+        Args:
+            event_id (int): ID мероприятия.
+            jwt_token (str): Токен пользователя.
+            store (AdmissionStore): Хранилище очереди.
+
+        Raises:
+            NoTokenError (HTTPException): Отсутствует/неправильный токен.
+            ForbiddenError (HTTPException): Пользователь не администратор.
+        """
+        await self.__check_admin(jwt_token)
+
+        await store.disable(event_id)
+        return
+
+    @staticmethod
+    async def __check_admin(jwt_token: str) -> None:
+        """Проверка прав администратора (ошибки как у ручек)"""
+        if not (user_id := await token_verification(jwt_token)):
+            raise NoTokenError()
+
+        if user_id not in config.ADMIN_IDS:
+            raise ForbiddenError()
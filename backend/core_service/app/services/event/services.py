@@ -1,17 +1,30 @@
-from typing import TYPE_CHECKING
+import base64
+import binascii
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import config
-from core.exceptions import NoTokenError, TokenError
-from infrastructure.messaging.producer import RabbitProducer
-from models.crud import all_info_table, create_event, del_event, edit_data, search_user
+from core.exceptions import NoTokenError, TokenError, ValidationError
+from models.crud import (
+    create_event,
+    del_event,
+    edit_data,
+    get_events_page,
+    search_events,
+    search_user,
+)
 from schemas import (
-    AllElementsResponseDTO,
     CreateEventResponseDTO,
     EditEventResponseDTO,
+    EventsFilterDTO,
+    EventsPageResponseDTO,
+    EventsSearchDTO,
+    EventsSearchResponseDTO,
     IntEventCreatorId,
     IntUserId,
+    OutboxMessage,
     StrEventAddress,
     StrEventDescription,
     StrEventTitle,
@@ -19,6 +32,7 @@ from schemas import (
 from security.jwt import token_verification
 
 if TYPE_CHECKING:
+    from models.models import Events
     from schemas import CreateEventDTO, EditEventDTO
 
 
@@ -27,14 +41,13 @@ class ManagementEvents:
     Модуль (класс) для управления мероприятиями.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     async def create_events(
         self,
         jwt_token: str,
         event: "CreateEventDTO",
-        rabbit_producer: RabbitProducer,
         file: bytes,
     ) -> CreateEventResponseDTO:
         """
@@ -62,6 +75,19 @@ class ManagementEvents:
 
         print(file)
 
+        def notify(created: "Events") -> OutboxMessage:
+            return {
+                "queue": config.QUEUE_NAME,
+                "body": {
+                    "type": "email",
+                    "payload": {
+                        "to": f"{created.creator.login}",
+                        "title": "Новое мероприятие",
+                        "text": f"Вы создали новое мероприятие '{created.title}'. Статус: {created.status}.",
+                    },
+                },
+            }
+
         event = await create_event(
             self.db,
             IntEventCreatorId(user_id),
@@ -70,31 +96,64 @@ class ManagementEvents:
             event.category.value,
             StrEventDescription(event.description),
             StrEventAddress(event.address),
+            notify,
         )
 
-        await rabbit_producer.add_to_queue(
-            config.QUEUE_NAME,
-            {
-                "type": "email",
-                "payload": {
-                    "to": f"{event.creator.login}",
-                    "title": "Новое мероприятие",
-                    "text": f"Вы создали новое мероприятие '{event.title}'. Статус: {event.status}.",
-                },
-            },
+        return CreateEventResponseDTO.model_validate(event)
+
+    async def all_events(
+        self, jwt_token: str, filters: EventsFilterDTO
+    ) -> EventsPageResponseDTO:
+        """
+        Метод для вывода страницы мероприятий (новые первыми).
+
+        Args:
+            jwt_token (str): Токен пользователя.
+            filters (EventsFilterDTO): Фильтры, размер страницы и курсор.
+
+        Returns:
+           EventsPageResponseDTO (BaseModel): Мероприятия и курсор следующей страницы.
+
+        Raises:
+            NoTokenError (HTTPException): Токен отсутствует.
+            ValidationError (HTTPException): Неверный курсор.
+        """
+        if not await token_verification(jwt_token):
+            raise NoTokenError()
+
+        # лишнее мероприятие только показывает, есть ли следующая страница
+        events = await get_events_page(
+            self.db,
+            filters.limit + 1,
+            _decode_cursor(filters.cursor),
+            filters.status,
+            filters.category,
+            filters.creator_id,
+            filters.date_from,
+            filters.date_to,
         )
 
-        return CreateEventResponseDTO.model_validate(event)
+        next_cursor = None
+        if len(events) > filters.limit:
+            events = events[: filters.limit]
+            next_cursor = _encode_cursor(events[-1].datetime, events[-1].id)
 
-    async def all_events(self, jwt_token: str) -> list[AllElementsResponseDTO]:
+        return EventsPageResponseDTO.model_validate(
+            {"items": events, "next_cursor": next_cursor}
+        )
+
+    async def search_events(
+        self, jwt_token: str, search: EventsSearchDTO
+    ) -> EventsSearchResponseDTO:
         """
-        Метод для вывода всех мероприятий (не оптимизирован для больших данных).
+        Метод для полнотекстового поиска мероприятий (лучшие совпадения первыми).
 
         Args:
             jwt_token (str): Токен пользователя.
+            search (EventsSearchDTO): Строка поиска и страница.
 
         Returns:
-           AllElementsResponseDTO (list[BaseModel]): Все мероприятия.
+           EventsSearchResponseDTO (BaseModel): Мероприятия и номер следующей страницы.
 
         Raises:
             NoTokenError (HTTPException): Токен отсутствует.
@@ -102,9 +161,19 @@ class ManagementEvents:
         if not await token_verification(jwt_token):
             raise NoTokenError()
 
-        events = await all_info_table(self.db, "Events")
+        # лишнее мероприятие только показывает, есть ли следующая страница
+        events = await search_events(
+            self.db, search.q, search.limit + 1, (search.page - 1) * search.limit
+        )
+
+        next_page = None
+        if len(events) > search.limit:
+            events = events[: search.limit]
+            next_page = search.page + 1
 
-        return [AllElementsResponseDTO.model_validate(event) for event in events]
+        return EventsSearchResponseDTO.model_validate(
+            {"items": events, "page": search.page, "next_page": next_page}
+        )
 
     async def edit_events(
         self, jwt_token: str, event_id: int, event: "EditEventDTO"
@@ -148,3 +217,27 @@ class ManagementEvents:
         await del_event(self.db, event_id, user_id)
 
         return
+
+
+def _encode_cursor(event_datetime: datetime, event_id: int) -> str:
+    """Курсор страницы: (datetime, id) последнего мероприятия"""
+    raw = f"{event_datetime.isoformat()}|{event_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: Optional[str]) -> Optional[tuple[datetime, int]]:
+    """
+    Разбор курсора `_encode_cursor`.
+
+    Raises:
+        ValidationError: Неверный курсор.
+    """
+    if cursor is None:
+        return None
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        event_datetime, event_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(event_datetime), int(event_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValidationError("Неверный курсор")
@@ -1,10 +1,12 @@
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.session import get_db
 from services.ticket_types.services import ManagementTicketTypes
 
 
-def get_ticket_types_service(db: Session = Depends(get_db)) -> ManagementTicketTypes:
+def get_ticket_types_service(
+    db: AsyncSession = Depends(get_db),
+) -> ManagementTicketTypes:
     """Функция возвращает созданную сессию БД"""
     return ManagementTicketTypes(db)
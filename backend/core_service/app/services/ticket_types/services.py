@@ -1,8 +1,9 @@
-from sqlalchemy.orm import Session
+from typing import TYPE_CHECKING
+
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import config
 from core.exceptions import NoTokenError
-from infrastructure.messaging.producer import RabbitProducer
 from models.crud import (
     create_type_ticket_event,
     del_ticket_type,
@@ -15,23 +16,26 @@ from schemas import (
     EditTicketTypeDTO,
     EditTicketTypeResponseDTO,
     GetTicketTypesResponseDTO,
+    OutboxMessage,
 )
 from security.jwt import token_verification
 
+if TYPE_CHECKING:
+    from models.models import TicketTypes
+
 
 class ManagementTicketTypes:
     """
     Модуль (класс) для управления мероприятиями.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     async def create_types_ticket_event(
         self,
         jwt_token: str,
         ticket_type_data: CreateTicketTypeDTO,
-        rabbit_producer: RabbitProducer,
     ) -> CreateTicketTypeResponseDTO:
         """
         Метод для создания типа билета для мероприятия.
@@ -52,6 +56,19 @@ class ManagementTicketTypes:
         if not await token_verification(jwt_token):
             raise NoTokenError()
 
+        def notify(created: "TicketTypes") -> OutboxMessage:
+            return {
+                "queue": config.QUEUE_NAME,
+                "body": {
+                    "type": "email",
+                    "payload": {
+                        "to": f"{created.event.creator.login}",
+                        "title": "Новый тип мероприятия",
+                        "text": f"Вы создали новый тип билета '{created.type}' для мероприятия '{created.event.title}'. Цена: {created.price} рублей.",
+                    },
+                },
+            }
+
         ticket_type = await create_type_ticket_event(
             self.db,
             ticket_type_data.event_id,
@@ -59,18 +76,7 @@ class ManagementTicketTypes:
             ticket_type_data.description,
             ticket_type_data.price,
             ticket_type_data.total_count,
-        )
-
-        await rabbit_producer.add_to_queue(
-            config.QUEUE_NAME,
-            {
-                "type": "email",
-                "payload": {
-                    "to": f"{ticket_type.event.creator.login}",
-                    "title": "Новый тип мероприятия",
-                    "text": f"Вы создали новый тип билета '{ticket_type.type}' для мероприятия '{ticket_type.event.title}'. Цена: {ticket_type.price} рублей.",
-                },
-            },
+            notify,
         )
 
         return CreateTicketTypeResponseDTO.model_validate(ticket_type)
@@ -1,10 +1,10 @@
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.session import get_db
 from services.tickets.services import ManagementTickets
 
 
-def get_tickets_service(db: Session = Depends(get_db)) -> ManagementTickets:
+def get_tickets_service(db: AsyncSession = Depends(get_db)) -> ManagementTickets:
     """Функция возвращает созданную сессию БД"""
     return ManagementTickets(db)
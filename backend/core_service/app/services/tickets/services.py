@@ -1,41 +1,77 @@
-from sqlalchemy.orm import Session
+from collections import defaultdict
+from datetime import datetime, timezone
+import json
+from typing import TYPE_CHECKING, AsyncIterator, Literal
+
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import config
-from core.exceptions import NoTokenError
-from infrastructure.messaging.producer import RabbitProducer
+from core.exceptions import (
+    ForbiddenError,
+    HoldError,
+    NoTokenError,
+    TicketLimitError,
+    TokenError,
+    ValidationError,
+)
+from infrastructure.prefilter.ticket_codes import BloomFilter
+from infrastructure.reservations.holds import Hold, TicketHolds
 from models.crud import (
     create_ticket_event,
+    create_tickets_event_bulk,
     db_activate_qr_code,
+    db_activate_qr_codes,
     db_all_active_tickets_event,
     db_all_tickets_event,
+    db_check_event_creator,
     delete_data,
+    get_ticket_type_remaining,
     search_user,
+    stream_event_manifest,
 )
+from models.session import SessionLocal
 from schemas import (
     ActivateQrCodeResponseDTO,
     AllActiveTicketsEventResponseDTO,
     AllTicketsEventResponseDTO,
+    CreateTicketsResult,
     IntUserId,
+    OutboxMessage,
+    ScanBatchDTO,
+    ScanBatchResponseDTO,
     TicketCreateDTO,
     TicketCreateResponseDTO,
+    TicketHoldDTO,
+    TicketActivation,
+    TicketHoldResponseDTO,
+    TicketsCreateDTO,
+    TicketsCreateResponseDTO,
+)
+from security.hmac import (
+    generate_ticket_code,
+    is_legacy_ticket_code,
+    ticket_code_digest,
+    verify_ticket_code,
 )
-from security.hmac import generate_code_hmac_ticket
 from security.jwt import token_verification
 
+if TYPE_CHECKING:
+    from models.models import Tickets
+
 
 class ManagementTickets:
     """
     Модуль (класс) для управления билетами.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     async def create_ticket(
         self,
         data: "TicketCreateDTO",
         jwt_token: str,
-        rabbit_producer: RabbitProducer,
+        ticket_holds: TicketHolds,
     ) -> TicketCreateResponseDTO:
         """
         Метод для создания билета на мероприятие.
@@ -43,6 +79,7 @@ class ManagementTickets:
         Args:
             data (TicketCreateDTO): Данные для создания билета.
             jwt_token (str): JWT токен пользователя.
+            ticket_holds (TicketHolds): Брони (места в чужих бронях не продаются).
 
         Returns:
             TicketCreateResponseDTO: Возвращает данные о созданном билете.
@@ -54,29 +91,230 @@ class ManagementTickets:
         if not user_id:
             raise NoTokenError()
 
-        unique_code = generate_code_hmac_ticket(
+        def notify(ticket: "Tickets") -> OutboxMessage:
+            return {
+                "queue": config.QUEUE_NAME,
+                "body": {
+                    "type": "email",
+                    "payload": {
+                        "to": f"{ticket.user.login}",
+                        "title": "Покупка билета",
+                        "text": f"{ticket.user.name}, спасибо за покупку билета на мероприятие '{ticket.event.title}'. Вы купили '{ticket.ticket_type.type}' билет за {ticket.ticket_type.price} рублей",
+                    },
+                },
+            }
+
+        held = await ticket_holds.held([data.ticket_type_id])
+        result = await create_ticket_event(
+            self.db,
             data.event_id,
             user_id,
             data.ticket_type_id,
+            generate_ticket_code,
+            held.get(data.ticket_type_id, 0),
+            notify,
         )
 
-        result = await create_ticket_event(
-            self.db, data.event_id, user_id, data.ticket_type_id, unique_code
+        return TicketCreateResponseDTO.model_validate(result)
+
+    async def create_tickets(
+        self,
+        data: "TicketsCreateDTO",
+        jwt_token: str,
+        ticket_holds: TicketHolds,
+    ) -> TicketsCreateResponseDTO:
+        """
+        Метод для покупки нескольких билетов мероприятия одной транзакцией.
+
+        Args:
+            data (TicketsCreateDTO): Мероприятие, типы билетов и их количество.
+            jwt_token (str): JWT токен пользователя.
+            ticket_holds (TicketHolds): Брони (места в чужих бронях не продаются).
+
+        Returns:
+            TicketsCreateResponseDTO: Возвращает купленные билеты.
+
+        Raises:
+            NoTokenError: Токен неправильный/отсутствует.
+            TokenError: Пользователя из токена не существует.
+            ValidationError: Неверные данные/превышен лимит билетов в покупке.
+            TicketLimitError: Билетов какого-то типа не хватает.
+        """
+        user_id = await token_verification(jwt_token)
+        if not user_id:
+            raise NoTokenError()
+
+        counts: defaultdict[int, int] = defaultdict(int)
+        for item in data.tickets:
+            counts[item.ticket_type_id] += item.count
+
+        if sum(counts.values()) > config.BULK_TICKETS_LIMIT:
+            raise ValidationError()
+
+        return await self.__buy_tickets(
+            user_id,
+            data.event_id,
+            counts,
+            await ticket_holds.held(counts),
         )
 
-        await rabbit_producer.add_to_queue(
-            config.QUEUE_NAME,
-            {
-                "type": "email",
-                "payload": {
-                    "to": f"{result.user.login}",
-                    "title": "Покупка билета",
-                    "text": f"{result.user.name}, спасибо за покупку билета на мероприятие '{result.event.title}'. Вы купили '{result.ticket_type.type}' билет за {result.ticket_type.price} рублей",
+    async def hold_tickets(
+        self, data: "TicketHoldDTO", jwt_token: str, ticket_holds: TicketHolds
+    ) -> TicketHoldResponseDTO:
+        """
+        Метод для брони мест на `HOLD_TTL_SECONDS` (до подтверждения покупки).
+
+        Args:
+            data (TicketHoldDTO): Мероприятие, тип билета и количество мест.
+            jwt_token (str): JWT токен пользователя.
+            ticket_holds (TicketHolds): Брони.
+
+        Returns:
+            TicketHoldResponseDTO: Возвращает бронь и время ее истечения.
+
+        Raises:
+            NoTokenError: Токен неправильный/отсутствует.
+            ValidationError: Типа билета у мероприятия не существует.
+            TicketLimitError: Свободных мест не хватает.
+        """
+        user_id = await token_verification(jwt_token)
+        if not user_id:
+            raise NoTokenError()
+
+        remaining = await get_ticket_type_remaining(
+            self.db, data.event_id, data.ticket_type_id
+        )
+        if remaining is None:
+            raise ValidationError()
+
+        hold = await ticket_holds.hold(
+            user_id, data.event_id, data.ticket_type_id, data.count, remaining
+        )
+        if hold is None:
+            raise TicketLimitError()
+
+        return TicketHoldResponseDTO.model_validate(hold)
+
+    async def confirm_hold(
+        self,
+        hold_id: str,
+        jwt_token: str,
+        ticket_holds: TicketHolds,
+    ) -> TicketsCreateResponseDTO:
+        """
+        Метод для подтверждения брони: места брони становятся билетами.
+
+        Бронь снимается только после коммита покупки: до него места брони не
+        видны другим покупателям, а если покупка не удалась, бронь остается.
+
+        Args:
+            hold_id (str): ID брони.
+            jwt_token (str): JWT токен пользователя.
+            ticket_holds (TicketHolds): Брони.
+
+        Returns:
+            TicketsCreateResponseDTO: Возвращает купленные билеты.
+
+        Raises:
+            NoTokenError: Токен неправильный/отсутствует.
+            HoldError: Брони нет или она истекла.
+            ForbiddenError: Бронь другого пользователя.
+        """
+        user_id = await token_verification(jwt_token)
+        if not user_id:
+            raise NoTokenError()
+
+        hold = self.__check_hold(await ticket_holds.begin_confirm(hold_id, user_id))
+
+        # свои места покупатель берет из брони, чужие брони вычитаются
+        held = await ticket_holds.held([hold.ticket_type_id])
+        held[hold.ticket_type_id] = max(
+            held.get(hold.ticket_type_id, 0) - hold.count, 0
+        )
+        try:
+            result = await self.__buy_tickets(
+                user_id, hold.event_id, {hold.ticket_type_id: hold.count}, held
+            )
+        except BaseException:
+            await ticket_holds.cancel_confirm(hold)
+            raise
+
+        await ticket_holds.finish_confirm(hold)
+        return result
+
+    async def release_hold(
+        self, hold_id: str, jwt_token: str, ticket_holds: TicketHolds
+    ) -> None:
+        """
+        Метод для отмены брони (места сразу возвращаются в продажу).
+
+        Args:
+            hold_id (str): ID брони.
+            jwt_token (str): JWT токен пользователя.
+            ticket_holds (TicketHolds): Брони.
+
+        Raises:
+            NoTokenError: Токен неправильный/отсутствует.
+            HoldError: Брони нет или она истекла.
+            ForbiddenError: Бронь другого пользователя.
+        """
+        user_id = await token_verification(jwt_token)
+        if not user_id:
+            raise NoTokenError()
+
+        self.__check_hold(await ticket_holds.claim(hold_id, user_id))
+        return
+
+    @staticmethod
+    def __check_hold(hold: Hold | Literal["missing", "forbidden"]) -> Hold:
+        """Ответ TicketHolds в бронь или ошибку (как у confirm_hold/release_hold)"""
+        if hold == "missing":
+            raise HoldError()
+        if hold == "forbidden":
+            raise ForbiddenError("Бронь принадлежит другому пользователю")
+        return hold
+
+    async def __buy_tickets(
+        self,
+        user_id: int,
+        event_id: int,
+        counts: dict[int, int],
+        held: dict[int, int],
+    ) -> TicketsCreateResponseDTO:
+        """Покупка билетов и одно письмо на всю покупку (create_tickets/confirm_hold)"""
+        user = (await search_user(self.db, user_id=IntUserId(user_id)))["id"]
+        if user is None:
+            raise TokenError()
+
+        def notify(result: CreateTicketsResult) -> OutboxMessage:
+            bought = ", ".join(
+                f"'{type_}' x{count}" for type_, count in result["by_type"].items()
+            )
+            return {
+                "queue": config.QUEUE_NAME,
+                "body": {
+                    "type": "email",
+                    "payload": {
+                        "to": f"{user.login}",
+                        "title": "Покупка билетов",
+                        "text": f"{user.name}, спасибо за покупку билетов на мероприятие '{result['event_title']}': {bought}. Сумма: {result['total_price']} рублей",
+                    },
                 },
-            },
+            }
+
+        result = await create_tickets_event_bulk(
+            self.db, event_id, user_id, counts, generate_ticket_code, held, notify
         )
 
-        return TicketCreateResponseDTO.model_validate(result)
+        return TicketsCreateResponseDTO.model_validate(
+            {
+                "event_id": event_id,
+                "total": len(result["tickets"]),
+                "total_price": result["total_price"],
+                "by_type": result["by_type"],
+                "tickets": result["tickets"],
+            }
+        )
 
     async def delete_ticket(self, ticket_id: int, jwt_token: str) -> None:
         """
@@ -97,7 +335,10 @@ class ManagementTickets:
         return
 
     async def activate_qr_code(
-        self, jwt_token: str, code: str, rabbit_producer: RabbitProducer
+        self,
+        jwt_token: str,
+        code: str,
+        code_filter: BloomFilter,
     ) -> ActivateQrCodeResponseDTO:
         """
         Метод для активации кьюаркода.
@@ -105,36 +346,155 @@ class ManagementTickets:
         Args:
             jwt_token (str): JWT токен пользователя.
             code (str): Уникальный код билета
+            code_filter (BloomFilter): Префильтр кодов старого формата.
 
         Returns:
             ActivateQrCodeResponseDTO (BaseModel): Возвращает пайдемик модель.
 
         Raises:
             NoTokenError: Токен неправильный/отсутствует.
+            ValidationError: Код поддельный (отсекается без запроса в БД).
         """
         user_id = await token_verification(jwt_token)
         if not user_id:
             raise NoTokenError()
 
-        user = await search_user(self.db, user_id=IntUserId(user_id))
-
-        result = await db_activate_qr_code(self.db, user_id, code)
-
-        if result["activate"]:
-            await rabbit_producer.add_to_queue(
-                config.QUEUE_NAME,
-                {
+        # коды старого формата подписи не несут: префильтр, затем БД
+        legacy = verify_ticket_code(code) is None
+        if legacy and not (
+            is_legacy_ticket_code(code) and code_filter.might_contain(code)
+        ):
+            raise ValidationError()
+
+        # получатель письма приходит из UPDATE активации (без запроса заранее)
+        def notify(activation: TicketActivation) -> OutboxMessage:
+            return {
+                "queue": config.QUEUE_NAME,
+                "body": {
                     "type": "email",
                     "payload": {
-                        "to": f"{user['id'].login}",
+                        "to": f"{activation['login']}",
                         "title": "Активация билета",
-                        "text": f"{user['id'].name}, ваш билет был успешно активирован. Хорошего дня!",
+                        "text": f"{activation['name']}, ваш билет был успешно активирован. Хорошего дня!",
                     },
                 },
-            )
+            }
+
+        try:
+            result = await db_activate_qr_code(self.db, user_id, code, notify)
+        except ValidationError:
+            if legacy:
+                code_filter.false_positive()
+            raise
 
         return ActivateQrCodeResponseDTO.model_validate(result)
 
+    async def scan_batch(
+        self, jwt_token: str, data: "ScanBatchDTO", code_filter: BloomFilter
+    ) -> ScanBatchResponseDTO:
+        """
+        Метод для активации пачки сканов (сканер копит их офлайн и отправляет разом).
+
+        Повторы внутри пачки отбрасываются, поддельные и чужие коды отсекаются
+        без БД, остальные активируются одной транзакцией.
+
+        Args:
+            jwt_token (str): JWT токен пользователя.
+            data (ScanBatchDTO): Мероприятие и коды билетов.
+            code_filter (BloomFilter): Префильтр кодов старого формата.
+
+        Returns:
+            ScanBatchResponseDTO: Сколько активировано, повторы и конфликты по кодам.
+
+        Raises:
+            NoTokenError: Токен неправильный/отсутствует.
+            ValidationError: Мероприятия не существует.
+            ForbiddenError: Пользователь не создатель мероприятия.
+        """
+        user_id = await token_verification(jwt_token)
+        if not user_id:
+            raise NoTokenError()
+
+        await db_check_event_creator(self.db, data.event_id, user_id)
+
+        codes = list(dict.fromkeys(data.codes))
+        conflicts = []
+        unknown = []  # отсеяны префильтром
+        valid = []
+        for code in codes:
+            if verify_ticket_code(code, data.event_id):
+                valid.append(code)
+            elif not is_legacy_ticket_code(code):
+                conflicts.append({"code": code, "reason": "invalid"})
+            elif code_filter.might_contain(code):
+                valid.append(code)
+            else:
+                unknown.append(code)
+
+        result = {"activated": [], "used": [], "unknown": []}
+        if valid:
+            result = await db_activate_qr_codes(self.db, data.event_id, valid)
+        conflicts += [{"code": code, "reason": "used"} for code in result["used"]]
+        conflicts += [
+            {"code": code, "reason": "unknown"} for code in result["unknown"] + unknown
+        ]
+
+        return ScanBatchResponseDTO.model_validate(
+            {
+                "event_id": data.event_id,
+                "activated": len(result["activated"]),
+                "duplicates": len(data.codes) - len(codes),
+                "conflicts": conflicts,
+            }
+        )
+
+    async def event_manifest(
+        self, jwt_token: str, event_id: int
+    ) -> AsyncIterator[bytes]:
+        """
+        Метод для манифеста мероприятия (NDJSON) для сканеров на входе.
+
+        Первая строка - заголовок `{"event_id", "generated_at"}`, дальше по строке
+        на билет: `[id, ticket_type_id, отпечаток кода, is_used]`. Вместо кода
+        отдается `ticket_code_digest`: по манифесту билет не подделать.
+
+        Args:
+            jwt_token (str): JWT токен пользователя.
+            event_id (int): ID мероприятия.
+
+        Returns:
+            AsyncIterator[bytes]: Строки манифеста порциями по `MANIFEST_CHUNK`.
+
+        Raises:
+            NoTokenError: Токен неправильный/отсутствует.
+            ValidationError: Мероприятия не существует.
+            ForbiddenError: Пользователь не создатель мероприятия.
+        """
+        user_id = await token_verification(jwt_token)
+        if not user_id:
+            raise NoTokenError()
+
+        await db_check_event_creator(self.db, event_id, user_id)
+        generated_at = datetime.now(timezone.utc).isoformat()
+
+        async def lines() -> AsyncIterator[bytes]:
+            yield (
+                json.dumps({"event_id": event_id, "generated_at": generated_at}) + "\n"
+            ).encode()
+            async for rows in stream_event_manifest(
+                SessionLocal, event_id, config.MANIFEST_CHUNK
+            ):
+                yield "".join(
+                    json.dumps(
+                        [id_, type_id, ticket_code_digest(code), bool(used)],
+                        separators=(",", ":"),
+                    )
+                    + "\n"
+                    for id_, type_id, code, used in rows
+                ).encode()
+
+        return lines()
+
     async def all_active_tickets_event(
         self, jwt_token: str, event_id: int
     ) -> AllActiveTicketsEventResponseDTO:
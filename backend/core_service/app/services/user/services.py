@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
 from fastapi import Response
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import config
 from core.exceptions import LoginError, NoTokenError, PasswordError
@@ -10,6 +10,7 @@ from schemas import (
     CreateUserResponseDTO,
     GetUserInfoResponseDTO,
     LoginUserResponseDTO,
+    OutboxMessage,
     StrUserLogin,
     StrUserName,
     StrUserPassword,
@@ -18,7 +19,7 @@ from security.hashing import hash_password, verify_password
 from security.jwt import create_access_token, set_jwt_cookie, token_verification
 
 if TYPE_CHECKING:
-    from infrastructure.messaging.producer import RabbitProducer
+    from models.models import Accounts
     from schemas import CreateUserDTO, LoginUserDTO, StrUserLogin
 
 
@@ -27,14 +28,13 @@ class ManagementUsers:
     Модуль для управления пользователем.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     async def create_user(
         self,
         response: Response,
         user: "CreateUserDTO",
-        rabbit_producer: "RabbitProducer",
     ) -> CreateUserResponseDTO:
         """
         Метод для создания пользователя в базе данных.
@@ -53,26 +53,30 @@ class ManagementUsers:
             InternalServerError (HTTPException): Ошибка сервера.
         """
         hash_pass = hash_password(user.password)
+
+        def notify(account: "Accounts") -> OutboxMessage:
+            return {
+                "queue": config.QUEUE_NAME,
+                "body": {
+                    "type": "email",
+                    "payload": {
+                        "to": f"{account.login}",
+                        "title": "Спасибо за регистрацию",
+                        "text": f"{account.name}, благодарим вас за регистрацию на нашем сайте!",
+                    },
+                },
+            }
+
         result = await user_registration(
             self.db,
             StrUserName(user.name),
             StrUserLogin(user.login),
             StrUserPassword(hash_pass),
+            notify,
         )
         token = await create_access_token(result.id)
         await set_jwt_cookie(response, token)
 
-        await rabbit_producer.add_to_queue(
-            config.QUEUE_NAME,
-            {
-                "type": "email",
-                "payload": {
-                    "to": f"{result.login}",
-                    "title": "Спасибо за регистрацию",
-                    "text": f"{result.name}, благодарим вас за регистрацию на нашем сайте!",
-                },
-            },
-        )
         return CreateUserResponseDTO.model_validate(result)
 
     async def login_user(
@@ -0,0 +1,6 @@
+from services.waiting_room.services import ManagementWaitingRoom
+
+
+def get_waiting_room_service() -> ManagementWaitingRoom:
+    """Функция возвращает сервис очереди на мероприятие"""
+    return ManagementWaitingRoom()
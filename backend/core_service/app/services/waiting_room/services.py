@@ -0,0 +1,82 @@
+from core.exceptions import NoTokenError, QueueTokenError
+from infrastructure.admission.store import AdmissionState, AdmissionStore
+from schemas import QueueJoinResponseDTO, QueueStatusResponseDTO
+from security.jwt import token_verification
+from security.queue_token import create_queue_token, read_queue_token
+
+# очередь выключена - пускаем сразу
+_OPEN = AdmissionState(admitted=True, position=0, eta_seconds=0.0)
+
+
+class ManagementWaitingRoom:
+    """
+    Модуль (класс) для виртуальной очереди на продажу билетов.
+    """
+
+    async def join(
+        self, event_id: int, jwt_token: str, store: AdmissionStore
+    ) -> QueueJoinResponseDTO:
+        """
+        Метод для входа в очередь мероприятия.
+
+        Место в очереди одно на пользователя: повторный вход его не сбрасывает.
+
+        Args:
+            event_id (int): ID мероприятия.
+            jwt_token (str): JWT токен пользователя.
+            store (AdmissionStore): Хранилище очереди.
+
+        Returns:
+            QueueJoinResponseDTO: Пропуск очереди и место в ней.
+
+        Raises:
+            NoTokenError: Токен неправильный/отсутствует.
+        """
+        user_id = await token_verification(jwt_token)
+        if not user_id:
+            raise NoTokenError()
+
+        queue_id = str(user_id)
+        state = await store.advance(event_id, queue_id, join=True) or _OPEN
+
+        return QueueJoinResponseDTO.model_validate(
+            {
+                "event_id": event_id,
+                "admitted": state.admitted,
+                "position": state.position,
+                "eta_seconds": state.eta_seconds,
+                "queue_token": create_queue_token(event_id, user_id, queue_id),
+            }
+        )
+
+    async def status(
+        self, event_id: int, queue_token: str, store: AdmissionStore
+    ) -> QueueStatusResponseDTO:
+        """
+        Метод для опроса места в очереди.
+
+        Args:
+            event_id (int): ID мероприятия.
+            queue_token (str): Пропуск очереди.
+            store (AdmissionStore): Хранилище очереди.
+
+        Returns:
+            QueueStatusResponseDTO: Место в очереди и оценка ожидания.
+
+        Raises:
+            QueueTokenError: Пропуск неверный/истек/от другого мероприятия.
+        """
+        ticket = read_queue_token(queue_token)
+        if ticket is None or ticket.event_id != event_id:
+            raise QueueTokenError()
+
+        state = await store.advance(event_id, ticket.queue_id, join=False) or _OPEN
+
+        return QueueStatusResponseDTO.model_validate(
+            {
+                "event_id": event_id,
+                "admitted": state.admitted,
+                "position": state.position,
+                "eta_seconds": state.eta_seconds,
+            }
+        )
@@ -0,0 +1,97 @@
+"""
+Бенчмарк кодеков ICache на payload `list_events`.
+
+Сравнивает старый способ (`str(dict)` + `replace("'", '"')` + `json.loads`)
+с CacheSerializer: время encode/decode и размер значения в Redis.
+
+Запуск:
+    python benchmarks/bench_cache_codecs.py [кол-во мероприятий]
+"""
+
+from datetime import datetime, timedelta, timezone
+import json
+from pathlib import Path
+import sys
+import timeit
+from typing import Any, Callable
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from backend.core_service.app.infrastructure.cache.codecs import (
+    CacheSerializer,
+    JsonCodec,
+    MsgpackCodec,
+    lz4_frame,
+    msgpack,
+    zstandard,
+)
+
+
+def make_list_events_payload(count: int) -> list[dict[str, Any]]:
+    """Payload как после `jsonable_encoder(list[AllElementsResponseDTO])`"""
+    start = datetime(2025, 6, 1, 18, 0, tzinfo=timezone.utc)
+    return [
+        {
+            "id": index,
+            "title": f"Конференция по Python №{index}",
+            "category": "Конференция",
+            "status": "опубликовано",
+            "description": "Ежегодная конференция для разработчиков. "
+            "Доклады, воркшопы и нетворкинг до позднего вечера. " * 3,
+            "creator_id": index % 50 + 1,
+            "address": "Ул. Штурманская, д. 30",
+            "datetime": (start + timedelta(hours=index)).isoformat(),
+        }
+        for index in range(1, count + 1)
+    ]
+
+
+def legacy_dumps(value: Any) -> bytes:
+    return str(value).encode()
+
+
+def legacy_loads(data: bytes) -> Any:
+    return json.loads(data.decode().replace("'", '"'))
+
+
+def bench(
+    name: str,
+    dumps: Callable[[Any], bytes],
+    loads: Callable[[bytes], Any],
+    payload: Any,
+    number: int,
+) -> None:
+    encoded = dumps(payload)
+    encode_us = timeit.timeit(lambda: dumps(payload), number=number) / number * 1e6
+    decode_us = timeit.timeit(lambda: loads(encoded), number=number) / number * 1e6
+    print(f"{name:<24} {encode_us:>12.1f} {decode_us:>12.1f} {len(encoded):>12}")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    number = 200
+    payload = make_list_events_payload(count)
+
+    serializers: dict[str, CacheSerializer] = {
+        "json (stdlib)": CacheSerializer(JsonCodec()),
+        "orjson": CacheSerializer(),
+    }
+    if msgpack is not None:
+        serializers["msgpack"] = CacheSerializer(MsgpackCodec())
+    if zstandard is not None:
+        serializers["orjson + zstd"] = CacheSerializer(compression="zstd")
+    if lz4_frame is not None:
+        serializers["orjson + lz4"] = CacheSerializer(compression="lz4")
+
+    print(f"list_events: {count} мероприятий, {number} повторов")
+    print(f"{'кодек':<24} {'encode, мкс':>12} {'decode, мкс':>12} {'байт':>12}")
+
+    # старый формат падает на апострофах, поэтому меряем его на payload без них
+    bench("legacy str+replace", legacy_dumps, legacy_loads, payload, number)
+
+    for name, serializer in serializers.items():
+        bench(name, serializer.dumps, serializer.loads, payload, number)
+
+
+if __name__ == "__main__":
+    main()
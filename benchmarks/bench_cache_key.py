@@ -0,0 +1,100 @@
+"""
+Бенчмарк генерации ключа ICache на сигнатуре роутера `list_events`.
+
+Сравнивает старый путь (signature + bind на каждый вызов, deepcopy
+`functions`/`data`, runtime проверки протоколов, `json.dumps`) с планом
+`_KeyPlan`, собранным при декорировании.
+
+Запуск (нужен Redis: модуль подключается при импорте):
+    python benchmarks/bench_cache_key.py [кол-во вызовов]
+"""
+
+import asyncio
+from copy import deepcopy
+import hashlib
+from inspect import signature
+import json
+from pathlib import Path
+import sys
+import time
+from typing import Any, Awaitable, Callable
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from backend.core_service.app.infrastructure.cache.cache_v2 import (
+    IParam,
+    LoggerProtocol,
+    RedisProtocol,
+    _AsyncRedisService,
+    _KeyPlan,
+    _LogInfo,
+    _pydantic_transformations,
+)
+
+
+def verify(jwt_token: str) -> int:
+    """Дешевая замена token_verification: меряем только ICache"""
+    return len(jwt_token)
+
+
+async def list_events(
+    jwt_token: str, limit: int = 20, category: str | None = None, service: Any = None
+) -> list[Any]:
+    return []
+
+
+FUNCTIONS: list[Any] = [IParam(verify, "jwt_token")]
+DATA: list[Any] = ["limit", "category"]
+KWARGS: dict[str, Any] = {"jwt_token": "eyJhbGciOiJIUzI1NiJ9." * 8, "limit": 50}
+
+
+async def legacy_key(logger: _LogInfo, redis: Any) -> str:
+    """Старый путь генерации ключа (до плана)"""
+    if not isinstance(logger, LoggerProtocol) or not isinstance(redis, RedisProtocol):
+        raise TypeError
+
+    bound = signature(list_events).bind(**KWARGS)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+
+    parameters: dict[str, Any] = {}
+    for operation in deepcopy(FUNCTIONS):
+        if not isinstance(logger, LoggerProtocol):
+            raise TypeError
+        await operation(logger, arguments)
+
+    data = deepcopy(DATA)
+    for index, elem in enumerate(data):
+        if isinstance(elem, str) and elem in arguments:
+            data[index] = _pydantic_transformations(arguments[elem])
+    parameters["__idata__"] = data
+
+    serialized = json.dumps(parameters, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(serialized).hexdigest()
+
+
+async def bench(name: str, call: Callable[[], Awaitable[Any]], number: int) -> None:
+    for _ in range(1_000):  # прогрев
+        await call()
+
+    started = time.perf_counter()
+    for _ in range(number):
+        await call()
+    per_call_us = (time.perf_counter() - started) / number * 1e6
+    print(f"{name:<24} {per_call_us:>12.2f}")
+
+
+async def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    logger = _LogInfo("bench")
+    redis = _AsyncRedisService(logger)
+    plan = _KeyPlan(logger, "event-cache", list_events, FUNCTIONS, DATA, redis)
+
+    print(f"list_events: {number} вызовов")
+    print(f"{'путь':<24} {'мкс/вызов':>12}")
+    await bench("legacy", lambda: legacy_key(logger, redis), number)
+    await bench("_KeyPlan", lambda: plan((), KWARGS), number)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""
+Бенчмарк конкурентных запросов к БД внутри одного event loop (один воркер uvicorn).
+
+Сравнивает синхронную `Session` внутри `async` функции (как было в crud.py) с
+`AsyncSession` (aiosqlite). Каждый "запрос" выполняет медленный SQL, параллельно
+работает тикер, который меряет задержку event loop: при синхронной сессии loop
+блокируется на всё время запроса.
+
+Запуск:
+    python benchmarks/bench_db_async.py [кол-во одновременных запросов]
+"""
+
+import asyncio
+from pathlib import Path
+import sys
+import tempfile
+import time
+from typing import Awaitable, Callable
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+# ~десятки мс работы SQLite на запрос
+SLOW_QUERY = text(
+    "WITH RECURSIVE cnt(x) AS "
+    "(SELECT 1 UNION ALL SELECT x + 1 FROM cnt WHERE x < 300000) "
+    "SELECT count(*) FROM cnt"
+)
+
+
+async def loop_lag(stop: asyncio.Event) -> float:
+    """Максимальная задержка тика event loop (мс)"""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.001)
+        worst = max(worst, time.perf_counter() - started - 0.001)
+    return worst * 1000
+
+
+async def bench(name: str, handler: Callable[[], Awaitable[None]], number: int) -> None:
+    await handler()  # прогрев пула
+
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(loop_lag(stop))
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(handler() for _ in range(number)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    lag_ms = await ticker
+    print(f"{name:<16} {elapsed:>10.2f} {number / elapsed:>10.1f} {lag_ms:>14.1f}")
+
+
+async def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    path = Path(tempfile.mkdtemp()) / "bench.db"
+
+    sync_session = sessionmaker(
+        create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    )
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async_session = async_sessionmaker(async_engine)
+
+    async def sync_handler() -> None:
+        with sync_session() as db:
+            db.execute(SLOW_QUERY).scalar()
+
+    async def async_handler() -> None:
+        async with async_session() as db:
+            (await db.execute(SLOW_QUERY)).scalar()
+
+    print(f"{number} одновременных запросов")
+    print(f"{'сессия':<16} {'сек':>10} {'запр/сек':>10} {'лаг loop, мс':>14}")
+    await bench("Session", sync_handler, number)
+    await bench("AsyncSession", async_handler, number)
+
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
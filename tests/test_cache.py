@@ -1,6 +1,9 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
+import threading
+import time
 
 import pytest
 
@@ -9,12 +12,19 @@ import pytest
 sys.path.append(str(Path(__file__).parent.parent))
 
 
-from backend.core_service.app.infrastructure.cache_v2 import (
+from backend.core_service.app.infrastructure.cache.cache_v2 import (
     ICache,
     ICacheWriter,
     IClearCache,
     IParam,
+    _AsyncRedisService,
+    _CircuitBreaker,
+    _KeyPlan,
+    _LogInfo,
+    _SettingsRedis,
+    breaker,
     istats,
+    metrics,
 )
 
 # istats.all_cache(is_print=True)
@@ -64,7 +74,51 @@ def test_sync_cache_basic():
     assert any(call[0] == "mock_func" for call in calls)
 
 
-test_sync_cache_basic()
+@ICache(unique_name="test_sync_worker", tags=["sync_worker_tag"], data=["x"])
+def worker_func(x):
+    calls.append(("worker_func", threading.current_thread().name))
+    return x * 2
+
+
+@IClearCache(unique_name="clear_sync_worker", tags_delete=["sync_worker_tag"])
+def clear_sync_worker():
+    return True
+
+
+def worker_threads() -> set[str]:
+    """Потоки, в которых исполнялась worker_func"""
+    return {name for call, name in calls if call == "worker_func"}
+
+
+def test_sync_cache_threadpool():
+    calls.clear()
+    clear_sync_worker()  # ключи могли остаться от прошлого запуска
+
+    # синхронные функции из пула потоков (как def-ручки FastAPI)
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(worker_func, range(200)))
+
+    assert results == [x * 2 for x in range(200)]
+
+    # Проверка: один loop воркера на процесс, а не поток на каждый вызов
+    assert [t.name for t in threading.enumerate()].count("icache-worker") == 1
+
+    # Проверка: функция исполнялась в пуле loop воркера
+    threads = worker_threads()
+    assert all(name.startswith("icache-sync") for name in threads)
+    assert len(threads) <= _SettingsRedis.SYNC_WORKERS
+
+
+@pytest.mark.asyncio
+async def test_sync_cache_inside_loop():
+    calls.clear()
+    clear_sync_worker()
+
+    # синхронная функция под кешем, вызванная при работающем event loop
+    assert worker_func(1_000) == 2_000
+
+    assert [t.name for t in threading.enumerate()].count("icache-worker") == 1
+    assert all(name.startswith("icache-sync") for name in worker_threads())
 
 
 # ========== ТЕСТ АСИНХРОННОЙ ФУНКЦИИ ==========
@@ -127,6 +181,187 @@ async def test_cache_clear():
     assert ("clear_cache",) in calls
 
 
+# ========== ТЕСТ ЗАЩИТЫ ОТ STAMPEDE ==========
+
+
+@ICache(unique_name="test_stampede", tags=["stampede_tag"])
+async def slow_func(x):
+    calls.append(("slow_func", x))  # логируем вызов основной функции
+    await asyncio.sleep(0.1)  # имитация долгого запроса в БД
+    return x * 3
+
+
+@IClearCache(unique_name="clear_stampede", tags_delete=["stampede_tag"])
+async def clear_stampede():
+    return True
+
+
+@pytest.mark.asyncio
+async def test_cache_single_flight():
+    calls.clear()
+    await clear_stampede()  # ключ мог остаться от прошлого запуска
+
+    # 50 одновременных промахов по одному ключу
+    results = await asyncio.gather(*(slow_func(7) for _ in range(50)))
+
+    # Проверка: все получили правильный результат
+    assert results == [21] * 50
+
+    # Проверка: функция (запрос в БД) выполнилась только один раз
+    assert calls.count(("slow_func", 7)) == 1
+
+    # Проверка: занятый пул соединений не размыкает предохранитель
+    assert breaker.stats()["state"] == "closed"
+
+
+# ========== ТЕСТ STALE-WHILE-REVALIDATE ==========
+
+swr_value = ["old"]  # что сейчас вернет "БД"
+
+
+@ICache(unique_name="test_swr", tags=["swr_tag"], stale_ttl=30)
+async def swr_func(x):
+    calls.append(("swr_func", x))
+    await asyncio.sleep(0.1)  # имитация долгого запроса в БД
+    return swr_value[0]
+
+
+@IClearCache(unique_name="clear_swr", tags_delete=["swr_tag"])
+async def clear_swr():
+    return True
+
+
+@pytest.mark.asyncio
+async def test_cache_stale_while_revalidate():
+    calls.clear()
+    await clear_swr()
+
+    swr_value[0] = "old"
+    assert await swr_func(1) == "old"
+
+    # Проверка: stale копия бессрочного ключа живет, пока жив ключ
+    client = _AsyncRedisService.client()
+    stale_keys = [
+        key async for key in client.scan_iter(match="icache:test_swr:cache:*:stale")
+    ]
+    assert len(stale_keys) == 1
+    assert await client.ttl(stale_keys[0]) == -1
+
+    swr_value[0] = "new"
+    await clear_swr()  # изменение данных сбрасывает тег
+
+    # ...и после удаления ключа отдается еще stale_ttl секунд
+    assert 0 < await client.ttl(stale_keys[0]) <= 30
+
+    # Проверка: пока один вызов пересчитывает, остальные получают прошлое значение
+    leader = asyncio.create_task(swr_func(1))
+    await asyncio.sleep(0.02)
+    assert await swr_func(1) == "old"
+
+    assert await leader == "new"
+    assert await swr_func(1) == "new"
+    assert calls.count(("swr_func", 1)) == 2
+
+
+# ========== ТЕСТ ГЕНЕРАЦИИ КЛЮЧА ==========
+
+
+async def keyed_func(event_id, jwt_token, limit=20, *, page=1):
+    return event_id
+
+
+@pytest.mark.asyncio
+async def test_cache_key_plan():
+    logger = _LogInfo("test_key")
+    plan = _KeyPlan(
+        logger,
+        "test_key",
+        keyed_func,
+        [IParam(mock_func, "jwt_token"), ICacheWriter(writer_func)],
+        ["event_id", "limit", "page"],
+        _AsyncRedisService(logger),
+    )
+
+    # позиционные, именованные и дефолтные аргументы дают один ключ
+    key = await plan((1, "token"), {})
+    assert key == await plan((), {"event_id": 1, "jwt_token": "token", "limit": 20})
+    assert key != await plan((1, "token"), {"page": 2})
+
+    # IParam получает значение аргумента, а не имя
+    assert ("mock_func", ("token",), {}) in calls
+
+    # ошибки сигнатуры как у обычного вызова
+    with pytest.raises(TypeError):
+        await plan((), {"jwt_token": "token"})
+
+
+# ========== ТЕСТ ПРЕДОХРАНИТЕЛЯ ==========
+
+
+def test_circuit_breaker():
+    breaker = _CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+
+    breaker.failure()
+    assert breaker.allow()  # одна ошибка - еще closed
+
+    breaker.failure()
+    assert not breaker.allow()  # open: Redis не трогаем
+
+    time.sleep(0.06)
+    assert breaker.allow()  # half_open: одна проба
+    assert not breaker.allow()
+
+    assert breaker.success()  # проба прошла - closed
+    assert breaker.allow()
+    assert breaker.stats() == {"state": "closed", "failures": 0, "trips": 1}
+
+
+# ========== ТЕСТ МЕТРИК ==========
+
+
+@pytest.mark.asyncio
+async def test_cache_stats():
+    await clear_stampede()
+    metrics.reset()
+
+    await slow_func(8)  # промах + сохранение
+    await slow_func(8)  # попадание
+
+    counters = metrics.snapshot()["test_stampede"]
+    assert (counters["misses"], counters["saves"], counters["hits"]) == (1, 1, 1)
+
+    summary = await istats.summary()
+    assert summary["names"]["test_stampede"]["keys"] >= 1
+    assert summary["names"]["test_stampede"]["bytes"] > 0
+    assert summary["tags"]["stampede_tag"] >= 1
+
+    # потоковый обход (SCAN) видит тот же ключ
+    assert any(
+        elem.get("key", "").startswith("icache:test_stampede:")
+        for elem in istats.iter_cache()
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_degraded():
+    metrics.reset()
+    metrics.incr("icache:test_degraded:cache:0", "misses")
+
+    for _ in range(_SettingsRedis.BREAKER_FAILURES):
+        breaker.failure()  # Redis "упал": предохранитель открыт
+
+    try:
+        summary = await istats.summary()
+    finally:
+        breaker.success()
+
+    # Проверка: без Redis отдаются счетчики воркера, а не ошибка
+    assert summary["degraded"] is True
+    assert summary["breaker"]["state"] == "open"
+    assert summary["names"]["test_degraded"]["misses"] == 1
+    assert summary["tags"] == {}
+
+
 # import asyncio
 # import sys
 # from pathlib import Path
@@ -0,0 +1,49 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from backend.core_service.app.infrastructure.cache.codecs import (
+    CacheDecodeError,
+    CacheSerializer,
+    JsonCodec,
+)
+
+# Значение с апострофом ломало старый формат str(dict) + replace("'", '"')
+EVENTS = [
+    {
+        "id": 1,
+        "title": "Rock'n'Roll вечеринка",
+        "description": "Don't miss it",
+        "datetime": "2025-06-01T18:00:00+00:00",
+    }
+]
+
+
+@pytest.mark.parametrize(
+    "serializer",
+    [CacheSerializer(), CacheSerializer(JsonCodec())],
+    ids=["orjson", "json"],
+)
+def test_roundtrip_with_apostrophes(serializer):
+    """Значения с апострофами переживают запись/чтение"""
+    assert serializer.loads(serializer.dumps(EVENTS)) == EVENTS
+
+
+def test_read_value_written_by_other_codec():
+    """Смена кодека не требует чистки Redis: заголовок определяет кодек"""
+    old_value = CacheSerializer(JsonCodec()).dumps(EVENTS)
+    assert CacheSerializer().loads(old_value) == EVENTS
+
+
+@pytest.mark.parametrize(
+    "value",
+    [b"", str(EVENTS).encode(), b"20", b"\xff\x00"],
+    ids=["Пустое", "Старый формат", "Старый формат (число)", "Неизвестный кодек"],
+)
+def test_bad_values_raise_decode_error(value):
+    """Битое/старое значение - это промах кеша, а не падение"""
+    with pytest.raises(CacheDecodeError):
+        CacheSerializer().loads(value)
@@ -0,0 +1,56 @@
+from pathlib import Path
+import sys
+import time
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from backend.core_service.app.infrastructure.cache.local import LocalCache
+
+
+def make_cache(max_bytes: int = 100) -> LocalCache:
+    cache = LocalCache(max_bytes)
+    cache.active = True  # обычно выставляет слушатель pub/sub
+    return cache
+
+
+def test_inactive_cache_is_bypassed():
+    """Без подписки на инвалидации L1 ничего не хранит и не отдает"""
+    cache = LocalCache(100)
+    cache.set("a", b"1", [], ttl=10)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction_by_bytes():
+    """При превышении бюджета вытесняется давно не использованная запись"""
+    cache = make_cache(max_bytes=10)
+    cache.set("a", b"aaaa", [], ttl=10)
+    cache.set("b", b"bbbb", [], ttl=10)
+    assert cache.get("a") == b"aaaa"  # "a" становится свежей
+
+    cache.set("c", b"cccc", [], ttl=10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.stats()["bytes"] == 8
+
+
+def test_ttl_expiration():
+    cache = make_cache()
+    cache.set("a", b"1", [], ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+
+
+def test_invalidate_tags_and_keys():
+    cache = make_cache()
+    cache.set("a", b"1", ["events"], ttl=10)
+    cache.set("b", b"2", ["events", "types"], ttl=10)
+    cache.set("c", b"3", ["types"], ttl=10)
+
+    cache.invalidate_tags(["events"])
+    assert cache.get("a") is None and cache.get("b") is None
+    assert cache.get("c") == b"3"
+
+    cache.invalidate_keys(["c"])
+    assert len(cache) == 0 and cache.stats()["bytes"] == 0
@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sys
+
+import pytest
+import pytest_asyncio
+
+sys.path.append(str(Path(__file__).parent.parent / "backend" / "core_service" / "app"))
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.exceptions import ValidationError
+from models.models import Accounts, Events
+from models.session import DBBaseModel, create_engine_from_url
+from schemas import EventsFilterDTO, EventsSearchDTO
+from security.jwt import create_access_token
+from services.event.services import ManagementEvents
+
+EVENTS = 25
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path):
+    engine = create_engine_from_url(f"sqlite:///{tmp_path / 'events.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(DBBaseModel.metadata.create_all)
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        user = Accounts(name="creator", login="creator@example.com", password_hash="")
+        session.add_all(
+            Events(
+                creator=user,
+                status="опубликовано" if number % 2 else "черновик",
+                category="Концерт",
+                title=f"Мероприятие {number}",
+                description="Описание",
+                address="Адрес",
+                # по 5 мероприятий на одну дату: порядок внутри даты держит id
+                datetime=START + timedelta(days=number // 5),
+            )
+            for number in range(EVENTS)
+        )
+        await session.commit()
+        yield session
+
+    await engine.dispose()
+
+
+async def all_pages(db, **filters) -> list[str]:
+    service = ManagementEvents(db)
+    jwt_token = await create_access_token(1)
+
+    titles, cursor = [], None
+    while True:
+        page = await service.all_events(
+            jwt_token, EventsFilterDTO(limit=4, cursor=cursor, **filters)
+        )
+        assert len(page.items) <= 4
+        titles += [event.title for event in page.items]
+        if (cursor := page.next_cursor) is None:
+            return titles
+
+
+@pytest.mark.asyncio
+async def test_events_pages_cover_all_once(db):
+    titles = await all_pages(db)
+
+    # все мероприятия ровно по разу, новые первыми
+    assert titles == [f"Мероприятие {number}" for number in reversed(range(EVENTS))]
+
+
+@pytest.mark.asyncio
+async def test_events_pages_filters(db):
+    titles = await all_pages(
+        db,
+        status="опубликовано",
+        date_from=START + timedelta(days=1),
+        date_to=START + timedelta(days=3),
+    )
+
+    assert titles == [f"Мероприятие {number}" for number in (13, 11, 9, 7, 5)]
+
+
+@pytest.mark.asyncio
+async def test_events_bad_cursor(db):
+    with pytest.raises(ValidationError):
+        await ManagementEvents(db).all_events(
+            await create_access_token(1), EventsFilterDTO(cursor="мусор")
+        )
+
+
+@pytest.mark.asyncio
+async def test_events_search(db):
+    db.add_all(
+        [
+            Events(
+                creator_id=1,
+                status="опубликовано",
+                category="Концерт",
+                title="Джазовый вечер",
+                description="Концерты живой музыки каждую пятницу",
+                address="Парк Горького",
+            ),
+            Events(
+                creator_id=1,
+                status="опубликовано",
+                category="Концерт",
+                title="Концерт симфонического оркестра",
+                description="Большой зал филармонии",
+                address="Ул. Штурманская, д. 30",
+            ),
+        ]
+    )
+    await db.commit()
+
+    service = ManagementEvents(db)
+    jwt_token = await create_access_token(1)
+
+    async def search(text: str) -> list[str]:
+        page = await service.search_events(jwt_token, EventsSearchDTO(q=text))
+        return [event.title for event in page.items]
+
+    # словоформа находит оба, совпадение в названии выше совпадения в описании
+    assert await search("концертов") == [
+        "Концерт симфонического оркестра",
+        "Джазовый вечер",
+    ]
+    assert await search("парке джазовом") == ["Джазовый вечер"]
+    assert await search("OR NEAR(*)") == []
+
+    # триггеры держат индекс в синхронизации с events
+    event = await db.scalar(select(Events).where(Events.title == "Джазовый вечер"))
+    event.title = "Блюзовый вечер"
+    await db.commit()
+    assert await search("джаз") == []
+    assert await search("блюз") == ["Блюзовый вечер"]
+
+    await db.delete(event)
+    await db.commit()
+    assert await search("блюз") == []
@@ -0,0 +1,92 @@
+import asyncio
+from pathlib import Path
+import sys
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as redis
+
+sys.path.append(str(Path(__file__).parent.parent / "backend" / "core_service" / "app"))
+
+from core.exceptions import TicketLimitError
+from infrastructure.reservations.holds import TicketHolds
+from models.crud import create_tickets_event_bulk
+from security.hmac import generate_ticket_code
+from security.jwt import create_access_token
+from services.tickets.services import ManagementTickets
+from tests.test_inventory import (  # noqa: F401 (фикстура)
+    TOTAL_COUNT,
+    create_ticket_type,
+    session_factory,
+)
+
+TICKET_TYPE_ID = 987_654  # тип, которого нет в реальных данных
+
+
+@pytest_asyncio.fixture
+async def client():
+    client = redis.Redis(decode_responses=True)
+
+    yield client
+
+    await client.aclose()
+
+
+@pytest_asyncio.fixture
+async def holds(client):
+    await client.delete(f"hold:held:{TICKET_TYPE_ID}")
+
+    return TicketHolds(client, ttl=0.2)
+
+
+@pytest.mark.asyncio
+async def test_hold_limits_and_claim(holds):
+    hold = await holds.hold(1, 1, TICKET_TYPE_ID, 3, remaining=4)
+    assert hold is not None
+
+    # Проверка: занятые бронью места не бронируются повторно
+    assert await holds.hold(2, 1, TICKET_TYPE_ID, 2, remaining=4) is None
+    assert await holds.held([TICKET_TYPE_ID]) == {TICKET_TYPE_ID: 3}
+
+    # Проверка: чужую бронь снять нельзя, своя снимается один раз
+    assert await holds.claim(hold.hold_id, 2) == "forbidden"
+    assert (await holds.claim(hold.hold_id, 1)).count == 3
+    assert await holds.claim(hold.hold_id, 1) == "missing"
+    assert await holds.held([TICKET_TYPE_ID]) == {TICKET_TYPE_ID: 0}
+
+
+@pytest.mark.asyncio
+async def test_expired_hold_returns_seats(holds):
+    hold = await holds.hold(1, 1, TICKET_TYPE_ID, 4, remaining=4)
+    await asyncio.sleep(0.3)
+
+    assert await holds.claim(hold.hold_id, 1) == "missing"
+    assert await holds.reap() >= 1
+    assert await holds.held([TICKET_TYPE_ID]) == {TICKET_TYPE_ID: 0}
+
+
+@pytest.mark.asyncio
+async def test_failed_confirm_keeps_hold(client, session_factory):
+    user_id, event_id, ticket_type_id = await create_ticket_type(session_factory)
+    await client.delete(f"hold:held:{ticket_type_id}")
+    holds = TicketHolds(client, ttl=30)
+    jwt_token = await create_access_token(user_id)
+
+    hold = await holds.hold(user_id, event_id, ticket_type_id, 3, TOTAL_COUNT)
+    async with session_factory() as db:
+        # места раскуплены мимо брони: подтверждение упадет в БД
+        await create_tickets_event_bulk(
+            db,
+            event_id,
+            user_id,
+            {ticket_type_id: TOTAL_COUNT - 2},
+            generate_ticket_code,
+        )
+
+        with pytest.raises(TicketLimitError):
+            await ManagementTickets(db).confirm_hold(hold.hold_id, jwt_token, holds)
+
+    # Проверка: бронь пережила неудачную покупку и подтверждается снова
+    assert await holds.held([ticket_type_id]) == {ticket_type_id: 3}
+    assert (await holds.begin_confirm(hold.hold_id, user_id)).count == 3
+    assert await holds.begin_confirm(hold.hold_id, user_id) == "missing"
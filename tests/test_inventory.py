@@ -0,0 +1,329 @@
+import asyncio
+from pathlib import Path
+import sys
+
+import pytest
+import pytest_asyncio
+
+sys.path.append(str(Path(__file__).parent.parent / "backend" / "core_service" / "app"))
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.exceptions import ForbiddenError, TicketLimitError, ValidationError
+from infrastructure.messaging.outbox import relay_outbox
+from models.crud import (
+    claim_outbox_batch,
+    create_ticket_event,
+    create_tickets_event_bulk,
+    db_activate_qr_code,
+    db_activate_qr_codes,
+    db_all_active_tickets_event,
+    db_all_tickets_event,
+    delete_data,
+    reconcile_ticket_stats,
+    stream_event_manifest,
+)
+from models.models import Accounts, Events, Outbox, Tickets, TicketTypes
+from models.session import DBBaseModel, create_engine_from_url
+from security.hmac import generate_ticket_code
+
+TOTAL_COUNT = 100  # билетов в продаже
+BUYERS = 2_000  # одновременных покупок
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_engine_from_url(f"sqlite:///{tmp_path / 'inventory.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(DBBaseModel.metadata.create_all)
+
+    yield async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+async def create_ticket_type(session_factory) -> tuple[int, int, int]:
+    async with session_factory() as db:
+        user = Accounts(name="buyer", login="buyer@example.com", password_hash="hash")
+        event = Events(
+            creator=user,
+            status="опубликовано",
+            category="Концерт",
+            title="Концерт",
+            description="Описание",
+            address="Адрес",
+        )
+        ticket_type = TicketTypes(
+            event=event, type="Vip", description="", price=100, total_count=TOTAL_COUNT
+        )
+        db.add(ticket_type)
+        await db.commit()
+        return user.id, event.id, ticket_type.id
+
+
+@pytest.mark.asyncio
+async def test_concurrent_purchases_no_oversell(session_factory):
+    user_id, event_id, ticket_type_id = await create_ticket_type(session_factory)
+
+    async def buy(number: int) -> bool:
+        async with session_factory() as db:
+            try:
+                await create_ticket_event(
+                    db, event_id, user_id, ticket_type_id, generate_ticket_code
+                )
+            except TicketLimitError:
+                return False
+            return True
+
+    results = await asyncio.gather(*(buy(number) for number in range(BUYERS)))
+
+    # Проверка: продано ровно столько, сколько было, остальным отказ
+    assert results.count(True) == TOTAL_COUNT
+
+    async with session_factory() as db:
+        sold = await db.scalar(select(func.count(Tickets.id)))
+        ticket_type = await db.get(TicketTypes, ticket_type_id)
+
+    assert sold == ticket_type.sold_count == TOTAL_COUNT
+
+
+@pytest.mark.asyncio
+async def test_deleted_ticket_returns_to_sale(session_factory):
+    user_id, event_id, ticket_type_id = await create_ticket_type(session_factory)
+
+    async with session_factory() as db:
+        ticket = await create_ticket_event(
+            db, event_id, user_id, ticket_type_id, generate_ticket_code
+        )
+        await delete_data(db, "Tickets", ticket.id, user_id)
+
+        ticket_type = await db.get(TicketTypes, ticket_type_id)
+        await db.refresh(ticket_type)
+
+    assert ticket_type.sold_count == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_purchase_all_or_nothing(session_factory):
+    user_id, event_id, ticket_type_id = await create_ticket_type(session_factory)
+
+    async with session_factory() as db:
+        result = await create_tickets_event_bulk(
+            db, event_id, user_id, {ticket_type_id: 3}, generate_ticket_code
+        )
+        assert len(result["tickets"]) == 3
+        assert result["by_type"] == {"Vip": 3}
+
+        # не хватает одного билета - не покупается ни один
+        with pytest.raises(TicketLimitError):
+            await create_tickets_event_bulk(
+                db,
+                event_id,
+                user_id,
+                {ticket_type_id: TOTAL_COUNT - 2},
+                generate_ticket_code,
+            )
+
+        sold = await db.scalar(select(func.count(Tickets.id)))
+        ticket_type = await db.get(TicketTypes, ticket_type_id)
+        await db.refresh(ticket_type)
+
+    assert sold == ticket_type.sold_count == 3
+
+
+@pytest.mark.asyncio
+async def test_tickets_stats_by_type(session_factory):
+    user_id, event_id, ticket_type_id = await create_ticket_type(session_factory)
+
+    async with session_factory() as db:
+        result = await create_tickets_event_bulk(
+            db, event_id, user_id, {ticket_type_id: 3}, generate_ticket_code
+        )
+        ticket_id, code = result["tickets"][0].id, result["tickets"][0].unique_code
+
+        assert (await db_activate_qr_code(db, user_id, code))["activate"]
+        assert not (await db_activate_qr_code(db, user_id, code))["activate"]
+
+        assert await db_all_tickets_event(db, event_id) == ({"Vip": 3}, 3)
+        assert await db_all_active_tickets_event(db, event_id) == ({"Vip": 1}, 1)
+        assert await db_all_tickets_event(db, event_id + 1) == ({}, 0)
+
+        # удаление активированного билета уменьшает оба счетчика
+        await delete_data(db, "Tickets", ticket_id, user_id)
+        assert await db_all_tickets_event(db, event_id) == ({"Vip": 2}, 2)
+        assert await db_all_active_tickets_event(db, event_id) == ({}, 0)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_ticket_stats(session_factory):
+    user_id, event_id, ticket_type_id = await create_ticket_type(session_factory)
+
+    async with session_factory() as db:
+        await create_tickets_event_bulk(
+            db, event_id, user_id, {ticket_type_id: 2}, generate_ticket_code
+        )
+        assert await reconcile_ticket_stats(db) == []
+
+        # счетчики разошлись с таблицей (ручная правка БД)
+        await db.execute(
+            update(TicketTypes).values(sold_count=TicketTypes.sold_count + 5)
+        )
+        await db.commit()
+
+        fixed = await reconcile_ticket_stats(db)
+        assert [(elem["sold_count"], elem["sold"]) for elem in fixed] == [(7, 2)]
+        assert await db_all_tickets_event(db, event_id) == ({"Vip": 2}, 2)
+
+
+@pytest.mark.asyncio
+async def test_scan_batch_and_manifest(session_factory):
+    user_id, event_id, ticket_type_id = await create_ticket_type(session_factory)
+
+    async with session_factory() as db:
+        result = await create_tickets_event_bulk(
+            db, event_id, user_id, {ticket_type_id: 3}, generate_ticket_code
+        )
+        first, second, third = (ticket.unique_code for ticket in result["tickets"])
+        assert (await db_activate_qr_code(db, user_id, first))["activate"]
+
+        result = await db_activate_qr_codes(db, event_id, [first, second, "missing"])
+        assert result == {
+            "activated": [second],
+            "used": [first],
+            "unknown": ["missing"],
+        }
+        assert await db_all_active_tickets_event(db, event_id) == ({"Vip": 2}, 2)
+
+    rows = [
+        row
+        async for chunk in stream_event_manifest(session_factory, event_id, 2)
+        for row in chunk
+    ]
+    assert sorted((code, used) for _, _, code, used in rows) == sorted(
+        [(first, True), (second, True), (third, False)]
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_activation(session_factory):
+    user_id, event_id, ticket_type_id = await create_ticket_type(session_factory)
+
+    async with session_factory() as db:
+        ticket = await create_ticket_event(
+            db, event_id, user_id, ticket_type_id, generate_ticket_code
+        )
+        code = ticket.unique_code
+
+    def notify(activation):
+        return {"queue": "emails", "body": {"to": activation["login"]}}
+
+    async def scan() -> bool:
+        async with session_factory() as db:
+            return (await db_activate_qr_code(db, user_id, code, notify))["activate"]
+
+    # Проверка: из одновременных сканов один билет активирует ровно один
+    results = await asyncio.gather(*(scan() for _ in range(20)))
+    assert results.count(True) == 1
+
+    async with session_factory() as db:
+        with pytest.raises(ForbiddenError):
+            await db_activate_qr_code(db, user_id + 1, code)
+        with pytest.raises(ValidationError):
+            await db_activate_qr_code(db, user_id, "missing")
+
+        assert await db_all_active_tickets_event(db, event_id) == ({"Vip": 1}, 1)
+        # письмо - одно, адресат подгружен после успешной активации
+        assert list(await db.scalars(select(Outbox.body))) == [
+            '{"to": "buyer@example.com"}'
+        ]
+
+
+class Broker:
+    """Брокер, подтверждающий все (или только нечетные) сообщения"""
+
+    def __init__(self, odd_only: bool = False):
+        self.odd_only = odd_only
+        self.published: list[tuple[str, bytes, str]] = []
+
+    async def publish_confirmed(self, messages):
+        self.published.extend(messages)
+        await asyncio.sleep(0.01)  # ожидание подтверждений
+        return [
+            message_id
+            for _, _, message_id in messages
+            if not self.odd_only or int(message_id) % 2
+        ]
+
+
+@pytest.mark.asyncio
+async def test_outbox_written_with_purchase(session_factory):
+    user_id, event_id, ticket_type_id = await create_ticket_type(session_factory)
+
+    def notify(result):
+        return {"queue": "emails", "body": {"tickets": len(result["tickets"])}}
+
+    async with session_factory() as db:
+        for count in (1, 2, 3):
+            await create_tickets_event_bulk(
+                db,
+                event_id,
+                user_id,
+                {ticket_type_id: count},
+                generate_ticket_code,
+                notify=notify,
+            )
+
+        # Проверка: неудачная покупка не оставляет сообщения
+        with pytest.raises(TicketLimitError):
+            await create_tickets_event_bulk(
+                db,
+                event_id,
+                user_id,
+                {ticket_type_id: TOTAL_COUNT},
+                generate_ticket_code,
+                notify=notify,
+            )
+
+        assert await db.scalar(select(func.count(Outbox.id))) == 3
+
+    broker = Broker(odd_only=True)
+    assert await relay_outbox(session_factory, broker, 10, lease=30) == 2
+    assert [body for _, body, _ in broker.published] == [
+        b'{"tickets": 1}',
+        b'{"tickets": 2}',
+        b'{"tickets": 3}',
+    ]
+
+    # неподтвержденное сообщение остается, но до конца аренды не захватывается
+    assert await relay_outbox(session_factory, broker, 10, lease=30) == 0
+    async with session_factory() as db:
+        assert list(await db.scalars(select(Outbox.body))) == ['{"tickets": 2}']
+        await db.execute(update(Outbox).values(claimed_until=None))
+        await db.commit()
+
+        assert [message.body for message in await claim_outbox_batch(db, 10, 30)] == [
+            '{"tickets": 2}'
+        ]
+
+
+async def db_outbox_count(session_factory) -> int:
+    async with session_factory() as db:
+        return await db.scalar(select(func.count(Outbox.id)))
+
+
+@pytest.mark.asyncio
+async def test_outbox_relays_do_not_duplicate(session_factory):
+    async with session_factory() as db:
+        db.add_all(Outbox(queue="emails", body=str(i)) for i in range(100))
+        await db.commit()
+
+    # Проверка: релеи нескольких воркеров не отправляют сообщение дважды
+    broker = Broker()
+    while await db_outbox_count(session_factory):
+        await asyncio.gather(
+            *(relay_outbox(session_factory, broker, 7, lease=30) for _ in range(8))
+        )
+
+    bodies = [body for _, body, _ in broker.published]
+    assert sorted(bodies, key=int) == [str(i).encode() for i in range(100)]
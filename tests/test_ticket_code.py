@@ -0,0 +1,78 @@
+import base64
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent / "backend" / "core_service" / "app"))
+
+from infrastructure.prefilter.ticket_codes import BloomFilter
+from security.hmac import (
+    TICKET_CODE_VERSION,
+    TicketCode,
+    generate_ticket_code,
+    is_legacy_ticket_code,
+    verify_ticket_code,
+)
+
+
+def test_ticket_code_roundtrip():
+    code = generate_ticket_code(123, 45, 6)
+
+    assert verify_ticket_code(code) == TicketCode(123, 45, 6, TICKET_CODE_VERSION)
+    assert verify_ticket_code(code, event_id=45) is not None
+
+    # Проверка: код влезает в alphanumeric режим QR
+    assert set(code) <= set("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:")
+
+
+def test_ticket_code_wrong_event():
+    code = generate_ticket_code(123, 45, 6)
+
+    assert verify_ticket_code(code, event_id=46) is None
+
+
+@pytest.mark.parametrize("position", [0, 10, 30, -1])
+def test_ticket_code_forged(position):
+    code = generate_ticket_code(123, 45, 6)
+    raw = bytearray(base64.b32decode(code[4:] + "=" * (-len(code[4:]) % 8)))
+    raw[position] ^= 1  # один бит в данных или подписи
+    forged = "TKT." + base64.b32encode(bytes(raw)).decode().rstrip("=")
+
+    assert verify_ticket_code(forged) is None
+
+
+@pytest.mark.parametrize(
+    "code", ["", "TKT.", "TKT.!!!", "TKT.AAAA", "tkt.AAAA", "TKT.0123.4567"]
+)
+def test_ticket_code_garbage(code):
+    assert verify_ticket_code(code) is None
+
+
+def test_legacy_ticket_code():
+    assert is_legacy_ticket_code("TKT.0123456789abcdef.0123456789abcdef")
+    assert not is_legacy_ticket_code(generate_ticket_code(1, 1, 1))
+    assert not is_legacy_ticket_code("TKT.0123.4567")
+
+
+def test_bloom_filter():
+    codes = [f"TKT.{number:016x}.{number:016x}" for number in range(10_000)]
+    code_filter = BloomFilter(len(codes), 0.01)
+    for code in codes:
+        code_filter.add(code)
+
+    # Проверка: выданные коды проходят всегда
+    assert all(code_filter.might_contain(code) for code in codes)
+
+    # Проверка: доля ложных срабатываний около заданной
+    passed = sum(
+        code_filter.might_contain(f"TKT.{number:016x}.{0:016x}")
+        for number in range(10_000, 30_000)
+    )
+    assert passed / 20_000 < 0.02
+
+    stats = code_filter.stats()
+    assert stats["items"] == 10_000
+    assert stats["rejected"] == 20_000 - passed
+    assert 0.005 < stats["expected_fp_rate"] < 0.015
+    assert stats["bytes"] < 15_000  # ~9.6 бит на код
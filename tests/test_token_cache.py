@@ -0,0 +1,60 @@
+from pathlib import Path
+import sys
+import time
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from backend.core_service.app.security.token_cache import (
+    VerifiedTokenCache,
+    request_token_scope,
+    request_tokens,
+)
+
+
+def test_token_cache_hit():
+    cache = VerifiedTokenCache(max_size=10, ttl=60)
+    digest = cache.digest("token")
+
+    assert cache.get(digest) is None
+    cache.set(digest, 42, exp=time.time() + 60)
+    assert cache.get(digest) == 42
+
+
+def test_token_cache_honours_exp():
+    cache = VerifiedTokenCache(max_size=10, ttl=60)
+    digest = cache.digest("token")
+
+    # токен уже истек - запись не отдается, даже если ttl кеша больше
+    cache.set(digest, 42, exp=time.time() - 1)
+    assert cache.get(digest) is None
+    assert len(cache) == 0
+
+
+def test_token_cache_lru_bound():
+    cache = VerifiedTokenCache(max_size=2, ttl=60)
+    first, second, third = (cache.digest(elem) for elem in ("a", "b", "c"))
+
+    cache.set(first, 1)
+    cache.set(second, 2)
+    cache.get(first)  # first становится свежим
+    cache.set(third, 3)
+
+    assert cache.get(second) is None
+    assert (cache.get(first), cache.get(third)) == (1, 3)
+
+
+def test_token_cache_invalid_args():
+    with pytest.raises(ValueError):
+        VerifiedTokenCache(max_size=0, ttl=60)
+
+
+def test_request_token_scope():
+    assert request_tokens() is None
+
+    with request_token_scope():
+        request_tokens()["token"] = 42
+        assert request_tokens() == {"token": 42}
+
+    assert request_tokens() is None
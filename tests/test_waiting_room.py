@@ -0,0 +1,79 @@
+import asyncio
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent / "backend" / "core_service" / "app"))
+
+from core.exceptions import QueueTokenError
+from infrastructure.admission.store import MemoryAdmissionStore
+from security.queue_token import create_queue_token, read_queue_token
+from services.waiting_room.services import ManagementWaitingRoom
+
+EVENT_ID = 1
+
+
+def test_queue_token():
+    token = create_queue_token(EVENT_ID, 7, "7")
+    assert read_queue_token(token) == (EVENT_ID, 7, "7")
+
+    # подделка и мусор не читаются
+    assert read_queue_token(token[:-2] + "xx") is None
+    assert read_queue_token("мусор") is None
+    assert read_queue_token(None) is None
+
+
+@pytest.mark.asyncio
+async def test_disabled_queue_admits_everyone():
+    store = MemoryAdmissionStore(window=60)
+
+    assert await store.advance(EVENT_ID, "1", join=True) is None
+
+
+@pytest.mark.asyncio
+async def test_admission_rate():
+    store = MemoryAdmissionStore(window=60)
+    await store.configure(EVENT_ID, rate=20, burst=2)
+
+    states = [await store.advance(EVENT_ID, str(i), join=True) for i in range(5)]
+
+    # запас пускает первых двух, остальные ждут по порядку
+    assert [state.admitted for state in states] == [True, True, False, False, False]
+    assert [state.position for state in states[2:]] == [1, 2, 3]
+    assert 0 < states[4].eta_seconds <= 3 / 20
+
+    # повторный вход место не сбрасывает
+    assert (await store.advance(EVENT_ID, "4", join=True)).position == 3
+
+    # за 0.1 сек при 20/сек набегает еще 2 пропуска
+    await asyncio.sleep(0.1)
+    assert (await store.advance(EVENT_ID, "2", join=False)).admitted
+    assert (await store.advance(EVENT_ID, "3", join=False)).admitted
+    assert (await store.advance(EVENT_ID, "4", join=False)).position == 1
+
+
+@pytest.mark.asyncio
+async def test_admission_window_expires():
+    store = MemoryAdmissionStore(window=0.05)
+    await store.configure(EVENT_ID, rate=1, burst=1)
+
+    assert (await store.advance(EVENT_ID, "1", join=True)).admitted
+
+    await asyncio.sleep(0.06)
+    state = await store.advance(EVENT_ID, "1", join=False)
+    assert (state.admitted, state.position) == (False, -1)
+
+
+@pytest.mark.asyncio
+async def test_status_checks_event():
+    service = ManagementWaitingRoom()
+    store = MemoryAdmissionStore(window=60)
+    await store.configure(EVENT_ID, rate=1, burst=1)
+
+    token = create_queue_token(EVENT_ID, 7, "7")
+    await store.advance(EVENT_ID, "7", join=True)
+    assert (await service.status(EVENT_ID, token, store)).admitted
+
+    with pytest.raises(QueueTokenError):
+        await service.status(EVENT_ID + 1, token, store)